@@ -13,8 +13,9 @@ from interview_app.resume_parser import parse_resume
 from interview_app.question_maker import InterviewQuestionMaker
 from interview_app.audio_recorder import AudioRecorder
 from interview_app.config import AudioConfig, VideoConfig, STTConfig
-from interview_app.stt import STTClient
-from interview_app.evaluation import evaluate_and_save_responses
+from interview_app.stt import STTClient, StreamingTranscriber
+from interview_app.triage import STT_ERROR_PLACEHOLDER
+from interview_app.evaluation import evaluate_and_save_responses, InterviewEvaluator
 from pose_detection import analyze_video
 from interview_app.video_recorder import VideoRecorder
 
@@ -30,6 +31,7 @@ class App(tk.Tk):
         self.responses = []
         self.video_path = ""
         self.audio_files = []   # 답변별 오디오 파일 리스트
+        self.evaluator = None   # 면접 중 답변을 바로 평가하는 InterviewEvaluator
 
         self.frames = {}
         for F in (StartPage, QuestionGenPage, InterviewPage, EvaluationPage):
@@ -125,6 +127,8 @@ class InterviewPage(tk.Frame):
         self.answers = []
         self.audio_files = []
         self.interview_running = True
+        # 답변이 인식될 때마다 바로 평가를 시작 (면접이 끝날 때쯤 대부분의 평가가 끝나 있음)
+        self.master.evaluator = InterviewEvaluator(stt_client=self.stt_client)
 
         # 비디오 녹화 시작
         video_config = VideoConfig()
@@ -174,7 +178,9 @@ class InterviewPage(tk.Frame):
         # 개선된 오디오 설정 사용
         config = AudioConfig()
         config.vad_timeout_sec = 3.0
-        self.audio_recorder = AudioRecorder(config)
+        # 녹음 중 말소리 구간을 바로 STT로 넘김
+        transcriber = StreamingTranscriber(self.stt_client)
+        self.audio_recorder = AudioRecorder(config, on_speech_chunk=transcriber.submit)
 
         audio_file = f"response_{self.q_idx+1}.wav"
         self.audio_recorder.record_start()
@@ -187,6 +193,7 @@ class InterviewPage(tk.Frame):
                 self.audio_recorder.recording = False
             except Exception:
                 pass
+            transcriber.cancel()
             return
 
         self.audio_recorder.record_stop(denoise_value=0, output_file=audio_file)
@@ -196,9 +203,13 @@ class InterviewPage(tk.Frame):
         self.status_label.config(text="음성 인식(STT) 중...")
         self.status_label.update()
         
-        # STT 처리
+        # STT 처리 (녹음 중 인식한 결과를 마무리, 실패 시 전체 파일로 재인식)
+        word_timestamps = None
         try:
-            text = self.stt_client.get_text(audio_file)
+            word_timestamps = transcriber.finish()
+            if word_timestamps is None:
+                word_timestamps = self.stt_client.transcribe(audio_file)
+            text = " ".join(item["word"] for item in word_timestamps)
             self.stt_result.set(text)
             self.answers.append(text)
             print(f"✅ 답변 인식됨: {text[:50]}...")
@@ -206,7 +217,12 @@ class InterviewPage(tk.Frame):
         except Exception as e:
             print(f"❌ STT 처리 중 오류: {e}")
             self.stt_result.set("음성 인식 중 오류가 발생했습니다.")
-            self.answers.append("음성 인식 오류")
+            self.answers.append(STT_ERROR_PLACEHOLDER)
+            word_timestamps = None
+
+        evaluator = getattr(self.master, "evaluator", None)
+        if evaluator is not None:
+            evaluator.submit(self.master.questions[self.q_idx], self.answers[-1], audio_file, word_timestamps)
         
         # 종료 키워드 검사
         if len(self.answers) > 0 and "그만하겠습니다" in self.answers[-1]:
@@ -269,6 +285,9 @@ class EvaluationPage(tk.Frame):
         self.result_box = scrolledtext.ScrolledText(self, height=16, width=110, font=("Arial", 12))
         self.result_box.pack(pady=8)
         tk.Button(self, text="평가/피드백 보기", font=("Arial", 13), command=self.show_feedback).pack(pady=6)
+        self.recommend_btn = tk.Button(self, text="추천 답변 보기", font=("Arial", 13), command=self.show_recommended_answers)
+        self.recommend_btn.pack(pady=3)
+        self.eval_results = []
         tk.Button(self, text="처음으로", font=("Arial", 13), command=lambda: master.show_frame(StartPage)).pack(pady=3)
 
     def tkraise(self, *args, **kwargs):
@@ -333,14 +352,22 @@ class EvaluationPage(tk.Frame):
             pose_desc = f"[자세 피드백 오류] 영상 분석 중 오류 발생: {e}\n"
         self.pose_text.insert(tk.END, pose_desc)
 
-        # 답변 평가
+        # 답변 평가 (면접 중 시작된 평가가 있으면 마무리만, 없으면 전체 평가)
         from interview_app.evaluation import evaluate_and_save_responses
+        evaluator = getattr(self.master, "evaluator", None)
+        self.master.evaluator = None
         try:
-            eval_results = evaluate_and_save_responses(
-                self.master.questions,
-                self.master.responses,
-                self.master.audio_files
-            )
+            if evaluator is not None:
+                try:
+                    eval_results = evaluator.finish("interview_evaluation.txt")
+                finally:
+                    evaluator.close()
+            else:
+                eval_results = evaluate_and_save_responses(
+                    self.master.questions,
+                    self.master.responses,
+                    self.master.audio_files
+                )
         except Exception as e:
             self.result_box.insert(tk.END, f"[답변 평가 오류] 평가 중 오류 발생: {e}\n")
             return
@@ -348,6 +375,7 @@ class EvaluationPage(tk.Frame):
         if not eval_results:
             self.result_box.insert(tk.END, "[답변 평가 실패] 평가 결과가 없습니다.\n")
             return
+        self.eval_results = eval_results
 
         self.result_box.insert(tk.END, "[답변 평가 및 추천 답변]\n")
         for i, result in enumerate(eval_results, 1):
@@ -359,9 +387,35 @@ class EvaluationPage(tk.Frame):
                 rating = sec.get("rating", "-")
                 comment = sec.get("comment", "-")
                 self.result_box.insert(tk.END, f"  [{k}] {rating} - {comment}\n")
-            self.result_box.insert(tk.END, f"추천 답변: {result.get('recommended_answer','')}\n")
+            if result.get("recommended_answer"):
+                self.result_box.insert(tk.END, f"추천 답변: {result.get('recommended_answer','')}\n")
             self.result_box.insert(tk.END, f"총 답변 시간: {result.get('total_response_time','')}초, 침묵 시간: {result.get('silence_duration','')}초\n")
 
+    def show_recommended_answers(self):
+        # 추천 답변은 평가와 별도로 요청 시 생성 (생성 중 화면이 멈추지 않도록 백그라운드 실행)
+        if not self.eval_results:
+            messagebox.showinfo("평가 결과 없음", "먼저 '평가/피드백 보기'로 답변을 평가하세요.")
+            return
+        self.recommend_btn.config(state=tk.DISABLED)
+        self.result_box.insert(tk.END, "\n[추천 답변]\n")
+        threading.Thread(target=self._generate_recommended_answers, daemon=True).start()
+
+    def _generate_recommended_answers(self):
+        from interview_app.evaluation import RECOMMENDED_ANSWER_ERROR, generate_recommended_answer
+        try:
+            for i, result in enumerate(self.eval_results, 1):
+                text = result.get("recommended_answer")
+                if not text or text == RECOMMENDED_ANSWER_ERROR:
+                    text = generate_recommended_answer(result.get("question", ""), result.get("user_answer", ""))
+                    # 실패 안내 문구는 저장하지 않아 다시 누르면 재시도
+                    if text and text != RECOMMENDED_ANSWER_ERROR:
+                        result["recommended_answer"] = text
+                self.after(0, self.result_box.insert, tk.END, f"\nQ{i}. {result.get('question','')}\n추천 답변: {text}\n")
+        except Exception as e:
+            self.after(0, self.result_box.insert, tk.END, f"[추천 답변 오류] 생성 중 오류 발생: {e}\n")
+        finally:
+            self.after(0, lambda: self.recommend_btn.config(state=tk.NORMAL))
+
 
 if __name__ == "__main__":
     app = App()
@@ -11,17 +11,47 @@ from .config import (
     AudioConfig,
     VideoConfig,
     STTConfig,
+    TriageConfig,
+    PromptGovernorConfig,
     CLIConfig,
 )
 from .prompts import PARSER_PROMPT, QUESTION_PROMPT
 from .pdf_utils import extract_text, cleanup_text
-from .llm_client import LLMClient, clean_llm_response
+from .cache import DiskCache
+from .llm_client import (
+    LLMClient,
+    LLMCallMetrics,
+    add_metrics_hook,
+    remove_metrics_hook,
+    clean_llm_response,
+)
+from .cassette import Cassette, CassetteMiss
+from .ollama_stub import OllamaStub, OllamaStubConfig
 from .resume_parser import ResumeJsonParser
 from .question_maker import InterviewQuestionMaker
 from .video_recorder import VideoRecorder
 # from .audio_recorder import AudioRecorder  # 오디오 패키지 의존성 문제로 임시 비활성화
-from .stt import STTClient, calculate_silence_duration, calculate_audio_duration
-from .evaluation import evaluate_and_save_responses
+from .stt import (
+    STTClient,
+    StreamingTranscriber,
+    calculate_silence_duration,
+    calculate_silence_from_speech,
+    calculate_speaking_duration,
+    calculate_audio_duration,
+)
+from .stt_pool import STTWorkerPool, get_stt_pool
+from .evaluation import (
+    evaluate_and_save_responses,
+    InterviewEvaluator,
+    stream_evaluation,
+    generate_recommended_answer,
+    stream_recommended_answer,
+    grade_from_score,
+    govern_evaluation_answer,
+)
+from .rescoring import RatingTable, score_table, grade_scores
+from .triage import TriageResult, triage_answer, PLACEHOLDER_ANSWERS
+from .prompt_governor import GovernedAnswer, govern_answer, estimate_tokens
 # from .interview_flow import (  # 실시간 면접용이라 영상 평가에는 불필요
 #     start_full_interview,
 #     display_questions_with_tts_and_evaluation,
@@ -29,13 +59,16 @@ from .evaluation import evaluate_and_save_responses
 
 __all__ = [
     # Configs
-    "LlamaConfig", "AudioConfig", "VideoConfig", "STTConfig", "CLIConfig",
+    "LlamaConfig", "AudioConfig", "VideoConfig", "STTConfig", "TriageConfig", "PromptGovernorConfig", "CLIConfig",
     # Prompts
     "PARSER_PROMPT", "QUESTION_PROMPT",
     # PDF Utils
     "extract_text", "cleanup_text",
+    # Cache
+    "DiskCache",
     # LLM Client
-    "LLMClient", "clean_llm_response",
+    "LLMClient", "LLMCallMetrics", "add_metrics_hook", "remove_metrics_hook", "clean_llm_response",
+    "Cassette", "CassetteMiss", "OllamaStub", "OllamaStubConfig",
     # Parsers
     "ResumeJsonParser",
     # Question Maker
@@ -43,9 +76,15 @@ __all__ = [
     # Recorders
     "VideoRecorder", # "AudioRecorder",  # 임시 비활성화
     # STT
-    "STTClient", "calculate_silence_duration", "calculate_audio_duration",
+    "STTClient", "StreamingTranscriber", "calculate_silence_duration", "calculate_silence_from_speech",
+    "calculate_speaking_duration", "calculate_audio_duration",
+    "STTWorkerPool", "get_stt_pool",
     # Evaluation
-    "evaluate_and_save_responses",
+    "evaluate_and_save_responses", "InterviewEvaluator", "stream_evaluation",
+    "generate_recommended_answer", "stream_recommended_answer",
+    "grade_from_score", "RatingTable", "score_table", "grade_scores",
+    "TriageResult", "triage_answer", "PLACEHOLDER_ANSWERS",
+    "govern_evaluation_answer", "GovernedAnswer", "govern_answer", "estimate_tokens",
     # Flow (현재 사용 안함)
     # "start_full_interview", "display_questions_with_tts_and_evaluation",
 ]
@@ -2,7 +2,7 @@
 
 import logging
 import wave
-from typing import Optional
+from typing import Callable, Optional
 import noisereduce as nr
 import webrtcvad
 import threading
@@ -26,10 +26,16 @@ class AudioRecorder:
     마이크에서 음성을 듣고, 말소리 시작 후 non_speaking_duration(무음 유지 시간)만큼
     침묵이 지속되면 자동으로 녹음을 멈추는 구현체.
     개선된 음성 품질과 노이즈 제거 기능 포함
+
+    on_speech_chunk(pcm, offset_sec, sample_rate)를 넘기면, 녹음 중에 말소리 뒤로
+    config.stream_pause_ms 이상의 짧은 쉼이 올 때마다 그때까지의 구간(16bit 모노 PCM)을 전달함
+    (예: StreamingTranscriber.submit으로 녹음과 동시에 STT 진행)
     """
 
-    def __init__(self, config: Optional[AudioConfig] = None):
+    def __init__(self, config: Optional[AudioConfig] = None,
+                 on_speech_chunk: Optional[Callable[[bytes, float, int], None]] = None):
         self.config = config or AudioConfig()
+        self.on_speech_chunk = on_speech_chunk
         self.chunk_size = int(self.config.sample_rate * self.config.chunk_duration_ms / 1000)
         self.recognizer = sr.Recognizer()
         
@@ -94,6 +100,9 @@ class AudioRecorder:
         console.print("[bold green]음성 녹음 시작됨.[/bold green]")
         no_voice_target_cnt = self.config.vad_timeout_sec * 1000
         no_voice_cnt = 0
+        # 증분 STT용: 아직 전달하지 않은 구간의 시작 위치와 그 안의 말소리 여부
+        segment_start = 0
+        segment_has_speech = False
         with self.microphone as source:
             while self.recording:
                 sample_width = self.microphone.SAMPLE_WIDTH if hasattr(self.microphone, 'SAMPLE_WIDTH') else 2
@@ -102,18 +111,41 @@ class AudioRecorder:
                 self.buffer.append(chunk)
                 if self._vad(chunk, self.config.sample_rate):
                     no_voice_cnt = 0
+                    segment_has_speech = True
                 else:
                     no_voice_cnt += self.config.chunk_duration_ms
+                if (self.on_speech_chunk and segment_has_speech
+                        and no_voice_cnt >= self.config.stream_pause_ms):
+                    self._emit_speech_chunk(segment_start, len(self.buffer))
+                    segment_start = len(self.buffer)
+                    segment_has_speech = False
                 if no_voice_cnt >= no_voice_target_cnt:
                     self.recording = False
+        # 녹음이 끝날 때 남은 말소리 구간도 전달
+        if self.on_speech_chunk and segment_has_speech:
+            self._emit_speech_chunk(segment_start, len(self.buffer))
+
+    def _emit_speech_chunk(self, start_idx, end_idx):
+        pcm = b''.join(self._to_mono(chunk) for chunk in self.buffer[start_idx:end_idx])
+        offset = start_idx * self.config.chunk_duration_ms / 1000
+        sample_rate = getattr(self.microphone, "SAMPLE_RATE", self.config.sample_rate)
+        try:
+            self.on_speech_chunk(pcm, offset, sample_rate)
+        except Exception as e:
+            logger.warning(f"Speech chunk callback failed: {e}")
+
+    def _to_mono(self, chunk):
+        sample_width = getattr(self.microphone, "SAMPLE_WIDTH", 2)
+        if len(chunk) == 2 * self.chunk_size * sample_width:
+            chunk_array = np.frombuffer(chunk, dtype=np.int16)
+            return chunk_array[::2].tobytes()
+        return chunk
 
     def _vad(self, chunk, sample_rate):
         sample_width = getattr(self.microphone, "SAMPLE_WIDTH", 2)
         expected_bytes = self.chunk_size * sample_width
         if len(chunk) == 2 * expected_bytes:
-            chunk_array = np.frombuffer(chunk, dtype=np.int16)
-            mono_array = chunk_array[::2]
-            chunk = mono_array.tobytes()
+            chunk = self._to_mono(chunk)
         elif len(chunk) != expected_bytes:
             print(f"Warning: Received chunk size of {len(chunk)} bytes, expected {expected_bytes} bytes.")
         return self.vad.is_speech(chunk, sample_rate)
@@ -0,0 +1,110 @@
+# cache.py
+# Persistent key/value cache in a single SQLite file with TTL and size-bounded LRU eviction
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Small persistent cache for JSON-serialisable values.
+
+    Values are stored as zlib-compressed compact JSON in one SQLite file, so several
+    processes (API workers, STT pool workers, the GUI) can share the same cache.
+    Cache errors are logged and treated as misses; they never break the caller.
+
+    Usage:
+        cache = DiskCache("./cache/example.sqlite3", max_bytes=50 * 1024 * 1024, ttl_sec=86400)
+        cache.set("key", {"any": "json"})
+        value = cache.get("key")  # None on miss or expiry
+    """
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024, ttl_sec: Optional[float] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value, or None on a miss, an expired entry or a cache error.
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                value, created = row
+                now = time.time()
+                if self.ttl_sec is not None and now - created > self.ttl_sec:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            return json.loads(zlib.decompress(value).decode("utf-8"))
+        except Exception as e:
+            logger.warning(f"Cache read failed ({self.path}): {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value and evict least-recently-used entries beyond max_bytes.
+        """
+        try:
+            blob = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            now = time.time()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), now, now),
+                )
+                self._evict()
+        except Exception as e:
+            logger.warning(f"Cache write failed ({self.path}): {e}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _evict(self) -> None:
+        if self.ttl_sec is not None:
+            self._conn.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl_sec,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+        logger.info(f"Cache evicted {len(stale)} entries ({self.path})")
@@ -0,0 +1,146 @@
+# cassette.py
+# Record/replay store of LLM responses keyed by a hash of the request, for deterministic pipeline runs
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay")
+CASSETTE_VERSION = 1
+
+# generation_info 중 재생 시 성능 지표로 다시 보고할 항목 (Ollama가 보내는 나노초 단위 값)
+GENERATION_INFO_KEYS = (
+    "prompt_eval_count", "prompt_eval_duration", "eval_count", "eval_duration",
+    "load_duration", "total_duration",
+)
+
+
+class CassetteMiss(LookupError):
+    """Replay mode found no recorded response for a request."""
+
+
+def cassette_key(model: str, prompt: str, system: Optional[str] = None, format: Any = None) -> str:
+    """
+    Hash of everything that determines the response: model, system prompt, user prompt and
+    output format. Empty system/format values are normalised so the LLMClient and the Ollama
+    stand-in (which sees the request on the wire) compute the same key.
+    """
+    payload = json.dumps(
+        {"model": model, "system": system or "", "prompt": prompt, "format": format or None},
+        ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    LLM responses stored in one JSON Lines file: a {"version": 1} header line, then one
+    {"key", "model", "caller", "prompt", "chunks", "generation_info"} line per response
+    (a later line with the same key wins).
+
+    record: every successful call is appended right away, so recording costs O(1) per call
+    and a partial run still leaves a usable cassette; replay: calls are answered from the
+    file and a missing entry raises CassetteMiss instead of reaching Ollama.
+    """
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in CASSETTE_MODES or mode == "off":
+            raise ValueError(f"cassette mode must be 'record' or 'replay', got {mode!r}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        if os.path.exists(path) and os.path.getsize(path):
+            self._load()
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {path}")
+        else:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+        logger.info(f"Cassette {path} opened for {mode} ({len(self._entries)} entries)")
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"{self.path}: unsupported cassette version {header.get('version')}")
+            for line_no, line in enumerate(f, start=2):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 중 중단되어 마지막 줄이 잘린 경우: 그 줄만 버림
+                    logger.warning(f"{self.path}:{line_no}: truncated cassette entry skipped")
+                    continue
+                self._entries[entry.pop("key")] = entry
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def lookup(self, key: str) -> dict:
+        entry = self.get(key)
+        if entry is None:
+            raise CassetteMiss(f"No recorded response for request {key[:12]} in {self.path}")
+        return entry
+
+    def record(
+        self,
+        key: str,
+        chunks: List[str],
+        generation_info: Optional[dict] = None,
+        model: str = "",
+        prompt: str = "",
+        caller: str = "",
+    ) -> None:
+        info = {k: generation_info[k] for k in GENERATION_INFO_KEYS if generation_info and k in generation_info}
+        entry = {
+            "model": model,
+            "caller": caller,
+            # 사람이 카세트를 훑어볼 수 있도록 앞부분만 기록 (키는 전체 프롬프트 기준)
+            "prompt": prompt[:200],
+            "chunks": list(chunks),
+            "generation_info": info,
+        }
+        line = json.dumps({"key": key, **entry}, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._entries[key] = entry
+            # 한 줄만 덧붙임: 중단되어도 앞서 기록한 줄은 그대로 남음
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def open_cassette(path: str, mode: str) -> Optional[Cassette]:
+    """
+    Shared Cassette for (path, mode), or None when mode is "off".
+    Every LLMClient in the process writes to / reads from the same instance.
+    """
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"cassette mode must be one of {CASSETTE_MODES}, got {mode!r}")
+    if mode == "off" or not path:
+        return None
+    key = os.path.abspath(path)
+    with _cassettes_lock:
+        cassette = _cassettes.get(key)
+        if cassette is None or cassette.mode != mode:
+            cassette = Cassette(path, mode)
+            _cassettes[key] = cassette
+        return cassette
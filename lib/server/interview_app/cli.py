@@ -4,8 +4,9 @@
 Entry point for the Interview Application CLI.
 Defines Typer commands and invokes the interview flow logic.
 """
+from typing import List
+
 import typer
-from .interview_flow import start_full_interview
 from rich.console import Console
 
 console = Console()
@@ -22,6 +23,9 @@ def interview_command(
     """
     Start a full mock interview using the given PDF resume.
     """
+    # 녹음/카메라 의존성은 면접 명령에서만 필요
+    from .interview_flow import start_full_interview
+
     console.print(f"[bold green]Starting interview with resume:[/bold green] {resume_path}")
     try:
         start_full_interview(file_path=resume_path, output_video=output_video)
@@ -29,5 +33,135 @@ def interview_command(
         console.print(f"[bold red]Error during interview:[/bold red] {e}")
         raise
 
+@app.command("stt-bench")
+def stt_bench_command(
+    fixture_dir: str = typer.Argument(..., help="Directory of *.wav clips with same-stem *.txt reference transcripts"),
+    model: List[str] = typer.Option(["base"], "--model", help="Whisper model name (repeatable)"),
+    compute_type: List[str] = typer.Option(["int8"], "--compute-type", help="CTranslate2 compute type (repeatable)"),
+    beam_size: List[int] = typer.Option([5], "--beam-size", help="Beam size (repeatable)"),
+    batch_size: List[int] = typer.Option([1], "--batch-size", help="Batch size, 1 = per-clip transcribe (repeatable)"),
+    vad: List[str] = typer.Option(["off"], "--vad", help="VAD-gated decoding: on/off (repeatable)"),
+    output_json: str = typer.Option("stt_bench.json", "-o", "--output", help="Where to save the JSON results"),
+):
+    """
+    Compare STT configurations on Korean fixture clips: RTF, p50/p95 latency, peak RSS, CER/WER.
+    """
+    from .config import STTConfig
+    from .stt_bench import build_configs, run_benchmark
+
+    configs = build_configs(
+        STTConfig(), model, compute_type, beam_size, batch_size,
+        [v.lower() in ("on", "true", "1") for v in vad],
+    )
+    run_benchmark(fixture_dir, configs, output_json=output_json)
+
+def _parse_overrides(values: List[str], option: str) -> dict:
+    overrides = {}
+    for value in values:
+        name, sep, number = value.rpartition("=")
+        try:
+            if not sep or not name:
+                raise ValueError
+            overrides[name.strip()] = float(number)
+        except ValueError:
+            raise typer.BadParameter(f"expected name=value, got {value!r}", param_hint=option)
+    return overrides
+
+@app.command("rescore")
+def rescore_command(
+    sources: List[str] = typer.Argument(..., help="Evaluation .txt files, .json result lists, .npz rating tables or directories"),
+    weight: List[str] = typer.Option([], "--weight", help="Criterion weight override, e.g. relevance=1.5 (repeatable)"),
+    rating: List[str] = typer.Option([], "--rating", help="Rating score override, e.g. 보통=9, applied to legacy 높음/보통/낮음 rows too (repeatable)"),
+    save_table: str = typer.Option(None, "--save-table", help="Save the collected rating table as .npz for later runs"),
+    output_csv: str = typer.Option(None, "-o", "--output", help="Write id, stored score, new score, grade as CSV"),
+):
+    """
+    Recompute total scores and grades of stored evaluations under a changed rubric, without LLM calls.
+    """
+    import csv
+
+    import numpy as np
+    from rich.table import Table
+
+    from .evaluation import CRITERIA_WEIGHTS
+    from .rescoring import RATING_NAMES, grade_scores, load_rating_tables, score_table
+
+    weights = {**CRITERIA_WEIGHTS, **_parse_overrides(weight, "--weight")}
+    unknown = set(weights) - set(CRITERIA_WEIGHTS)
+    if unknown:
+        raise typer.BadParameter(f"unknown criteria: {sorted(unknown)}", param_hint="--weight")
+    rating_overrides = _parse_overrides(rating, "--rating")
+    unknown = set(rating_overrides) - set(RATING_NAMES)
+    if unknown:
+        raise typer.BadParameter(f"unknown ratings: {sorted(unknown)}", param_hint="--rating")
+
+    table = load_rating_tables(sources)
+    if not len(table):
+        console.print("[bold red]No evaluations found.[/bold red]")
+        raise typer.Exit(1)
+    if save_table:
+        table.save(save_table)
+        console.print(f"Saved rating table ({len(table)} rows) to {save_table}")
+
+    scores = score_table(table, weights=weights, overrides=rating_overrides)
+    if rating_overrides:
+        # 점수표 변경이 실제로 반영됐는지 보고 (사용되지 않은 rating이거나 기존 점수와 같으면 효과 없음)
+        baseline = score_table(table, weights=weights)
+        for name, value in rating_overrides.items():
+            affected = int((score_table(table, weights=weights, overrides={name: value}) != baseline).sum())
+            if affected:
+                console.print(f"--rating {name}={value:g}: {affected} scores changed")
+            else:
+                console.print(f"[yellow]--rating {name}={value:g} had no effect on any score[/yellow]")
+    grades = grade_scores(scores)
+    known = table.stored_scores >= 0
+    old_grades = grade_scores(table.stored_scores)
+
+    summary = Table(title=f"Rescored {len(table)} evaluations")
+    summary.add_column("Grade")
+    summary.add_column("Stored", justify="right")
+    summary.add_column("Rescored", justify="right")
+    for label in np.unique(np.concatenate([grades, old_grades[known]])):
+        summary.add_row(str(label), str(int((old_grades[known] == label).sum())), str(int((grades == label).sum())))
+    console.print(summary)
+    changed = known & (scores != table.stored_scores)
+    console.print(
+        f"Score changed: {int(changed.sum())}/{int(known.sum())}, "
+        f"grade changed: {int((known & (grades != old_grades)).sum())}, "
+        f"mean {table.stored_scores[known].mean() if known.any() else float('nan'):.1f} → {scores.mean():.1f}"
+    )
+
+    if output_csv:
+        with open(output_csv, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "stored_score", "score", "grade"])
+            writer.writerows(zip(table.ids.tolist(), table.stored_scores.tolist(), scores.tolist(), grades.tolist()))
+        console.print(f"Wrote {output_csv}")
+
+@app.command("ollama-stub")
+def ollama_stub_command(
+    port: int = typer.Option(11434, "--port", help="Port to listen on"),
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    model: List[str] = typer.Option(["gemma3:4b"], "--model", help="Model name to accept (repeatable)"),
+    cassette: str = typer.Option(None, "--cassette", help="Serve recorded responses from this cassette file"),
+    tokens_per_sec: float = typer.Option(50.0, "--tokens-per-sec", help="Generation rate, 0 = no delay"),
+    prompt_tokens_per_sec: float = typer.Option(0.0, "--prompt-tokens-per-sec", help="Prompt processing rate, 0 = no delay"),
+    first_token_latency: float = typer.Option(0.05, "--first-token-latency", help="Seconds before the first token"),
+    load_sec: float = typer.Option(0.0, "--load-sec", help="Simulated model load time on the first request"),
+    max_parallel: int = typer.Option(4, "--max-parallel", help="Requests generated at once, the rest wait"),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction of requests that fail with HTTP 500"),
+):
+    """
+    Run a local stand-in for the Ollama API with deterministic responses and configurable speed.
+    """
+    from .ollama_stub import OllamaStubConfig, serve_ollama_stub
+
+    serve_ollama_stub(OllamaStubConfig(
+        host=host, port=port, models=tuple(model), cassette_path=cassette,
+        load_sec=load_sec, prompt_tokens_per_sec=prompt_tokens_per_sec,
+        first_token_latency_sec=first_token_latency, tokens_per_sec=tokens_per_sec,
+        max_parallel=max_parallel, error_rate=error_rate,
+    ))
+
 if __name__ == "__main__":
     app()
@@ -2,7 +2,7 @@
 # Global configuration definitions for the interview application
 
 from dataclasses import dataclass, field
-from typing import Tuple
+from typing import Optional, Tuple
 
 @dataclass
 class LlamaConfig:
@@ -15,6 +15,42 @@ class LlamaConfig:
     top_p: float = field(default=1.0)
     frequency_penalty: float = field(default=0.0)
     presence_penalty: float = field(default=0.0)
+    # Ollama 서버 목록 (예: ("http://gpu1:11434", "http://gpu2:11434")), 비어 있으면 OLLAMA_HOST/기본 주소
+    # 여러 개면 진행 중인 요청이 가장 적은 서버로 분산
+    hosts: Tuple[str, ...] = field(default=())
+    # 요청당 HTTP 타임아웃 (초), 실패 시 재시도 횟수와 지수 백오프 기준 시간 (지터 포함)
+    request_timeout_sec: float = field(default=120.0)
+    max_retries: int = field(default=2)
+    retry_backoff_sec: float = field(default=0.5)
+    # 연속 실패가 threshold에 도달한 서버는 reset_sec 동안 라우팅에서 제외 (서킷 브레이커)
+    breaker_failure_threshold: int = field(default=3)
+    breaker_reset_sec: float = field(default=30.0)
+    # 요청 사이에 모델을 메모리에 유지하는 시간 (Ollama keep_alive 형식, 예: "30m", -1은 무기한)
+    keep_alive: str = field(default="30m")
+    # JSON 스키마로 디코딩 제약 (Ollama 0.5+ 필요, False면 format="json"만 사용)
+    structured_output: bool = field(default=True)
+    # JSON이 깨졌을 때 출력을 다시 보내 복구를 요청하는 최대 횟수
+    json_repair_attempts: int = field(default=1)
+    # 평가 시 동시에 보낼 LLM 요청 수 (Ollama 서버의 OLLAMA_NUM_PARALLEL에 맞춤)
+    max_concurrency: int = field(default=4)
+    # 한 번의 LLM 호출로 평가할 질문 수 (1이면 질문별 개별 호출)
+    evaluation_batch_size: int = field(default=1)
+    # True면 평가 응답에 추천 답변까지 함께 생성 (이전 동작), False면 채점만 하고 추천 답변은 요청 시 별도 생성
+    eager_recommended_answer: bool = field(default=False)
+    # 단계적 평가: 작은 모델(예: "gemma3:1b")로 먼저 평가하고, 총점이 cascade_band 구간(합격/불합격 경계 근처)이거나
+    # 등급 경계(GRADE_LADDER의 60~95점)에서 cascade_grade_margin점 이내이거나 JSON이 깨진 답변만 model로 다시 평가
+    # (None이면 사용 안 함, margin 0이면 cascade_band만 보호, 등급 간격이 5점이므로 margin 2 이상이면 대부분 재평가)
+    cascade_model: Optional[str] = field(default=None)
+    cascade_band: Tuple[int, int] = field(default=(50, 70))
+    cascade_grade_margin: int = field(default=1)
+    # 평가 결과 캐시 (질문 + 정규화된 답변 + 모델 + 프롬프트 버전 기준, None이면 사용 안 함)
+    cache_path: Optional[str] = field(default="./cache/llm_evaluations.sqlite3")
+    cache_ttl_sec: float = field(default=7 * 24 * 3600)
+    cache_max_mb: int = field(default=100)
+    # 응답 녹화/재생 카세트 (요청 해시 기준 JSON Lines 파일): "record"는 실제 응답을 저장,
+    # "replay"는 Ollama 없이 저장된 응답만 사용 (없는 요청은 CassetteMiss), "off"는 사용 안 함
+    cassette_path: Optional[str] = field(default=None)
+    cassette_mode: str = field(default="off")
 
 @dataclass
 class AudioConfig:
@@ -28,6 +64,7 @@ class AudioConfig:
     denoise_prop_decrease_noise: float = field(default=0.0)
     energy_threshold_offset: int = field(default=100)
     vad_timeout_sec: float = 1
+    stream_pause_ms: int = field(default=400)  # 증분 STT로 구간을 넘기는 쉼 길이
 
 @dataclass
 class VideoConfig:
@@ -48,6 +85,64 @@ class STTConfig:
     compute_type: str = field(default="int8")
     beam_size: int = field(default=5)
     language: str = field(default="ko")
+    batch_size: int = field(default=8)      # transcribe_batch 디코딩 배치 크기 (1이면 파일별 순차 처리)
+    # iter_transcripts/iter_texts에서 워커당 한 번에 인식할 파일 수 (0이면 batch_size개)
+    # 작을수록 첫 답변의 LLM 평가가 빨리 시작되어 Whisper와 Ollama가 겹치고, 클수록 파일 간 배치 효율이 높음
+    # (답변 8개 모의 측정: 1개 → 첫 평가 1.0/전체 10.1, 2개 → 1.6/8.5, 8개 → 5.6/9.6 단위, 8개면 겹침 없음)
+    pipeline_group_size: int = field(default=2)
+    vad_filter: bool = field(default=False)  # VAD로 말한 구간만 디코딩하고 침묵 시간도 VAD 구간으로 계산
+    vad_min_silence_ms: int = field(default=500)
+    # 2단계(draft→refine) 모드: model_name(예: "tiny")으로 먼저 인식하고,
+    # 확신이 낮은 구간만 refine_model_name으로 다시 디코딩 (None이면 사용 안 함)
+    refine_model_name: Optional[str] = field(default=None)
+    refine_compute_type: str = field(default="int8")
+    refine_logprob_threshold: float = field(default=-1.0)
+    refine_no_speech_threshold: float = field(default=0.6)
+    # CPU 스레드 예산 (0이면 CTranslate2 기본값, 풀 모드에서는 코어 수 / pool_workers)
+    cpu_threads: int = field(default=0)
+    num_workers: int = field(default=1)     # 한 모델에서 동시에 처리할 요청 수
+    pool_workers: int = field(default=0)    # >0이면 모델을 상주시키는 STT 워커 프로세스 수
+    # 인식 결과 캐시 (오디오 내용 해시 + 디코딩 설정 기준, None이면 사용 안 함)
+    cache_path: Optional[str] = field(default="./cache/stt_transcripts.sqlite3")
+    cache_max_mb: int = field(default=200)
+
+@dataclass
+class TriageConfig:
+    """
+    Thresholds for the pre-LLM triage that scores non-answers without calling the model.
+    """
+    # 이보다 적은 단어 수의 답변은 LLM 평가 없이 낮은 점수
+    min_words: int = field(default=3)
+    # 답변 전체가 이 표현 중 하나이면 무응답으로 처리 (공백/마침표 무시)
+    non_answer_phrases: Tuple[str, ...] = field(default=(
+        "모르겠습니다", "잘 모르겠습니다", "모르겠어요", "잘 모르겠어요", "없습니다", "패스", "넘어가겠습니다",
+    ))
+    # Whisper 단어 확률 평균이 이보다 낮으면 인식 결과를 신뢰하지 않음 (단어 신뢰도가 있을 때만)
+    min_word_confidence: float = field(default=0.35)
+    # 녹음 길이 대비 발화 비율이 이보다 낮으면 사실상 침묵으로 처리
+    min_speech_ratio: float = field(default=0.05)
+    # 발화 비율 판단에 필요한 최소 녹음 길이 (초)
+    min_audio_sec: float = field(default=3.0)
+
+@dataclass
+class PromptGovernorConfig:
+    """
+    Token budget for the per-question evaluation prompt and how long transcripts are compressed to fit it.
+    """
+    # 질문 + 답변 사용자 프롬프트의 최대 추정 토큰 수 (0이면 제한 없음, 시스템 프롬프트는 캐시되므로 제외)
+    # 줄이는 대상은 답변뿐: 질문이 매우 길면 답변은 최소 64토큰을 남기므로 프롬프트가 예산을 넘을 수 있음
+    prompt_token_budget: int = field(default=768)
+    # 예산을 넘을 때 먼저 제거하는 간투사 (단어 단위로 일치, 뒤따르는 문장부호 무시)
+    # 망설임 소리만 포함: "약간", "좀", "진짜", "이제", "막" 등은 답변의 뜻(정도/시점/강조)을 바꿀 수 있어 제외
+    filler_words: Tuple[str, ...] = field(default=("음", "어", "으음", "어어", "그러니까", "뭐랄까"))
+    # 발췌 시 구체적인 근거가 담긴 문장으로 보고 가산점을 주는 표현 (숫자가 있는 문장도 포함)
+    evidence_markers: Tuple[str, ...] = field(default=(
+        "예를 들어", "예를 들면", "결과", "때문에", "경험", "프로젝트", "개선", "해결",
+    ))
+    # 발췌 점수 가중치: 질문과의 겹침, 문장 위치(답변 첫머리/마지막), 근거 표현
+    overlap_weight: float = field(default=1.0)
+    position_weight: float = field(default=0.3)
+    evidence_weight: float = field(default=0.2)
 
 @dataclass
 class CLIConfig:
@@ -2,155 +2,314 @@
 # Evaluate candidate responses via LLM and save evaluation results to a text file
 
 import json
+import hashlib
 import logging
-from typing import List
+from dataclasses import replace
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from .llm_client import LLMClient
-from .config import LlamaConfig
-from .stt import STTClient, calculate_silence_duration, calculate_audio_duration
+from .llm_client import LLMClient, JsonFieldStreamExtractor, clean_llm_response
+from .config import LlamaConfig, PromptGovernorConfig, TriageConfig
+from .cache import DiskCache
+from .prompts import (
+    EVALUATION_PROMPT_VERSION,
+    EVALUATION_SYSTEM_PROMPT,
+    BATCH_EVALUATION_SYSTEM_PROMPT,
+    EVALUATION_CRITERIA,
+    EVALUATION_SCHEMA,
+    BATCH_EVALUATION_SCHEMA,
+    GRADING_SYSTEM_PROMPT,
+    BATCH_GRADING_SYSTEM_PROMPT,
+    GRADING_SCHEMA,
+    BATCH_GRADING_SCHEMA,
+    RECOMMENDED_ANSWER_SYSTEM_PROMPT,
+)
+from .triage import TriageResult, triage_answer
+from .prompt_governor import GovernedAnswer, estimate_tokens, govern_answer
+from .stt import (
+    STTClient,
+    calculate_silence_duration,
+    calculate_silence_from_speech,
+    calculate_speaking_duration,
+    calculate_audio_duration,
+)
 
 logger = logging.getLogger(__name__)
 
+# 질문이 길어도 답변에 최소한 남겨 두는 토큰 수 (프롬프트 예산 계산 시)
+MIN_ANSWER_TOKENS = 64
+
+# 각 평가 항목별 점수 매핑 (더 엄격한 기준 적용)
+RATING_SCORES = {
+    "매우 높음": 18,    # 탁월한 평가 (거의 완벽)
+    "높음": 14,         # 우수한 평가 (좋은 수준)
+    "보통": 10,         # 평균적인 평가 (기본 수준)
+    "낮음": 6,          # 부족한 평가 (개선 필요)
+    "매우 낮음": 2,     # 매우 부족한 평가 (심각한 문제)
+    "분석불가": 0       # 분석 오류 (점수 없음)
+}
+
+# 기존 3단계 평가도 지원 (하위 호환성): 높음/보통/낮음이 하나라도 있으면 이 값으로 덮어씀
+LEGACY_RATING_SCORES = {
+    "높음": 12,     # 기존 "높음"을 더 엄격하게
+    "보통": 8,      # 기존 "보통"을 더 엄격하게
+    "낮음": 4,      # 기존 "낮음"을 더 엄격하게
+}
+
+# 알 수 없는 rating의 점수 (기본값을 더 낮게), rating이 없으면 '낮음'으로 간주
+DEFAULT_RATING_SCORE = 4
+DEFAULT_RATING = "낮음"
+# 100점 환산 기준 (매우 높음 18점)
+MAX_RATING_SCORE = 18
+
+# 5개 평가 항목별 가중치
+CRITERIA_WEIGHTS = {
+    "relevance": 1.2,      # 관련성 (가장 중요)
+    "completeness": 1.1,   # 완전성 (중요)
+    "correctness": 1.1,    # 정확성 (중요)
+    "clarity": 1.0,        # 명확성 (기본)
+    "professionalism": 0.8 # 전문성 (기본보다 낮음)
+}
+
+# 점수에 따른 등급 (최소 점수, 등급), 높은 점수부터
+GRADE_LADDER = [
+    (95, "A+ (탁월)"),
+    (90, "A (우수)"),
+    (85, "A- (좋음)"),
+    (80, "B+ (양호)"),
+    (75, "B (평균)"),
+    (70, "B- (평균 이하)"),
+    (65, "C+ (부족)"),
+    (60, "C (개선 필요)"),
+]
+FAILING_GRADE = "F (미흡)"
+
+# 추천 답변 생성 실패 시 안내 문구 (결과로 저장하지 않음)
+RECOMMENDED_ANSWER_ERROR = "AI 분석 오류로 추천 답변을 제공할 수 없습니다."
+
+
+def grade_from_score(total_score) -> str:
+    """총점을 등급 문자열로 변환 (GRADE_LADDER 기준)"""
+    for min_score, grade in GRADE_LADDER:
+        if total_score >= min_score:
+            return grade
+    return FAILING_GRADE
+
+
 def evaluate_and_save_responses(
     questions: List[str],
     answers: List[str],
     audio_files: List[str],
-    output_file: str = "interview_evaluation.txt"
+    output_file: str = "interview_evaluation.txt",
+    stt_client: Optional[STTClient] = None
 ) -> list:
     """
     Evaluate user responses using an LLM and save structured results to a TXT file.
     빈 답변 및 '그만하겠습니다' 트리거를 건너뛰고,
     모든 출력은 한국어로만 제공하도록 프롬프트를 조정합니다.
     각 평가 항목에 대해 점수를 계산하여 총점을 제공합니다.
+    stt_client를 넘기면 호출자의 STT 설정(VAD 모드 등)과 이미 로드된 모델을 재사용합니다.
+    답변이 모두 준비된 경우용이며, 답변이 하나씩 준비되는 경우에는 InterviewEvaluator를 직접 사용합니다.
     """
-    llm_config = LlamaConfig()
-    llm_client = LLMClient(llm_config)
-    stt_client = STTClient()
-
-    evaluations = []
-
-    for idx, (question, answer, audio_path) in enumerate(zip(questions, answers, audio_files), start=1):
-        # 1) '그만하겠습니다' 면접 종료 트리거 건너뛰기
-        if answer.strip().lower() == "그만하겠습니다":
-            logger.info(f"Skipping evaluation for exit trigger at Q{idx}")
-            break
-
-        # 2) 빈 답변에 대해서는 LLM 호출 없이 낮은 평가 처리
-        if not answer.strip():
-            try:
-                total_time = calculate_audio_duration(audio_path)
-                # 빈 답변의 경우 전체가 침묵으로 간주
-                silence = total_time
-            except Exception as e:
-                logger.warning(f"Audio duration calculation failed for {audio_path}: {e}")
-                total_time = 0.0
-                silence = 0.0
-                
-            evaluations.append({
-                "question": question,
-                "user_answer": "",
-                "evaluation": {
-                    "relevance":      {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
-                    "completeness":   {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
-                    "correctness":    {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
-                    "clarity":        {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
-                    "professionalism":{"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
-                },
-                "recommended_answer": "",
-                "total_response_time": total_time,
-                "silence_duration":    silence,
-                "total_score": 0  # 빈 답변은 0점
-            })
-            continue
+    evaluator = InterviewEvaluator(stt_client=stt_client)
+    try:
+        for question, answer, audio_path in zip(questions, answers, audio_files):
+            if evaluator.submit(question, answer, audio_path) is None:
+                break
+        # GUI/다른 호출자를 위해 평가 결과 반환
+        return evaluator.finish(output_file)
+    finally:
+        evaluator.close()
 
-        # 3) LLM 프롬프트: 한국어 강제, JSON 예시도 한글화 (엄격한 평가 기준)
-        prompt = (
-            "모든 출력은 *오직 한국어*로만 작성하십시오.\n"
-            "당신은 까다로운 IT 회사의 숙련된 면접관이자 평가 전문가입니다.\n"
-            "높은 수준의 답변만을 인정하며, 엄격한 기준으로 평가합니다.\n"
-            "아래 면접 질문과 지원자의 답변을 기반으로 다음 다섯 가지 기준에 따라 **엄격하게** 평가하고,"
-            "추천 답변을 제공해주세요.\n\n"
-            "**평가 기준 (매우 엄격하게 적용):**\n"
-            "1. 관련성: 답변이 질문의 핵심을 정확히 다루었는가? (애매한 답변은 낮음)\n"
-            "2. 완전성: 답변에 필요한 모든 요소가 구체적으로 포함되었는가? (일반적인 답변은 낮음)\n"
-            "3. 정확성: 정확한 사실과 논리에 기반한 내용인가? (추상적인 답변은 낮음)\n"
-            "4. 명확성: 명료하고 논리적으로 구성되었는가? (어색한 표현은 낮음)\n"
-            "5. 전문성: 면접에 적합한 전문적인 어조와 표현을 사용했는가? (반복이나 문법 오류는 낮음)\n\n"
-            "**평가 등급 가이드:**\n"
-            "- 높음: 탁월한 답변, 구체적이고 완벽한 내용\n"
-            "- 보통: 기본적인 요구사항을 충족하는 평균적인 답변\n"
-            "- 낮음: 부족하거나 개선이 필요한 답변\n\n"
-            "**중요**: 대부분의 일반적인 답변은 '보통' 또는 '낮음'으로 평가하세요.\n"
-            "'높음' 평가는 정말 우수한 답변에만 부여하세요.\n\n"
-            f"Question:\n{question}\n\n"
-            f"Candidate's Answer:\n{answer}\n\n"
-            "출력 예시(모든 키는 영어, 평가는 한글로 작성):\n"
-            "{\n"
-            '  "evaluation": {\n'
-            '    "relevance":      {"rating": "높음",   "comment": "..."},\n'
-            '    "completeness":   {"rating": "보통",   "comment": "..."},\n'
-            '    "correctness":    {"rating": "높음",   "comment": "..."},\n'
-            '    "clarity":        {"rating": "낮음",   "comment": "..."},\n'
-            '    "professionalism":{"rating": "높음",   "comment": "..."}\n'
-            "  },\n"
-            '  "recommended_answer": "..." \n'
-            "}\n"
-        )
 
-        # 4) LLM 호출 및 JSON 파싱
+class InterviewEvaluator:
+    """
+    답변을 하나씩 받아 바로 평가를 시작하는 파이프라인 평가기.
+
+    STT가 끝난 답변을 submit()하면 백그라운드에서 사전 분류 → 캐시 조회 → LLM 평가 →
+    오디오 지표 계산을 진행하므로, 다음 답변의 음성 인식과 이전 답변의 LLM 평가가 겹칩니다.
+    finish()는 남은 평가를 기다려 질문 순서대로 결과를 모으고 평가 파일을 씁니다.
+    '그만하겠습니다' 답변이 들어오면 그 이후 submit은 무시합니다.
+    """
+    def __init__(
+        self,
+        stt_client: Optional[STTClient] = None,
+        llm_config: Optional[LlamaConfig] = None,
+        governor_config: Optional[PromptGovernorConfig] = None,
+    ):
+        self.llm_config = llm_config or LlamaConfig()
+        self.llm_client = LLMClient(self.llm_config, caller="evaluation")
+        self.cascade_client = make_cascade_client(self.llm_config)
+        self.stt_client = stt_client or STTClient()
+        self.cache = open_evaluation_cache(self.llm_config)
+        self.triage_config = TriageConfig()
+        self.governor_config = governor_config or PromptGovernorConfig()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.llm_config.max_concurrency))
+        self._lock = threading.Lock()
+        self._results: List[Future] = []   # 질문 순서대로의 평가 결과
+        self._tasks: List[Future] = []     # 사전 분류/캐시 조회 작업
+        self._pending: List[Tuple[tuple, Future, GovernedAnswer]] = []  # 다중 질문 평가 대기열
+        self._word_timestamps: Dict[int, List[Dict]] = {}  # 호출자가 넘긴 질문별 STT 단어 목록
+        self._stopped = False
+
+    def submit(
+        self, question: str, answer: str, audio_path: str, word_timestamps: Optional[List[Dict]] = None
+    ) -> Optional[Future]:
+        """
+        답변 하나의 평가를 시작하고 평가 결과 dict로 완료되는 Future를 반환합니다.
+        면접 종료 트리거이거나 이미 종료된 경우 None을 반환합니다.
+        word_timestamps는 answer를 만든 STT 단어 목록으로, 넘기면 사전 분류와 침묵 시간 계산에
+        그대로 쓰고 오디오를 다시 인식하지 않습니다.
+        """
+        with self._lock:
+            if self._stopped:
+                return None
+            idx = len(self._results) + 1
+            # 1) '그만하겠습니다' 면접 종료 트리거 이후 질문은 평가하지 않음
+            if answer.strip().lower() == "그만하겠습니다":
+                logger.info(f"Skipping evaluation for exit trigger at Q{idx}")
+                self._stopped = True
+                return None
+            future: Future = Future()
+            self._results.append(future)
+            if word_timestamps is not None:
+                self._word_timestamps[idx] = word_timestamps
+            self._tasks.append(self._executor.submit(self._run, (idx, question, answer, audio_path), future))
+        return future
+
+    def _run(self, item: tuple, future: Future) -> None:
         try:
-            raw = llm_client.call(prompt)
-            print(f"🔍 LLM 원시 응답: {raw[:200]}...")
-            data = json.loads(raw)
-            eval_obj = data.get("evaluation", {})
-            rec_answer = data.get("recommended_answer", "")
-            print(f"✅ JSON 파싱 성공, evaluation 타입: {type(eval_obj)}")
+            idx, question, answer, audio_path = item
+            triage = None
+            grading = None
+            governed = None
+            if answer.strip():
+                # 사전 분류: STT 실패 문구, 너무 짧은 답변, 침묵/저신뢰 인식 결과는 LLM 없이 낮은 점수
+                triage = _triage_item(
+                    self.stt_client, answer, audio_path, self.triage_config, self._word_timestamps.get(idx)
+                )
+                if triage.substantive:
+                    triage = None
+                    # 긴 답변은 프롬프트 토큰 예산에 맞게 줄인 텍스트로 평가/캐시 조회
+                    governed = govern_evaluation_answer(question, answer, self.governor_config, idx=idx)
+                    # 같은 질문/답변/모델/프롬프트 버전의 이전 평가는 캐시에서 바로 사용 (temperature=0)
+                    grading = self._cached_grading(question, governed.text)
+                    if grading is not None:
+                        print(f"⚡ Q{idx} 평가 캐시 적중")
+                    elif self.llm_config.evaluation_batch_size > 1:
+                        self._enqueue_batch(item, future, governed)
+                        return
+            self._complete(
+                item, future, grading=grading, triage=triage, from_cache=grading is not None, governed=governed
+            )
         except Exception as e:
-            logger.error(f"LLM evaluation failed for question {idx}: {e}")
-            print(f"❌ LLM/JSON 파싱 오류: {e}")
-            # 기본 평가 구조 제공
-            eval_obj = {
-                "relevance":      {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
-                "completeness":   {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
-                "correctness":    {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
-                "clarity":        {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
-                "professionalism":{"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
-            }
-            rec_answer = "AI 분석 오류로 추천 답변을 제공할 수 없습니다."
-
-        # === 점수 계산 추가 ===
-        total_score = calculate_score_from_evaluation(eval_obj)
-        print(f"📊 계산된 점수: {total_score}점")
+            logger.error(f"Evaluation failed for Q{item[0]}: {e}")
+            future.set_exception(e)
 
-        # 5) 오디오 지표 계산
+    def _complete(
+        self,
+        item: tuple,
+        future: Future,
+        grading: Optional[Tuple[dict, str]] = None,
+        triage: Optional[TriageResult] = None,
+        from_cache: bool = False,
+        governed: Optional[GovernedAnswer] = None,
+    ) -> None:
         try:
-            # STT 결과에서 침묵 시간 계산 (단어 타임스탬프 필요)
-            stt_timestamps = stt_client.transcribe(audio_path)
-            if stt_timestamps:
-                silence = calculate_silence_duration(stt_timestamps)
-            else:
-                silence = 0.0
+            result = _evaluate_response(
+                self.llm_client, self.stt_client, *item,
+                grading=grading, triage=triage, cascade_client=self.cascade_client, governed=governed,
+                word_timestamps=self._word_timestamps.get(item[0]),
+            )
+            # 새로 평가한 결과를 캐시에 저장 ('분석불가' 결과는 저장하지 않음)
+            if (self.cache is not None and triage is None and not from_cache and item[2].strip()
+                    and not _is_error_evaluation(result["evaluation"])):
+                prompt_answer = governed.text if governed is not None else item[2]
+                self.cache.set(self._cache_key(item[1], prompt_answer), {
+                    "evaluation": result["evaluation"],
+                    "recommended_answer": result["recommended_answer"],
+                })
+            future.set_result(result)
         except Exception as e:
-            logger.warning(f"Silence calculation failed for {audio_path}: {e}")
-            silence = 0.0
+            logger.error(f"Evaluation failed for Q{item[0]}: {e}")
+            future.set_exception(e)
+
+    def _cache_key(self, question: str, answer: str) -> str:
+        return evaluation_cache_key(question, answer, evaluation_model_tag(self.llm_config))
+
+    def _cached_grading(self, question: str, answer: str) -> Optional[Tuple[dict, str]]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self._cache_key(question, answer))
+        if cached is None:
+            return None
+        return cached["evaluation"], cached["recommended_answer"]
 
+    def _enqueue_batch(self, item: tuple, future: Future, governed: GovernedAnswer) -> None:
+        # 다중 질문 모드: batch_size개가 모이면 한 번의 LLM 호출로 평가 (나머지는 finish에서)
+        with self._lock:
+            self._pending.append((item, future, governed))
+            if len(self._pending) < self.llm_config.evaluation_batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._grade_pending(batch)
+
+    def _grade_pending(self, batch: List[Tuple[tuple, Future, GovernedAnswer]]) -> None:
+        # LLM에는 예산에 맞게 줄인 답변을 보냄 (결과의 user_answer는 원래 답변)
+        items = [(idx, question, governed.text, audio_path) for (idx, question, _, audio_path), _, governed in batch]
         try:
-            total_time = calculate_audio_duration(audio_path)
+            gradings = _grade_batch(self.cascade_client or self.llm_client, items)
         except Exception as e:
-            logger.warning(f"Audio duration calculation failed for {audio_path}: {e}")
-            total_time = 0.0
+            logger.error(f"Batch evaluation failed: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        escalated = 0
+        for item, future, governed in batch:
+            grading = gradings[item[0]]
+            if self.cascade_client is not None and _needs_escalation(grading[0], self.llm_config):
+                # 작은 모델의 다중 질문 평가 중 경계 구간/오류인 질문만 큰 모델로 다시 평가 (질문별로 동시에)
+                escalated += 1
+                self._executor.submit(self._escalate, item, future, governed)
+            else:
+                self._executor.submit(self._complete, item, future, grading, governed=governed)
+        if escalated:
+            print(f"⬆️ 단계적 평가: {escalated}/{len(items)}개 질문을 {self.llm_config.model}로 재평가")
 
-        evaluations.append({
-            "question": question,
-            "user_answer": answer,
-            "evaluation": eval_obj,
-            "recommended_answer": rec_answer,
-            "total_response_time": total_time,
-            "silence_duration": silence,
-            "total_score": total_score  # 총점 추가
-        })
+    def _escalate(self, item: tuple, future: Future, governed: GovernedAnswer) -> None:
+        try:
+            grading = _grade_answer(self.llm_client, item[0], item[1], governed.text)
+        except Exception as e:
+            logger.error(f"Evaluation failed for Q{item[0]}: {e}")
+            future.set_exception(e)
+            return
+        self._complete(item, future, grading, governed=governed)
+
+    def finish(self, output_file: Optional[str] = "interview_evaluation.txt") -> list:
+        """
+        제출된 모든 평가가 끝나기를 기다려 질문 순서대로 결과를 반환하고, output_file이 있으면 평가 파일을 씁니다.
+        """
+        with self._lock:
+            self._stopped = True
+            tasks = list(self._tasks)
+        wait(tasks)
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._grade_pending(batch)
+        evaluations = [future.result() for future in self._results]
+        if output_file:
+            _write_evaluation_file(evaluations, output_file)
+        return evaluations
 
-    # 6) 파일로 출력
+    def close(self) -> None:
+        """진행 중이 아닌 평가를 취소하고 작업 스레드를 정리합니다 (finish 이후 또는 중단 시)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _write_evaluation_file(evaluations: list, output_file: str) -> None:
+    """평가 결과를 텍스트 파일로 저장 (Flutter 앱/GUI가 파싱하는 형식)"""
     try:
         with open(output_file, "w", encoding="utf-8") as f:
             f.write("면접 평가 결과\n")
@@ -193,24 +352,7 @@ def evaluate_and_save_responses(
                 f.write(f"총점: {total_score}점\n")  # 총점 표시 추가
                 
                 # 점수에 따른 등급 표시 (더 엄격한 기준)
-                if total_score >= 95:
-                    grade = "A+ (탁월)"
-                elif total_score >= 90:
-                    grade = "A (우수)"
-                elif total_score >= 85:
-                    grade = "A- (좋음)"
-                elif total_score >= 80:
-                    grade = "B+ (양호)"
-                elif total_score >= 75:
-                    grade = "B (평균)"
-                elif total_score >= 70:
-                    grade = "B- (평균 이하)"
-                elif total_score >= 65:
-                    grade = "C+ (부족)"
-                elif total_score >= 60:
-                    grade = "C (개선 필요)"
-                else:
-                    grade = "F (미흡)"
+                grade = grade_from_score(total_score)
                 
                 f.write(f"등급: {grade}\n\n")
                 f.write(f"추천 답변:\n{recommended_answer}\n\n")
@@ -233,56 +375,554 @@ def evaluate_and_save_responses(
         # 여전히 오류를 발생시키지만 더 안전한 형태로
         raise Exception(f"평가 파일 생성 실패: {str(e)}")
 
-    # 7) GUI/다른 호출자를 위해 평가 결과 반환
-    return evaluations
+
+def open_evaluation_cache(llm_config: LlamaConfig) -> Optional[DiskCache]:
+    """LlamaConfig의 평가 캐시 설정으로 DiskCache를 엽니다 (cache_path가 None이면 None)."""
+    if not llm_config.cache_path:
+        return None
+    return DiskCache(
+        llm_config.cache_path,
+        max_bytes=llm_config.cache_max_mb * 1024 * 1024,
+        ttl_sec=llm_config.cache_ttl_sec,
+    )
+
+
+def stream_evaluation(question: str, answer: str, llm_client: Optional[LLMClient] = None) -> Iterator[dict]:
+    """
+    질문 하나를 평가하면서 추천 답변을 생성되는 대로 흘려보냅니다.
+
+    {"type": "token", "text": ...} 이벤트로 recommended_answer 조각을 순서대로 내보내고,
+    마지막에 {"type": "result", "evaluation", "recommended_answer", "total_score", "prompt_trim"}을 내보냅니다.
+    기본 모드에서는 채점을 백그라운드에서 따로 요청하고 추천 답변은 별도 호출로 스트리밍하며,
+    eager_recommended_answer 모드에서는 한 번의 JSON 응답에서 추천 답변 필드를 추출합니다.
+    캐시에 있으면 token 이벤트 없이 result만 바로 내보냅니다.
+    """
+    llm_client = llm_client or LLMClient(LlamaConfig(), caller="evaluation")
+    config = llm_client.config
+    if not answer.strip():
+        eval_obj = {name: {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."} for name in EVALUATION_CRITERIA}
+        yield {"type": "result", "evaluation": eval_obj, "recommended_answer": "", "total_score": 0}
+        return
+
+    triage = triage_answer(answer)
+    if not triage.substantive:
+        eval_obj = triage.evaluation()
+        total_score = triage.score if triage.score is not None else calculate_score_from_evaluation(eval_obj)
+        yield {"type": "result", "evaluation": eval_obj, "recommended_answer": "", "total_score": total_score}
+        return
+
+    governed = govern_evaluation_answer(question, answer)
+    answer = governed.text
+    if config.eager_recommended_answer:
+        eval_obj, rec_answer = yield from _stream_eager_evaluation(llm_client, question, answer)
+    else:
+        # 채점(짧은 JSON)과 추천 답변 생성을 동시에 진행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            grading = executor.submit(_grade_answer_cached, llm_client, question, answer)
+            parts = []
+            for text in stream_recommended_answer(question, answer, llm_client):
+                parts.append(text)
+                yield {"type": "token", "text": text}
+            eval_obj, _ = grading.result()
+        rec_answer = clean_llm_response("".join(parts))
+
+    yield {
+        "type": "result",
+        "evaluation": eval_obj,
+        "recommended_answer": rec_answer,
+        "total_score": calculate_score_from_evaluation(eval_obj),
+        "prompt_trim": governed.to_dict() if governed.trimmed else None,
+    }
+
+
+def _stream_eager_evaluation(llm_client: LLMClient, question: str, answer: str):
+    """채점과 추천 답변을 한 번의 JSON 응답으로 스트리밍 (token 이벤트를 내보내고 (evaluation, 추천 답변)을 반환)"""
+    config = llm_client.config
+    cache = open_evaluation_cache(config)
+    cache_key = evaluation_cache_key(question, answer, config.model + "+answer")
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        return cached["evaluation"], cached["recommended_answer"]
+
+    extractor = JsonFieldStreamExtractor("recommended_answer")
+    chunks = []
+    try:
+        for chunk in llm_client.stream(
+            build_evaluation_prompt(question, answer),
+            system=EVALUATION_SYSTEM_PROMPT,
+            format=llm_client.structured_format(EVALUATION_SCHEMA),
+        ):
+            chunks.append(chunk)
+            text = extractor.feed(chunk)
+            if text:
+                yield {"type": "token", "text": text}
+        data = llm_client.parse_structured(
+            "".join(chunks),
+            EVALUATION_SCHEMA,
+            validate=lambda d: isinstance(d, dict) and is_complete_evaluation(d.get("evaluation")),
+        )
+    except Exception as e:
+        logger.error(f"Streaming LLM evaluation failed: {e}")
+        data = None
+
+    if data is None:
+        return _error_evaluation(), RECOMMENDED_ANSWER_ERROR
+    eval_obj, rec_answer = data["evaluation"], data.get("recommended_answer", "")
+    if cache is not None:
+        cache.set(cache_key, {"evaluation": eval_obj, "recommended_answer": rec_answer})
+    return eval_obj, rec_answer
+
+
+def _grade_answer_cached(llm_client: LLMClient, question: str, answer: str) -> Tuple[dict, str]:
+    """채점 전용 평가를 캐시와 함께 수행 (evaluate_and_save_responses와 같은 캐시 키 사용)"""
+    config = llm_client.config
+    cache = open_evaluation_cache(config)
+    cache_key = evaluation_cache_key(question, answer, config.model)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        return cached["evaluation"], cached["recommended_answer"]
+    grading = _grade_answer(llm_client, 1, question, answer)
+    if cache is not None and not _is_error_evaluation(grading[0]):
+        cache.set(cache_key, {"evaluation": grading[0], "recommended_answer": grading[1]})
+    return grading
+
+
+def build_recommended_answer_prompt(question: str, answer: str = "") -> str:
+    prompt = f"Question:\n{question}\n"
+    if answer.strip():
+        prompt += f"\nCandidate's Answer:\n{answer}\n"
+    return prompt
+
+
+def recommended_answer_cache_key(question: str, answer: str, model: str) -> str:
+    # 평가 캐시와 같은 저장소를 쓰므로 접두어로 구분
+    return "recommended:" + evaluation_cache_key(question, answer, model)
+
+
+def generate_recommended_answer(question: str, answer: str = "", llm_client: Optional[LLMClient] = None) -> str:
+    """
+    질문(과 지원자 답변)에 대한 추천 답변을 생성합니다. 평가와 별개로 요청 시에만 호출되며
+    결과는 평가 캐시에 저장되어 같은 질문/답변에 대해 다시 생성하지 않습니다.
+    """
+    return "".join(stream_recommended_answer(question, answer, llm_client)).strip()
+
+
+def stream_recommended_answer(
+    question: str, answer: str = "", llm_client: Optional[LLMClient] = None
+) -> Iterator[str]:
+    """
+    추천 답변을 생성되는 대로 텍스트 조각으로 내보냅니다 (캐시에 있으면 한 번에 전체를 내보냄).
+    생성이 실패하면 오류 안내 문구를 내보내고, 그 결과는 캐시에 저장하지 않습니다.
+    """
+    llm_client = llm_client or LLMClient(LlamaConfig(), caller="recommended_answer")
+    config = llm_client.config
+    if answer.strip():
+        answer = govern_evaluation_answer(question, answer).text
+    cache = open_evaluation_cache(config)
+    cache_key = recommended_answer_cache_key(question, answer, config.model)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    try:
+        for chunk in llm_client.stream(
+            build_recommended_answer_prompt(question, answer),
+            system=RECOMMENDED_ANSWER_SYSTEM_PROMPT,
+            caller="recommended_answer",
+        ):
+            parts.append(chunk)
+            yield chunk
+    except Exception as e:
+        logger.error(f"Recommended answer generation failed: {e}")
+        if not parts:
+            yield RECOMMENDED_ANSWER_ERROR
+        return
+
+    text = clean_llm_response("".join(parts))
+    if cache is not None and text:
+        cache.set(cache_key, text)
+
+
+def _evaluate_response(
+    llm_client: LLMClient,
+    stt_client: STTClient,
+    idx: int,
+    question: str,
+    answer: str,
+    audio_path: str,
+    grading: Optional[Tuple[dict, str]] = None,
+    triage: Optional[TriageResult] = None,
+    cascade_client: Optional[LLMClient] = None,
+    governed: Optional[GovernedAnswer] = None,
+    word_timestamps: Optional[List[Dict]] = None
+) -> dict:
+    """
+    질문 하나에 대한 평가 결과(평가 항목, 추천 답변, 오디오 지표, 총점)를 만듭니다.
+    evaluate_and_save_responses에서 질문별로 동시에 실행됩니다.
+    grading((evaluation, recommended_answer))이 주어지면 LLM을 다시 호출하지 않습니다.
+    triage가 주어지면(사전 분류에서 걸러진 답변) LLM 없이 고정된 낮은 평가를 사용합니다.
+    cascade_client가 주어지면 작은 모델로 먼저 평가하고 필요할 때만 llm_client로 재평가합니다.
+    LLM에는 governed(없으면 여기서 만듦)의 예산에 맞게 줄인 답변을 보내고, 줄인 내역은 prompt_trim에 남깁니다.
+    word_timestamps(답변의 STT 단어 목록)가 주어지면 침묵 시간 계산에 재인식 없이 사용합니다.
+    """
+    # 2) 빈 답변에 대해서는 LLM 호출 없이 낮은 평가 처리
+    if not answer.strip():
+        try:
+            total_time = calculate_audio_duration(audio_path)
+            # 빈 답변의 경우 전체가 침묵으로 간주
+            silence = total_time
+        except Exception as e:
+            logger.warning(f"Audio duration calculation failed for {audio_path}: {e}")
+            total_time = 0.0
+            silence = 0.0
+            
+        return {
+            "question": question,
+            "user_answer": "",
+            "evaluation": {
+                "relevance":      {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
+                "completeness":   {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
+                "correctness":    {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
+                "clarity":        {"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
+                "professionalism":{"rating": "낮음", "comment": "응답이 제공되지 않았습니다."},
+            },
+            "recommended_answer": "",
+            "total_response_time": total_time,
+            "silence_duration":    silence,
+            "total_score": 0  # 빈 답변은 0점
+        }
+
+    # 3~4) LLM 평가 (사전 분류된 답변은 생략, 다중 질문 모드에서 이미 평가된 경우 그대로 사용)
+    if triage is not None:
+        eval_obj, rec_answer = triage.evaluation(), ""
+        print(f"🩺 Q{idx} 사전 분류({triage.reason}): {triage.comment}")
+    else:
+        if governed is None:
+            governed = govern_evaluation_answer(question, answer, idx=idx)
+        if grading is None:
+            if cascade_client is not None:
+                grading = _grade_with_cascade(llm_client, cascade_client, idx, question, governed.text)
+            else:
+                grading = _grade_answer(llm_client, idx, question, governed.text)
+        eval_obj, rec_answer = grading
+
+    # === 점수 계산 추가 ===
+    if triage is not None and triage.score is not None:
+        total_score = triage.score
+    else:
+        total_score = calculate_score_from_evaluation(eval_obj)
+    print(f"📊 계산된 점수: {total_score}점")
+
+    # 5) 오디오 지표 계산
+    try:
+        total_time = calculate_audio_duration(audio_path)
+    except Exception as e:
+        logger.warning(f"Audio duration calculation failed for {audio_path}: {e}")
+        total_time = 0.0
+
+    speaking = None
+    try:
+        if stt_client.config.vad_filter:
+            # VAD 모드: 음성 구간에서 직접 침묵/발화 시간 계산 (Whisper 재디코딩 없음)
+            speech_segments = stt_client.detect_speech(audio_path)
+            silence = calculate_silence_from_speech(speech_segments, total_time)
+            speaking = calculate_speaking_duration(speech_segments)
+        else:
+            # STT 결과에서 침묵 시간 계산 (단어 타임스탬프 필요, 호출자가 넘긴 경우 재사용)
+            stt_timestamps = word_timestamps if word_timestamps is not None else stt_client.transcribe(audio_path)
+            if stt_timestamps:
+                silence = calculate_silence_duration(stt_timestamps)
+            else:
+                silence = 0.0
+    except Exception as e:
+        logger.warning(f"Silence calculation failed for {audio_path}: {e}")
+        silence = 0.0
+
+    return {
+        "question": question,
+        "user_answer": answer,
+        "evaluation": eval_obj,
+        "recommended_answer": rec_answer,
+        "total_response_time": total_time,
+        "silence_duration": silence,
+        "speaking_duration": speaking,
+        "triage_reason": triage.reason if triage is not None else None,
+        "prompt_trim": governed.to_dict() if governed is not None and governed.trimmed else None,
+        "total_score": total_score  # 총점 추가
+    }
+
+def _cascade_enabled(llm_config: LlamaConfig) -> bool:
+    return bool(llm_config.cascade_model) and llm_config.cascade_model != llm_config.model
+
+
+def make_cascade_client(llm_config: LlamaConfig) -> Optional[LLMClient]:
+    """cascade_model이 설정된 경우 1차 평가용 작은 모델 클라이언트 (같은 호스트/재시도 설정 사용)"""
+    if not _cascade_enabled(llm_config):
+        return None
+    return LLMClient(replace(llm_config, model=llm_config.cascade_model), caller="evaluation:cascade")
+
+
+def evaluation_model_tag(llm_config: LlamaConfig) -> str:
+    """
+    캐시 키에 쓰는 모델 식별자. 단계적 평가에서는 결과가 작은 모델 또는 큰 모델에서 나올 수 있으므로
+    두 모델과 재평가 구간/등급 경계 여유를 함께 포함해 단일 모델 평가 결과와 섞이지 않게 합니다.
+    추천 답변을 함께 생성하는 모드의 결과도 채점 전용 결과와 구분합니다.
+    """
+    tag = llm_config.model
+    if _cascade_enabled(llm_config):
+        low, high = llm_config.cascade_band
+        tag = f"{llm_config.cascade_model}>{llm_config.model}[{low}-{high}±{llm_config.cascade_grade_margin}]"
+    if llm_config.eager_recommended_answer:
+        tag += "+answer"
+    return tag
+
+
+def _needs_escalation(eval_obj, llm_config: LlamaConfig) -> bool:
+    """
+    작은 모델 결과가 깨졌거나, 총점이 cascade_band 안이거나, GRADE_LADDER의 등급 경계에서
+    cascade_grade_margin 이내(경계 t에 대해 t - margin <= 점수 < t + margin)이면 큰 모델로 재평가
+    """
+    if _is_error_evaluation(eval_obj):
+        return True
+    score = calculate_score_from_evaluation(eval_obj)
+    low, high = llm_config.cascade_band
+    if low <= score <= high:
+        return True
+    margin = llm_config.cascade_grade_margin
+    return any(threshold - margin <= score < threshold + margin for threshold, _ in GRADE_LADDER)
+
+
+def _grade_with_cascade(
+    llm_client: LLMClient, cascade_client: LLMClient, idx: int, question: str, answer: str
+) -> Tuple[dict, str]:
+    grading = _grade_answer(cascade_client, idx, question, answer)
+    if not _needs_escalation(grading[0], llm_client.config):
+        print(f"✅ Q{idx} 1차 평가({cascade_client.config.model}) 확정")
+        return grading
+    print(f"⬆️ Q{idx} 경계 구간/오류 → {llm_client.config.model}로 재평가")
+    return _grade_answer(llm_client, idx, question, answer)
+
+
+def _triage_item(
+    stt_client: STTClient,
+    answer: str,
+    audio_path: str,
+    config: TriageConfig,
+    word_timestamps: Optional[List[Dict]] = None,
+) -> TriageResult:
+    """
+    텍스트 규칙으로 먼저 분류하고, 통과한 답변만 녹음 길이 대비 발화 비율과 단어 신뢰도로 다시 확인합니다.
+    word_timestamps(답변을 만든 STT 결과)가 없으면 오디오를 다시 인식하므로,
+    전사 캐시에 없는 경우(다른 디코딩 경로 등) Whisper 디코딩이 한 번 더 일어납니다.
+    """
+    result = triage_answer(answer, config=config)
+    if not result.substantive:
+        return result
+    try:
+        total_time = calculate_audio_duration(audio_path)
+        words = word_timestamps if word_timestamps is not None else stt_client.transcribe(audio_path)
+    except Exception as e:
+        logger.warning(f"Triage audio signals unavailable for {audio_path}: {e}")
+        return result
+    return triage_answer(answer, words, total_time, config)
+
+
+def govern_evaluation_answer(
+    question: str,
+    answer: str,
+    config: Optional[PromptGovernorConfig] = None,
+    idx: Optional[int] = None,
+) -> GovernedAnswer:
+    """
+    평가 사용자 프롬프트(질문 + 답변)가 config.prompt_token_budget에 맞도록 답변을 줄입니다.
+    질문과 프롬프트 틀이 차지하는 토큰을 뺀 나머지가 답변 예산이며, 줄인 경우 내역을 로그로 남깁니다.
+    질문은 줄이지 않으므로 제한은 답변에만 적용됩니다: 질문이 길어 답변 예산이 MIN_ANSWER_TOKENS보다
+    작아지면 답변은 MIN_ANSWER_TOKENS까지 남기고, 프롬프트는 예산을 넘을 수 있습니다 (경고 로그).
+    """
+    config = config or PromptGovernorConfig()
+    budget = config.prompt_token_budget
+    if budget > 0:
+        overhead = estimate_tokens(build_evaluation_prompt(question, ""))
+        if budget - overhead < MIN_ANSWER_TOKENS:
+            logger.warning(
+                f"Question prompt uses {overhead} of {budget} tokens; "
+                f"keeping {MIN_ANSWER_TOKENS} answer tokens, prompt may exceed the budget"
+            )
+        budget = max(MIN_ANSWER_TOKENS, budget - overhead)
+    governed = govern_answer(answer, question, budget, config)
+    if governed.trimmed:
+        label = f"Q{idx} " if idx is not None else ""
+        print(f"✂️ {label}답변 압축: {governed.summary()}")
+        logger.info("prompt_trim %s", json.dumps(
+            {key: value for key, value in governed.to_dict().items() if key != "text"}, ensure_ascii=False
+        ))
+    return governed
+
+
+def build_evaluation_prompt(question: str, answer: str) -> str:
+    """
+    질문/답변 한 쌍에 대한 평가 사용자 프롬프트
+    (루브릭과 출력 형식은 EVALUATION_SYSTEM_PROMPT로 고정되어 호출 간 캐시됨)
+    """
+    return f"Question:\n{question}\n\nCandidate's Answer:\n{answer}\n"
+
+
+def build_batch_evaluation_prompt(pairs: List[Tuple[str, str]]) -> str:
+    """여러 질문/답변 쌍에 번호를 붙인 사용자 프롬프트 (BATCH_EVALUATION_SYSTEM_PROMPT와 함께 사용)"""
+    return "".join(
+        f"[{i}]\nQuestion:\n{question}\n\nCandidate's Answer:\n{answer}\n\n"
+        for i, (question, answer) in enumerate(pairs, start=1)
+    )
+
+
+def evaluation_cache_key(question: str, answer: str, model: str) -> str:
+    """
+    평가 캐시 키: 질문, 공백을 정규화한 답변, 모델, 평가 프롬프트 버전의 해시
+    """
+    normalized_answer = " ".join(answer.split())
+    payload = "\x1f".join([EVALUATION_PROMPT_VERSION, model, question.strip(), normalized_answer])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_error_evaluation(eval_obj) -> bool:
+    if not isinstance(eval_obj, dict) or not eval_obj:
+        return True
+    return any(isinstance(v, dict) and v.get("rating") == "분석불가" for v in eval_obj.values())
+
+
+def _error_evaluation() -> dict:
+    # 기본 평가 구조 제공 (LLM/JSON 오류)
+    return {
+        "relevance":      {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
+        "completeness":   {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
+        "correctness":    {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
+        "clarity":        {"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
+        "professionalism":{"rating": "분석불가", "comment": "AI 분석 오류로 평가할 수 없습니다."},
+    }
+
+
+def is_complete_evaluation(eval_obj) -> bool:
+    """다섯 가지 평가 기준이 모두 rating과 함께 들어 있는지 확인"""
+    return isinstance(eval_obj, dict) and all(
+        isinstance(eval_obj.get(name), dict) and eval_obj[name].get("rating")
+        for name in EVALUATION_CRITERIA
+    )
+
+
+def _grade_answer(llm_client: LLMClient, idx: int, question: str, answer: str) -> Tuple[dict, str]:
+    """
+    질문 하나를 LLM으로 평가해 (evaluation, recommended_answer)를 반환합니다.
+    기본은 채점만 하며(recommended_answer는 ""), eager_recommended_answer 설정 시 추천 답변도 함께 생성합니다.
+    JSON 스키마로 출력을 제약하고, 깨진 응답은 한 번 복구를 요청합니다.
+    그래도 실패하면 '분석불가' 평가를 반환합니다.
+    """
+    eager = llm_client.config.eager_recommended_answer
+    prompt = build_evaluation_prompt(question, answer)
+    try:
+        data = llm_client.call_structured(
+            prompt,
+            EVALUATION_SCHEMA if eager else GRADING_SCHEMA,
+            system=EVALUATION_SYSTEM_PROMPT if eager else GRADING_SYSTEM_PROMPT,
+            validate=lambda d: isinstance(d, dict) and is_complete_evaluation(d.get("evaluation")),
+        )
+        if data is None:
+            raise ValueError("LLM 응답에서 유효한 평가 JSON을 얻지 못했습니다")
+        eval_obj = data["evaluation"]
+        rec_answer = data.get("recommended_answer", "")
+        print(f"✅ JSON 파싱 성공, evaluation 타입: {type(eval_obj)}")
+        return eval_obj, rec_answer
+    except Exception as e:
+        logger.error(f"LLM evaluation failed for question {idx}: {e}")
+        print(f"❌ LLM/JSON 파싱 오류: {e}")
+        return _error_evaluation(), RECOMMENDED_ANSWER_ERROR if eager else ""
+
+
+def parse_batch_evaluations(data, count: int) -> Dict[int, dict]:
+    """
+    다중 질문 평가 응답을 질문 번호(1부터) → {"evaluation", "recommended_answer"}로 매핑합니다.
+    {"evaluations": [...]} 또는 순수 배열을 모두 허용하고, index가 없으면 배열 순서를 사용합니다.
+    형식이 잘못된 항목과 범위를 벗어난 번호는 건너뜁니다.
+    """
+    entries = data.get("evaluations") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+    parsed: Dict[int, dict] = {}
+    for position, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict) or not is_complete_evaluation(entry.get("evaluation")):
+            continue
+        try:
+            index = int(entry.get("index", position))
+        except (TypeError, ValueError):
+            index = position
+        if 1 <= index <= count and index not in parsed:
+            parsed[index] = entry
+    return parsed
+
+
+def _grade_batch(llm_client: LLMClient, batch: List[tuple]) -> Dict[int, Tuple[dict, str]]:
+    """
+    여러 질문을 한 번의 LLM 호출로 평가합니다. 응답에서 빠졌거나 깨진 질문만
+    개별 호출로 다시 평가하므로, 부분 실패가 전체 실패로 번지지 않습니다.
+
+    :param batch: (idx, question, answer, audio_path) 목록
+    :return: 질문 idx → (evaluation, recommended_answer)
+    """
+    parsed: Dict[int, dict] = {}
+    eager = llm_client.config.eager_recommended_answer
+    prompt = build_batch_evaluation_prompt([(question, answer) for _, question, answer, _ in batch])
+    try:
+        data = llm_client.call_structured(
+            prompt,
+            BATCH_EVALUATION_SCHEMA if eager else BATCH_GRADING_SCHEMA,
+            system=BATCH_EVALUATION_SYSTEM_PROMPT if eager else BATCH_GRADING_SYSTEM_PROMPT,
+            validate=lambda d: bool(parse_batch_evaluations(d, len(batch))),
+        )
+        parsed = parse_batch_evaluations(data, len(batch)) if data is not None else {}
+        print(f"✅ 다중 질문 평가: {len(parsed)}/{len(batch)}개 파싱 성공")
+    except Exception as e:
+        logger.error(f"Batch LLM evaluation failed for {len(batch)} questions: {e}")
+
+    gradings: Dict[int, Tuple[dict, str]] = {}
+    for position, (idx, question, answer, _) in enumerate(batch, start=1):
+        entry = parsed.get(position)
+        if entry is None:
+            logger.warning(f"Batch evaluation missing Q{idx}, re-evaluating individually")
+            gradings[idx] = _grade_answer(llm_client, idx, question, answer)
+        else:
+            gradings[idx] = (entry["evaluation"], entry.get("recommended_answer", ""))
+    return gradings
+
 
 def calculate_score_from_evaluation(evaluation_obj):
     """
     평가 결과에서 숫자 점수를 계산합니다.
     각 평가 항목의 rating을 점수로 변환하여 총점을 계산합니다.
     더 엄격한 기준을 적용하여 정확한 평가를 제공합니다.
+    (저장된 평가를 대량으로 다시 계산할 때는 rescoring.score_codes를 사용)
     """
     try:
         if not isinstance(evaluation_obj, dict):
             return 0
         
-        # 각 평가 항목별 점수 매핑 (더 엄격한 기준 적용)
-        rating_scores = {
-            "매우 높음": 18,    # 탁월한 평가 (거의 완벽)
-            "높음": 14,         # 우수한 평가 (좋은 수준)
-            "보통": 10,         # 평균적인 평가 (기본 수준)
-            "낮음": 6,          # 부족한 평가 (개선 필요)
-            "매우 낮음": 2,     # 매우 부족한 평가 (심각한 문제)
-            "분석불가": 0       # 분석 오류 (점수 없음)
-        }
+        rating_scores = dict(RATING_SCORES)
         
         # 기존 3단계 평가도 지원 (하위 호환성)
-        if any(rating in ["높음", "보통", "낮음"] for rating in 
+        if any(rating in LEGACY_RATING_SCORES for rating in 
                [evaluation_obj.get(k, {}).get('rating', '') for k in evaluation_obj.keys()]):
-            rating_scores.update({
-                "높음": 12,     # 기존 "높음"을 더 엄격하게
-                "보통": 8,      # 기존 "보통"을 더 엄격하게  
-                "낮음": 4,      # 기존 "낮음"을 더 엄격하게
-            })
+            rating_scores.update(LEGACY_RATING_SCORES)
         
         total_score = 0
         evaluated_items = 0
         
         # 5개 평가 항목별 가중치 적용
-        evaluation_criteria = {
-            "relevance": 1.2,      # 관련성 (가장 중요)
-            "completeness": 1.1,   # 완전성 (중요)
-            "correctness": 1.1,    # 정확성 (중요)
-            "clarity": 1.0,        # 명확성 (기본)
-            "professionalism": 0.8 # 전문성 (기본보다 낮음)
-        }
-        
-        for criterion, weight in evaluation_criteria.items():
+        for criterion, weight in CRITERIA_WEIGHTS.items():
             if criterion in evaluation_obj:
                 criterion_data = evaluation_obj[criterion]
                 if isinstance(criterion_data, dict):
-                    rating = criterion_data.get('rating', '낮음')
-                    base_score = rating_scores.get(rating, 4)  # 기본값을 더 낮게
+                    rating = criterion_data.get('rating', DEFAULT_RATING)
+                    base_score = rating_scores.get(rating, DEFAULT_RATING_SCORE)
                     weighted_score = base_score * weight
                     total_score += weighted_score
                     evaluated_items += 1
@@ -290,8 +930,7 @@ def calculate_score_from_evaluation(evaluation_obj):
         
         # 최종 점수 계산 (100점 만점으로 변환)
         if evaluated_items > 0:
-            # 최대 가능 점수 계산 (매우 높음 18점 기준)
-            max_possible_score = sum(18 * weight for weight in evaluation_criteria.values())
+            max_possible_score = sum(MAX_RATING_SCORE * weight for weight in CRITERIA_WEIGHTS.values())
             # 100점 만점으로 환산
             final_score = int((total_score / max_possible_score) * 100)
             final_score = max(0, min(100, final_score))  # 0-100 범위 제한
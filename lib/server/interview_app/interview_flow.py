@@ -16,7 +16,7 @@ from .resume_parser import ResumeJsonParser
 from .question_maker import InterviewQuestionMaker
 from .video_recorder import VideoRecorder
 from .audio_recorder import AudioRecorder
-from .stt import STTClient, calculate_silence_duration, calculate_audio_duration
+from .stt import STTClient, StreamingTranscriber, calculate_silence_duration, calculate_audio_duration
 from .evaluation import evaluate_and_save_responses
 
 console = Console()
@@ -54,8 +54,9 @@ def display_questions_with_tts_and_evaluation(
         time.sleep(len(audio) / 1000.0 + 0.5)
         os.remove(mp3_file)
 
-        # Record user response via microphone
-        recorder = AudioRecorder()
+        # Record user response via microphone (speech chunks are transcribed while recording)
+        transcriber = StreamingTranscriber(stt_client)
+        recorder = AudioRecorder(on_speech_chunk=transcriber.submit)
         recorder.record_start()
         
         while recorder.recording:
@@ -63,7 +64,10 @@ def display_questions_with_tts_and_evaluation(
         response_audio_file = recorder.record_stop(denoise_value=0.0, output_file=f"response_{idx}.wav")
         audio_files.append(response_audio_file)  # Save the audio file path
         
-        word_timestamps = stt_client.transcribe(response_audio_file)
+        word_timestamps = transcriber.finish()
+        if word_timestamps is None:
+            # Incremental STT failed: fall back to a full pass over the saved file
+            word_timestamps = stt_client.transcribe(response_audio_file)
         response_text = " ".join(item['word'] for item in word_timestamps)
         answers.append(response_text)  # Save the user's response
         if "그만하겠습니다" in response_text.strip().lower():
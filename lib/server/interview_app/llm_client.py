@@ -1,12 +1,19 @@
 # llm_client.py
 # Wrapper around the Ollama LLM for prompt execution and response cleaning
 
+import re
 import json
+import time
+import random
 import logging
-from typing import Optional
+import threading
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_ollama import OllamaLLM
 from .config import LlamaConfig
+from .cassette import Cassette, cassette_key, open_cassette
 
 logger = logging.getLogger(__name__)
 
@@ -28,29 +35,454 @@ def clean_llm_response(response: str) -> str:
     return text.strip()
 
 
+def parse_json_tolerant(text: str) -> Optional[Any]:
+    """
+    Parse the first JSON object/array in an LLM response, tolerating common damage:
+    code fences or prose around the JSON, trailing commas, and output that was cut off
+    mid-way (unterminated string, dangling key, unclosed brackets).
+    Returns None if nothing usable can be recovered.
+    """
+    text = clean_llm_response(text)
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return None
+    text = text[min(starts):]
+
+    # Single pass: copy characters, drop commas that directly precede a closing bracket,
+    # and remember the open-bracket stack plus the last position where truncation is safe.
+    out = []
+    stack = []
+    in_string = escaped = False
+    safe_cut = None  # (len(out), stack copy) just before a top-level-of-container comma
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            # remove a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                break
+            continue
+        elif ch == ",":
+            safe_cut = (len(out), list(stack))
+        out.append(ch)
+
+    candidate = "".join(out)
+    if not stack and not in_string:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+
+    # Truncated output: close the open string/brackets; if the tail is a dangling key
+    # or value, fall back to the last complete element before a comma.
+    attempts = [candidate + ('"' if in_string else "") + "".join(reversed(stack))]
+    if safe_cut is not None:
+        cut, cut_stack = safe_cut
+        attempts.append("".join(out[:cut]) + "".join(reversed(cut_stack)))
+    for attempt in attempts:
+        try:
+            return json.loads(attempt)
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+_JSON_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JsonFieldStreamExtractor:
+    """
+    Incrementally extract the value of one top-level string field from streamed JSON.
+
+    feed() takes raw LLM chunks as they arrive and returns the newly decoded characters
+    of the field's value (escape sequences split across chunks are handled), so the
+    value can be forwarded to a client while the rest of the JSON is still generating.
+    """
+    def __init__(self, field: str):
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._pos = 0          # next unread index in _buffer once inside the value
+        self.started = False
+        self.done = False
+
+    def feed(self, chunk: str) -> str:
+        if self.done:
+            return ""
+        self._buffer += chunk
+        if not self.started:
+            match = self._key.search(self._buffer)
+            if match is None:
+                return ""
+            self.started = True
+            self._pos = match.end()
+
+        out = []
+        buf = self._buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self.done = True
+                i += 1
+                break
+            if ch == "\\":
+                if i + 1 >= len(buf):
+                    break  # wait for the rest of the escape sequence
+                esc = buf[i + 1]
+                if esc == "u":
+                    if i + 6 > len(buf):
+                        break
+                    try:
+                        out.append(chr(int(buf[i + 2:i + 6], 16)))
+                    except ValueError:
+                        pass
+                    i += 6
+                else:
+                    out.append(_JSON_ESCAPES.get(esc, esc))
+                    i += 2
+                continue
+            out.append(ch)
+            i += 1
+        self._pos = i
+        return "".join(out)
+
+
+# Ollama가 보고한 load_duration이 이보다 길면 모델을 (다시) 메모리에 올린 호출로 간주
+MODEL_LOAD_THRESHOLD_SEC = 0.5
+
+
+@dataclass
+class LLMCallMetrics:
+    """
+    Performance data for one LLM call, taken from the metadata Ollama returns with the
+    final response (durations are reported in nanoseconds and converted to seconds).
+    """
+    caller: str
+    model: str
+    endpoint: str
+    success: bool
+    stream: bool = False
+    wall_sec: float = 0.0
+    prompt_tokens: int = 0
+    prompt_eval_sec: float = 0.0
+    output_tokens: int = 0
+    eval_sec: float = 0.0
+    load_sec: float = 0.0
+    total_sec: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def tokens_per_sec(self) -> float:
+        return self.output_tokens / self.eval_sec if self.eval_sec > 0 else 0.0
+
+    @property
+    def prompt_tokens_per_sec(self) -> float:
+        return self.prompt_tokens / self.prompt_eval_sec if self.prompt_eval_sec > 0 else 0.0
+
+    @property
+    def model_loaded(self) -> bool:
+        return self.load_sec >= MODEL_LOAD_THRESHOLD_SEC
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.update(
+            tokens_per_sec=round(self.tokens_per_sec, 2),
+            prompt_tokens_per_sec=round(self.prompt_tokens_per_sec, 2),
+            model_loaded=self.model_loaded,
+        )
+        return data
+
+
+_metrics_hooks: List[Callable[[LLMCallMetrics], None]] = []
+
+
+def add_metrics_hook(hook: Callable[[LLMCallMetrics], None]) -> None:
+    """Register a function called with LLMCallMetrics after every LLM call (any LLMClient)."""
+    _metrics_hooks.append(hook)
+
+
+def remove_metrics_hook(hook: Callable[[LLMCallMetrics], None]) -> None:
+    if hook in _metrics_hooks:
+        _metrics_hooks.remove(hook)
+
+
+def _emit_metrics(metrics: LLMCallMetrics) -> None:
+    # 구조화 로그: 한 줄 JSON으로 남겨 수집/집계가 쉽도록 함
+    logger.info("llm_call %s", json.dumps(metrics.to_dict(), ensure_ascii=False))
+    if metrics.success and metrics.model_loaded:
+        logger.info(f"Model {metrics.model} was loaded on {metrics.endpoint} ({metrics.load_sec:.2f}s)")
+    for hook in list(_metrics_hooks):
+        try:
+            hook(metrics)
+        except Exception as e:
+            logger.warning(f"LLM metrics hook failed: {e}")
+
+
+class _GenerationInfoCallback(BaseCallbackHandler):
+    """Collects Ollama's final-response metadata (generation_info) for one call."""
+    def __init__(self):
+        self.generation_info: dict = {}
+
+    def on_llm_end(self, response, **kwargs) -> None:
+        try:
+            self.generation_info = response.generations[0][0].generation_info or {}
+        except (AttributeError, IndexError):
+            self.generation_info = {}
+
+
+def _ns_to_sec(value) -> float:
+    return (value or 0) / 1e9
+
+
+class _Endpoint:
+    """
+    Routing state of one Ollama server, shared by every LLMClient in the process:
+    requests in flight, consecutive failures and the circuit-breaker deadline.
+    """
+    def __init__(self, host: Optional[str]):
+        self.host = host  # None = ollama default (OLLAMA_HOST or localhost:11434)
+        self.in_flight = 0
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.host or "default"
+
+
+# 카세트 재생 시 성능 지표에 표시되는 엔드포인트 (라우팅/서킷 브레이커와 무관)
+_CASSETTE_ENDPOINT = _Endpoint("cassette")
+
+_endpoints: Dict[Optional[str], _Endpoint] = {}
+_llm_instances: Dict[tuple, OllamaLLM] = {}
+_endpoint_lock = threading.Lock()
+
+
+def _get_endpoint(host: Optional[str]) -> _Endpoint:
+    with _endpoint_lock:
+        if host not in _endpoints:
+            _endpoints[host] = _Endpoint(host)
+        return _endpoints[host]
+
+
+def _get_llm(host: Optional[str], config: LlamaConfig) -> OllamaLLM:
+    """
+    One OllamaLLM per (host, generation settings), reused across LLMClient instances so the
+    underlying HTTP client keeps its pooled keep-alive connections between calls.
+    """
+    key = (
+        host, config.model, config.temperature, config.max_new_tokens, config.top_p,
+        config.frequency_penalty, config.presence_penalty, config.keep_alive, config.request_timeout_sec,
+    )
+    with _endpoint_lock:
+        llm = _llm_instances.get(key)
+        if llm is None:
+            llm = OllamaLLM(
+                model=config.model,
+                base_url=host,
+                temperature=config.temperature,
+                max_new_tokens=config.max_new_tokens,
+                top_p=config.top_p,
+                frequency_penalty=config.frequency_penalty,
+                presence_penalty=config.presence_penalty,
+                keep_alive=config.keep_alive,
+                client_kwargs={"timeout": config.request_timeout_sec},
+            )
+            _llm_instances[key] = llm
+        return llm
+
+
 class LLMClient:
     """
     Client to interact with OllamaLLM using a shared configuration.
+
+    With several config.hosts, each call goes to the healthy endpoint with the fewest
+    requests in flight; failed calls are retried on another endpoint with jittered
+    backoff, and an endpoint that keeps failing is skipped until its breaker resets.
+
+    With config.cassette_mode "record"/"replay", responses are saved to / served from
+    config.cassette_path so pipelines can run without a live model.
     """
-    def __init__(self, config: LlamaConfig):
+    def __init__(self, config: LlamaConfig, caller: str = "llm"):
         self.config = config
-        # Initialize OllamaLLM with parameters from config
-        self.llm = OllamaLLM(
+        # 성능 지표에 붙는 호출자 태그 (예: "evaluation", "ResumeJsonParser"), 호출마다 덮어쓸 수 있음
+        self.caller = caller
+        hosts = list(self.config.hosts) or [None]
+        self.endpoints: List[_Endpoint] = [_get_endpoint(host) for host in hosts]
+        # 첫 번째 엔드포인트의 OllamaLLM (단일 호스트 사용 시 기존과 동일)
+        self.llm = _get_llm(self.endpoints[0].host, self.config)
+        self.cassette: Optional[Cassette] = open_cassette(config.cassette_path, config.cassette_mode)
+
+    def _acquire(self, exclude: Tuple[_Endpoint, ...] = ()) -> _Endpoint:
+        """Pick the least-loaded endpoint whose breaker is closed (or due for a trial call)."""
+        now = time.monotonic()
+        with _endpoint_lock:
+            candidates = [ep for ep in self.endpoints if ep not in exclude] or self.endpoints
+            available = [ep for ep in candidates if ep.open_until <= now]
+            if available:
+                chosen = min(available, key=lambda ep: (ep.in_flight, ep.failures, random.random()))
+            else:
+                # 모든 엔드포인트 차단 중: 가장 먼저 풀리는 곳에 시도
+                chosen = min(candidates, key=lambda ep: ep.open_until)
+            chosen.in_flight += 1
+            return chosen
+
+    def _release(self, endpoint: _Endpoint, error: Optional[Exception]) -> None:
+        with _endpoint_lock:
+            endpoint.in_flight -= 1
+            if error is None:
+                endpoint.failures = 0
+                endpoint.open_until = 0.0
+                return
+            endpoint.failures += 1
+            if endpoint.failures >= self.config.breaker_failure_threshold:
+                endpoint.open_until = time.monotonic() + self.config.breaker_reset_sec
+                logger.warning(
+                    f"Ollama endpoint {endpoint.name} failed {endpoint.failures} times in a row, "
+                    f"skipping it for {self.config.breaker_reset_sec:.0f}s"
+                )
+
+    def _backoff(self, attempt: int) -> None:
+        # 지수 백오프 + 지터: 동시에 실패한 요청들이 같은 순간에 다시 몰리지 않도록 분산
+        delay = self.config.retry_backoff_sec * (2 ** attempt) * random.uniform(0.5, 1.5)
+        time.sleep(delay)
+
+    def _record(
+        self,
+        caller: Optional[str],
+        endpoint: _Endpoint,
+        start: float,
+        callback: _GenerationInfoCallback,
+        error: Optional[Exception] = None,
+        stream: bool = False,
+    ) -> LLMCallMetrics:
+        info = callback.generation_info
+        metrics = LLMCallMetrics(
+            caller=caller or self.caller,
             model=self.config.model,
-            temperature=self.config.temperature,
-            max_new_tokens=self.config.max_new_tokens,
-            top_p=self.config.top_p,
-            frequency_penalty=self.config.frequency_penalty,
-            presence_penalty=self.config.presence_penalty,
+            endpoint=endpoint.name,
+            success=error is None,
+            stream=stream,
+            wall_sec=round(time.perf_counter() - start, 3),
+            prompt_tokens=int(info.get("prompt_eval_count") or 0),
+            prompt_eval_sec=_ns_to_sec(info.get("prompt_eval_duration")),
+            output_tokens=int(info.get("eval_count") or 0),
+            eval_sec=_ns_to_sec(info.get("eval_duration")),
+            load_sec=_ns_to_sec(info.get("load_duration")),
+            total_sec=_ns_to_sec(info.get("total_duration")),
+            error=str(error) if error is not None else None,
         )
+        _emit_metrics(metrics)
+        return metrics
+
+    def _cassette_key(self, prompt: str, kwargs: dict) -> Optional[str]:
+        if self.cassette is None:
+            return None
+        return cassette_key(self.config.model, prompt, kwargs.get("system"), kwargs.get("format"))
+
+    def _replay(self, key: str, caller: Optional[str], stream: bool = False) -> List[str]:
+        """Recorded chunks for a request; metrics are reported with the recorded Ollama timings."""
+        start = time.perf_counter()
+        entry = self.cassette.lookup(key)
+        callback = _GenerationInfoCallback()
+        callback.generation_info = entry.get("generation_info", {})
+        self._record(caller, _CASSETTE_ENDPOINT, start, callback, stream=stream)
+        return entry["chunks"]
 
-    def call(self, prompt: str) -> str:
+    def _save_to_cassette(
+        self, key: Optional[str], prompt: str, chunks: List[str], callback: _GenerationInfoCallback,
+        caller: Optional[str],
+    ) -> None:
+        if key is None:
+            return
+        try:
+            self.cassette.record(
+                key, chunks, callback.generation_info,
+                model=self.config.model, prompt=prompt, caller=caller or self.caller,
+            )
+        except Exception as e:
+            # 녹화 실패가 실제 호출 결과를 버리게 하지는 않음
+            logger.warning(f"Failed to record LLM response to cassette: {e}")
+
+    def _invoke(self, prompt: str, caller: Optional[str] = None, **kwargs) -> str:
+        """Run one generation with routing, retries, circuit breaking and metrics."""
+        key = self._cassette_key(prompt, kwargs)
+        if key is not None and self.cassette.replaying:
+            return "".join(self._replay(key, caller))
+        tried: Tuple[_Endpoint, ...] = ()
+        for attempt in range(self.config.max_retries + 1):
+            endpoint = self._acquire(exclude=tried)
+            callback = _GenerationInfoCallback()
+            start = time.perf_counter()
+            try:
+                result = _get_llm(endpoint.host, self.config).invoke(
+                    prompt, config={"callbacks": [callback]}, **kwargs
+                )
+            except Exception as e:
+                self._release(endpoint, e)
+                self._record(caller, endpoint, start, callback, error=e)
+                logger.warning(f"LLM call to {endpoint.name} failed (attempt {attempt + 1}): {e}")
+                if attempt >= self.config.max_retries:
+                    raise
+                tried += (endpoint,)
+                self._backoff(attempt)
+                continue
+            self._release(endpoint, None)
+            metrics = self._record(caller, endpoint, start, callback)
+            self._save_to_cassette(key, prompt, [result], callback, caller)
+            if metrics.output_tokens:
+                print(
+                    f"⏱️ LLM 성능 [{metrics.caller}]: 프롬프트 {metrics.prompt_tokens}토큰 {metrics.prompt_eval_sec:.2f}초, "
+                    f"생성 {metrics.output_tokens}토큰 ({metrics.tokens_per_sec:.1f} tok/s)"
+                    + (f", 모델 로딩 {metrics.load_sec:.2f}초" if metrics.model_loaded else "")
+                )
+            return result
+
+    def call(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        format: Optional[Union[str, dict]] = None,
+        caller: Optional[str] = None,
+    ) -> str:
         """
         Send a prompt to the LLM and return the cleaned text response.
+
+        :param prompt: Per-call user prompt
+        :param system: Fixed system prompt; keeping it identical across calls lets Ollama
+                       reuse the cached prefix so only the user prompt is processed
+        :param format: Ollama output format: "json" or a JSON schema dict that constrains decoding
+        :param caller: Metrics tag for this call (defaults to the client's caller)
         """
+        kwargs = self._system_kwargs(system)
+        if format:
+            kwargs["format"] = format
         try:
             print(f"🤖 LLM 호출 시작: {self.config.model}")
-            raw = self.llm.invoke(prompt)
+            raw = self._invoke(prompt, caller=caller, **kwargs)
             print(f"✅ LLM 응답 받음: {len(raw)}자")
             cleaned = clean_llm_response(raw)
             print(f"🧹 응답 정리 완료: {len(cleaned)}자")
@@ -60,14 +492,163 @@ class LLMClient:
             logger.error(f"LLM call failed: {e}")
             raise
 
-    def call_json(self, prompt: str) -> Optional[dict]:
+    def call_json(
+        self, prompt: str, system: Optional[str] = None, caller: Optional[str] = None
+    ) -> Optional[dict]:
         """
         Send a prompt to the LLM, clean the response, and parse it as JSON.
         Returns None if parsing fails.
         """
-        text = self.call(prompt)
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+        text = self.call(prompt, system=system, caller=caller)
+        data = parse_json_tolerant(text)
+        if data is None:
             logger.error(f"Failed to parse LLM JSON response:\n{text}")
+        return data
+
+    def call_structured(
+        self,
+        prompt: str,
+        schema: dict,
+        system: Optional[str] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+        caller: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Call the LLM with decoding constrained to a JSON schema and return the parsed object.
+
+        The response goes through parse_json_tolerant. If it still cannot be parsed (or
+        validate rejects it), the broken output is sent back for repair up to
+        config.json_repair_attempts times - a short prompt without the system prompt,
+        so a repair costs roughly one re-read of the output rather than a full re-grade.
+        Returns None only if every attempt fails; LLM call errors propagate.
+        """
+        raw = self.call(prompt, system=system, format=self.structured_format(schema), caller=caller)
+        return self.parse_structured(raw, schema, validate, caller=caller)
+
+    def structured_format(self, schema: dict) -> Union[str, dict]:
+        """Ollama format value for a schema (plain "json" when structured_output is off)."""
+        return schema if self.config.structured_output else "json"
+
+    def parse_structured(
+        self,
+        raw: str,
+        schema: dict,
+        validate: Optional[Callable[[Any], bool]] = None,
+        caller: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Parse an already generated response (e.g. collected from stream()) with the same
+        tolerant parsing and bounded repair retry as call_structured.
+        """
+        fmt = self.structured_format(schema)
+        data = parse_json_tolerant(raw)
+        attempts = 0
+        while not self._is_valid(data, validate) and attempts < self.config.json_repair_attempts:
+            attempts += 1
+            logger.warning(f"LLM JSON response invalid, repair attempt {attempts}: {raw[:200]}")
+            print(f"🔧 JSON 복구 요청 ({attempts}회차)")
+            repair_prompt = (
+                "다음 텍스트는 아래 JSON 스키마를 따라야 하지만 형식이 깨져 있습니다. "
+                "내용은 그대로 유지하고 스키마에 맞는 올바른 JSON만 출력하세요.\n\n"
+                f"스키마:\n{json.dumps(schema, ensure_ascii=False)}\n\n"
+                f"텍스트:\n{raw}"
+            )
+            raw = self.call(repair_prompt, format=fmt, caller=f"{caller or self.caller}:repair")
+            data = parse_json_tolerant(raw)
+        if not self._is_valid(data, validate):
+            logger.error(f"Failed to obtain valid structured LLM response:\n{raw}")
             return None
+        return data
+
+    @staticmethod
+    def _is_valid(data: Any, validate: Optional[Callable[[Any], bool]]) -> bool:
+        if data is None:
+            return False
+        try:
+            return validate(data) if validate else True
+        except Exception:
+            return False
+
+    def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        format: Optional[Union[str, dict]] = None,
+        caller: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Stream the raw LLM response chunk by chunk as Ollama generates it.
+        Chunks are not cleaned; join them and use parse_json_tolerant/clean_llm_response at the end.
+        """
+        kwargs = self._system_kwargs(system)
+        if format:
+            kwargs["format"] = format
+        print(f"🤖 LLM 스트리밍 시작: {self.config.model}")
+        key = self._cassette_key(prompt, kwargs)
+        if key is not None and self.cassette.replaying:
+            yield from self._replay(key, caller, stream=True)
+            return
+        tried: Tuple[_Endpoint, ...] = ()
+        for attempt in range(self.config.max_retries + 1):
+            endpoint = self._acquire(exclude=tried)
+            callback = _GenerationInfoCallback()
+            start = time.perf_counter()
+            chunks: List[str] = []
+            try:
+                llm = _get_llm(endpoint.host, self.config)
+                for chunk in llm.stream(prompt, config={"callbacks": [callback]}, **kwargs):
+                    chunks.append(chunk)
+                    yield chunk
+            except Exception as e:
+                self._release(endpoint, e)
+                self._record(caller, endpoint, start, callback, error=e, stream=True)
+                # 이미 클라이언트에 전달한 토큰이 있으면 재시도하지 않음 (중복 출력 방지)
+                if chunks or attempt >= self.config.max_retries:
+                    print(f"❌ LLM 스트리밍 실패: {e}")
+                    logger.error(f"LLM stream failed on {endpoint.name}: {e}")
+                    raise
+                logger.warning(f"LLM stream to {endpoint.name} failed before first token (attempt {attempt + 1}): {e}")
+                tried += (endpoint,)
+                self._backoff(attempt)
+                continue
+            except GeneratorExit:
+                # 소비자가 스트림을 중단한 경우는 엔드포인트 실패가 아님
+                self._release(endpoint, None)
+                raise
+            self._release(endpoint, None)
+            self._record(caller, endpoint, start, callback, stream=True)
+            self._save_to_cassette(key, prompt, chunks, callback, caller)
+            return
+
+    def warm_up(self, system: Optional[str] = None) -> bool:
+        """
+        Load the model into every configured Ollama endpoint (kept resident for
+        config.keep_alive) and process the given system prompt once, so the first real
+        request pays neither cost. Returns True if at least one endpoint warmed up;
+        never raises when Ollama is unreachable. Skipped when replaying a cassette.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            return True
+        warmed = False
+        for endpoint in self.endpoints:
+            try:
+                start = time.perf_counter()
+                callback = _GenerationInfoCallback()
+                _get_llm(endpoint.host, self.config).invoke(
+                    "준비되었으면 '네'라고만 답하세요.",
+                    config={"callbacks": [callback]},
+                    **self._system_kwargs(system),
+                )
+                self._record("warm_up", endpoint, start, callback)
+                logger.info(
+                    f"LLM warm-up for {self.config.model} on {endpoint.name} finished in {time.perf_counter() - start:.2f}s"
+                )
+                warmed = True
+            except Exception as e:
+                logger.warning(f"LLM warm-up failed for {self.config.model} on {endpoint.name}: {e}")
+        return warmed
+
+    @staticmethod
+    def _system_kwargs(system: Optional[str]) -> dict:
+        # OllamaLLM forwards extra invoke() kwargs to Ollama's /api/generate
+        return {"system": system} if system else {}
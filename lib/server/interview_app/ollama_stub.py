@@ -0,0 +1,307 @@
+# ollama_stub.py
+# Local stand-in for the Ollama HTTP API with configurable latency/token rate, for benchmarks and load tests
+
+import re
+import json
+import time
+import random
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+
+from .cassette import Cassette, cassette_key
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\S+\s*|\s+")
+
+
+@dataclass
+class OllamaStubConfig:
+    """
+    Behaviour of the stand-in server. Timings imitate a real model: a one-time load per
+    model, prompt processing at prompt_tokens_per_sec, then first_token_latency_sec and
+    tokens_per_sec for generation (0 disables the corresponding delay).
+    """
+    host: str = field(default="127.0.0.1")
+    port: int = field(default=11434)
+    models: Tuple[str, ...] = field(default=("gemma3:4b",))
+    # 녹화된 카세트가 있으면 같은 요청에 녹화된 응답을 그대로 돌려줌
+    cassette_path: Optional[str] = field(default=None)
+    # 카세트에 없는 요청: format이 있으면 스키마에 맞는 최소 JSON, 없으면 이 텍스트
+    response_text: str = field(default="네, 준비되었습니다.")
+    load_sec: float = field(default=0.0)
+    prompt_tokens_per_sec: float = field(default=0.0)
+    first_token_latency_sec: float = field(default=0.05)
+    tokens_per_sec: float = field(default=50.0)
+    # 동시에 생성하는 요청 수 (OLLAMA_NUM_PARALLEL처럼 나머지는 대기)
+    max_parallel: int = field(default=4)
+    # 이 비율만큼 요청을 HTTP 500으로 실패시킴 (재시도/서킷 브레이커 부하 테스트용)
+    error_rate: float = field(default=0.0)
+    seed: Optional[int] = field(default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    # 실제 토크나이저 없이 대략적인 토큰 수 (지연 시간 계산과 보고용)
+    return max(1, len(text) // 3) if text else 0
+
+
+def split_tokens(text: str) -> List[str]:
+    """단어(+뒤따르는 공백) 단위 청크로 나눔: 한 청크를 토큰 하나로 취급"""
+    return _TOKEN_RE.findall(text)
+
+
+def schema_example(schema: Any) -> Any:
+    """JSON 스키마를 만족하는 최소 값 (enum은 첫 값, 배열은 minItems개 또는 1개)"""
+    if not isinstance(schema, dict):
+        return {}
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if kind == "object":
+        return {name: schema_example(sub) for name, sub in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [schema_example(schema.get("items", {})) for _ in range(max(1, schema.get("minItems", 1)))]
+    if kind in ("integer", "number"):
+        return schema.get("minimum", 1)
+    if kind == "boolean":
+        return False
+    return "stub"
+
+
+class OllamaStub:
+    """
+    Serves /api/generate (streaming NDJSON or a single JSON), /api/tags, /api/ps,
+    /api/show and /api/version on a ThreadingHTTPServer.
+
+    Usage:
+        with OllamaStub(OllamaStubConfig(port=0, cassette_path="eval.jsonl")) as stub:
+            config = LlamaConfig(hosts=(stub.base_url,), cache_path=None)
+            ...
+        stub.stats  # requests, errors, max_in_flight
+    """
+    def __init__(self, config: Optional[OllamaStubConfig] = None):
+        self.config = config or OllamaStubConfig()
+        self.cassette = Cassette(self.config.cassette_path, "replay") if self.config.cassette_path else None
+        self._random = random.Random(self.config.seed)
+        self._slots = threading.BoundedSemaphore(max(1, self.config.max_parallel))
+        self._lock = threading.Lock()
+        self._loaded: set = set()
+        self._in_flight = 0
+        self.stats = {"requests": 0, "errors": 0, "cassette_hits": 0, "max_in_flight": 0}
+        self._server = ThreadingHTTPServer((self.config.host, self.config.port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "OllamaStub":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Ollama stub listening on {self.base_url}")
+        return self
+
+    def serve_forever(self) -> None:
+        logger.info(f"Ollama stub listening on {self.base_url}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "OllamaStub":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _response_chunks(self, request: dict) -> List[str]:
+        model = request.get("model", "")
+        prompt = request.get("prompt", "")
+        fmt = request.get("format") or None
+        if self.cassette is not None:
+            entry = self.cassette.get(cassette_key(model, prompt, request.get("system"), fmt))
+            if entry is not None:
+                with self._lock:
+                    self.stats["cassette_hits"] += 1
+                return entry["chunks"]
+        if fmt == "json":
+            return split_tokens("{}")
+        if isinstance(fmt, dict):
+            return split_tokens(json.dumps(schema_example(fmt), ensure_ascii=False))
+        return split_tokens(self.config.response_text)
+
+    def _generate(self, request: dict, emit) -> None:
+        """
+        Simulate one generation: emit(dict) is called per token chunk and once with the
+        final done=True message carrying Ollama-style timings (nanoseconds).
+        """
+        config = self.config
+        model = request.get("model", "")
+        prompt = (request.get("system") or "") + (request.get("prompt") or "")
+        started = time.perf_counter()
+        with self._slots:
+            with self._lock:
+                self._in_flight += 1
+                self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+                needs_load = model not in self._loaded
+                self._loaded.add(model)
+            try:
+                load_sec = config.load_sec if needs_load else 0.0
+                time.sleep(load_sec)
+                prompt_tokens = estimate_tokens(prompt)
+                prompt_sec = prompt_tokens / config.prompt_tokens_per_sec if config.prompt_tokens_per_sec else 0.0
+                time.sleep(prompt_sec)
+
+                # 빈 프롬프트는 모델 로딩 요청 (Ollama와 같이 생성 없이 완료)
+                chunks = self._response_chunks(request) if request.get("prompt") else []
+                eval_start = time.perf_counter()
+                if chunks:
+                    time.sleep(config.first_token_latency_sec)
+                for chunk in chunks:
+                    if config.tokens_per_sec:
+                        time.sleep(1.0 / config.tokens_per_sec)
+                    emit(self._message(model, chunk, done=False))
+                eval_sec = time.perf_counter() - eval_start
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+        final = self._message(model, "", done=True)
+        final.update(
+            done_reason="stop" if chunks else "load",
+            total_duration=int((time.perf_counter() - started) * 1e9),
+            load_duration=int(load_sec * 1e9),
+            prompt_eval_count=prompt_tokens,
+            prompt_eval_duration=int(prompt_sec * 1e9),
+            eval_count=len(chunks),
+            eval_duration=int(eval_sec * 1e9),
+        )
+        emit(final)
+
+    @staticmethod
+    def _message(model: str, text: str, done: bool) -> dict:
+        return {
+            "model": model,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "response": text,
+            "done": done,
+        }
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            return self.config.error_rate > 0 and self._random.random() < self.config.error_rate
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive 연결을 유지해 실제 클라이언트의 연결 재사용과 같은 조건으로 측정
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug("ollama-stub " + format, *args)
+
+            def _send_json(self, status: int, body: Any) -> None:
+                data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_json(self) -> dict:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                return json.loads(raw or b"{}")
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_GET(self):
+                if self.path == "/":
+                    data = b"Ollama is running"
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; charset=utf-8")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                elif self.path == "/api/version":
+                    self._send_json(200, {"version": "0.0.0-stub"})
+                elif self.path in ("/api/tags", "/api/ps"):
+                    self._send_json(200, {"models": [{"name": m, "model": m} for m in stub.config.models]})
+                else:
+                    self._send_json(404, {"error": f"not found: {self.path}"})
+
+            def do_POST(self):
+                try:
+                    request = self._read_json()
+                except ValueError as e:
+                    self._send_json(400, {"error": f"invalid JSON: {e}"})
+                    return
+                if self.path == "/api/show":
+                    self._send_json(200, {"modelfile": "", "parameters": "", "details": {"family": "stub"}})
+                elif self.path == "/api/generate":
+                    self._handle_generate(request)
+                else:
+                    self._send_json(404, {"error": f"not found: {self.path}"})
+
+            def _handle_generate(self, request: dict) -> None:
+                with stub._lock:
+                    stub.stats["requests"] += 1
+                model = request.get("model", "")
+                if stub.config.models and model not in stub.config.models:
+                    self._send_json(404, {"error": f"model '{model}' not found"})
+                    return
+                if stub._should_fail():
+                    with stub._lock:
+                        stub.stats["errors"] += 1
+                    self._send_json(500, {"error": "injected failure (ollama stub)"})
+                    return
+
+                if not request.get("stream", True):
+                    parts: List[dict] = []
+                    stub._generate(request, parts.append)
+                    final = parts[-1]
+                    final["response"] = "".join(p["response"] for p in parts[:-1])
+                    self._send_json(200, final)
+                    return
+
+                # 스트리밍: chunked 전송으로 NDJSON 한 줄씩 즉시 전달
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def emit(message: dict) -> None:
+                    line = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+                    self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+                    self.wfile.flush()
+
+                stub._generate(request, emit)
+                self.wfile.write(b"0\r\n\r\n")
+
+        return Handler
+
+
+def serve_ollama_stub(config: Optional[OllamaStubConfig] = None) -> None:
+    """Run the stand-in in the foreground until interrupted."""
+    stub = OllamaStub(config)
+    print(f"🧪 Ollama 스텁 실행 중: {stub.base_url} (모델: {', '.join(stub.config.models)})")
+    try:
+        stub.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,240 @@
+# prompt_governor.py
+# Keep evaluation prompts within a token budget: drop fillers and repetitions, then extract key sentences
+
+import re
+import math
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Set, Tuple
+
+from .config import PromptGovernorConfig
+
+# 토크나이저 없이 쓰는 추정치: Gemma 계열에서 한글은 음절 1.5개, 영문/숫자는 4글자 정도가 토큰 하나
+HANGUL_CHARS_PER_TOKEN = 1.5
+LATIN_CHARS_PER_TOKEN = 4.0
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㆎ]")
+_LATIN_RE = re.compile(r"[A-Za-z0-9]")
+_SYMBOL_RE = re.compile(r"[^\w\s]")
+# 문장 끝: 마침표/물음표/느낌표(Whisper 출력) 뒤 공백
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+")
+_STRIP_PUNCT = ".,!?…~"
+# 발췌로 건너뛴 구간 표시 (LLM이 답변이 이어진다는 것을 알 수 있도록)
+GAP_MARKER = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for budget decisions: Hangul and Latin characters at their
+    typical per-token rates, one token per symbol. Errs on the high side.
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_RE.findall(text))
+    latin = len(_LATIN_RE.findall(text))
+    symbols = len(_SYMBOL_RE.findall(text))
+    return math.ceil(hangul / HANGUL_CHARS_PER_TOKEN) + math.ceil(latin / LATIN_CHARS_PER_TOKEN) + symbols
+
+
+@dataclass
+class GovernedAnswer:
+    """
+    Answer text that goes into the prompt, with a record of what was trimmed.
+    trimmed=False means text is the original answer unchanged.
+    """
+    text: str
+    original_tokens: int
+    tokens: int
+    budget: int
+    trimmed: bool = False
+    fillers_removed: int = 0
+    repeats_removed: int = 0
+    dropped_sentences: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def summary(self) -> str:
+        return (
+            f"{self.original_tokens} → {self.tokens} 토큰 (예산 {self.budget}): 간투사 {self.fillers_removed}개, "
+            f"반복 {self.repeats_removed}개, 발췌로 제외한 문장 {len(self.dropped_sentences)}개"
+        )
+
+
+def _bare(word: str) -> str:
+    return word.strip(_STRIP_PUNCT)
+
+
+def remove_fillers(text: str, fillers) -> Tuple[str, int]:
+    """간투사만으로 된 단어를 제거 (단어 뒤의 문장 끝 부호는 앞 단어로 옮겨 문장 경계를 유지)"""
+    filler_set = set(fillers)
+    kept: List[str] = []
+    removed = 0
+    for word in text.split():
+        if _bare(word) in filler_set:
+            removed += 1
+            ending = word[len(word.rstrip(".!?")):]
+            if ending and kept and not kept[-1].endswith(tuple(".!?")):
+                kept[-1] += ending
+            continue
+        kept.append(word)
+    return " ".join(kept), removed
+
+
+def remove_repetitions(text: str, max_ngram: int = 4) -> Tuple[str, int]:
+    """
+    말더듬/재시작으로 바로 반복된 단어·구(최대 max_ngram 단어)와
+    앞에서 이미 나온 문장(Whisper 반복 출력 포함)을 제거합니다.
+    """
+    words = text.split()
+    removed = 0
+    out: List[str] = []
+    for word in words:
+        out.append(word)
+        for n in range(1, max_ngram + 1):
+            if len(out) >= 2 * n and [_bare(w) for w in out[-n:]] == [_bare(w) for w in out[-2 * n:-n]]:
+                # 앞쪽 반복을 지워 마지막 단어의 문장 부호가 남도록 함
+                del out[-2 * n:-n]
+                removed += n
+                break
+
+    seen: Set[str] = set()
+    sentences = []
+    for sentence in split_sentences(" ".join(out)):
+        key = " ".join(_bare(w) for w in sentence.split())
+        if key in seen:
+            removed += len(sentence.split())
+            continue
+        seen.add(key)
+        sentences.append(sentence)
+    return " ".join(sentences), removed
+
+
+def split_sentences(text: str, max_tokens: Optional[int] = None) -> List[str]:
+    """
+    문장 단위로 나눕니다. max_tokens보다 긴 문장(문장 부호 없이 이어진 전사 등)은
+    단어 경계에서 max_tokens 이하 조각으로 다시 나눕니다.
+    """
+    sentences = [s.strip() for s in _SENTENCE_RE.split(text) if s.strip()]
+    if not max_tokens:
+        return sentences
+    pieces: List[str] = []
+    for sentence in sentences:
+        if estimate_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        current: List[str] = []
+        for word in sentence.split():
+            if current and estimate_tokens(" ".join(current + [word])) > max_tokens:
+                pieces.append(" ".join(current))
+                current = []
+            current.append(word)
+        if current:
+            pieces.append(" ".join(current))
+    return pieces
+
+
+def _bigrams(text: str) -> Set[str]:
+    # 한국어는 조사/어미가 붙어 단어 일치가 잘 안 되므로 글자 2-gram으로 겹침을 봄
+    compact = "".join(ch for ch in text.lower() if ch.isalnum())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)}
+
+
+def _sentence_scores(sentences: List[str], question: str, config: PromptGovernorConfig) -> List[float]:
+    question_grams = _bigrams(question)
+    last = len(sentences) - 1
+    scores = []
+    for i, sentence in enumerate(sentences):
+        grams = _bigrams(sentence)
+        overlap = len(grams & question_grams) / math.sqrt(len(grams)) if grams else 0.0
+        # 첫 문장(두괄식 요지)이 가장 중요하고, 마지막 문장(결론)도 가산
+        position = max(1.0 / (1 + i), 0.5 if i == last else 0.0)
+        evidence = any(marker in sentence for marker in config.evidence_markers) or any(ch.isdigit() for ch in sentence)
+        scores.append(
+            config.overlap_weight * overlap
+            + config.position_weight * position
+            + config.evidence_weight * evidence
+        )
+    return scores
+
+
+def _truncate_words(text: str, budget: int) -> str:
+    words = text.split()
+    while words and estimate_tokens(" ".join(words) + " " + GAP_MARKER) > budget:
+        words.pop()
+    if words or not text.strip():
+        return " ".join(words) + " " + GAP_MARKER if words else ""
+    return _truncate_chars(text.split()[0], budget)
+
+
+def _truncate_chars(word: str, budget: int) -> str:
+    """띄어쓰기 없이 이어진 전사 등 한 단어가 예산보다 길 때: 예산에 맞는 가장 긴 앞부분 (최소 한 글자)"""
+    lo, hi = 1, len(word)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(word[:mid] + GAP_MARKER) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return word[:lo] + GAP_MARKER
+
+
+def extract_sentences(text: str, question: str, budget: int, config: PromptGovernorConfig) -> Tuple[str, List[str]]:
+    """
+    질문과의 겹침, 위치, 근거 표현 점수가 높은 문장부터 예산 안에서 고르고 원래 순서대로 잇습니다.
+    건너뛴 구간은 GAP_MARKER로 표시하며, 반환 텍스트는 항상 budget 이하입니다.
+    """
+    sentences = split_sentences(text, max_tokens=max(1, budget // 2))
+    scores = _sentence_scores(sentences, question, config)
+    gap_tokens = estimate_tokens(" " + GAP_MARKER)
+    chosen: Set[int] = set()
+    # 문장마다 뒤따르는 생략 표시 하나 + 맨 앞 생략 표시 하나를 미리 계산에 넣음
+    used = gap_tokens
+    for i in sorted(range(len(sentences)), key=lambda i: (-scores[i], i)):
+        cost = estimate_tokens(sentences[i]) + gap_tokens
+        if used + cost <= budget:
+            chosen.add(i)
+            used += cost
+
+    parts: List[str] = []
+    for i, sentence in enumerate(sentences):
+        if i in chosen:
+            parts.append(sentence)
+        elif not parts or parts[-1] != GAP_MARKER:
+            parts.append(GAP_MARKER)
+    result = " ".join(parts)
+    if not chosen or estimate_tokens(result) > budget:
+        # 예산이 한 문장보다 작은 경우: 가장 점수가 높은 문장을 단어 단위로 자름
+        best = max(range(len(sentences)), key=lambda i: (scores[i], -i)) if sentences else None
+        result = _truncate_words(sentences[best], budget) if best is not None else ""
+        chosen = {best} if result else set()
+    dropped = [s for i, s in enumerate(sentences) if i not in chosen]
+    return result, dropped
+
+
+def govern_answer(
+    answer: str,
+    question: str = "",
+    budget: Optional[int] = None,
+    config: Optional[PromptGovernorConfig] = None,
+) -> GovernedAnswer:
+    """
+    답변이 토큰 예산(budget, 기본 config.prompt_token_budget)을 넘으면 단계적으로 줄입니다:
+    1) 간투사 제거 2) 반복 제거 3) 질문 관련 문장 발췌. 앞 단계에서 예산 안에 들어오면 거기서 멈춥니다.
+    budget이 0 이하면 답변을 그대로 둡니다.
+    """
+    config = config or PromptGovernorConfig()
+    budget = config.prompt_token_budget if budget is None else budget
+    original_tokens = estimate_tokens(answer)
+    governed = GovernedAnswer(answer, original_tokens, original_tokens, budget)
+    if budget <= 0 or original_tokens <= budget:
+        return governed
+
+    governed.trimmed = True
+    text, governed.fillers_removed = remove_fillers(answer, config.filler_words)
+    if estimate_tokens(text) > budget:
+        text, governed.repeats_removed = remove_repetitions(text)
+    if estimate_tokens(text) > budget:
+        text, governed.dropped_sentences = extract_sentences(text, question, budget, config)
+    governed.text = text
+    governed.tokens = estimate_tokens(text)
+    return governed
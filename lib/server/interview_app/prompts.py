@@ -1,5 +1,5 @@
 # prompts.py
-# Prompt templates for resume parsing and interview question generation
+# Prompt templates for resume parsing, interview question generation and answer evaluation
 
 # Parser prompt: extract resume information into structured JSON
 PARSER_PROMPT = """
@@ -56,3 +56,197 @@ Please generate all questions in Korean.
 
 Candidate's resume text:
 """
+
+# Bump whenever the evaluation prompts or output format change (invalidates cached evaluations)
+EVALUATION_PROMPT_VERSION = "3"
+
+# Evaluation rubric: shared by the single- and multi-question evaluation prompts (Korean output, strict grading)
+_RUBRIC_HEADER = """모든 출력은 *오직 한국어*로만 작성하십시오.
+당신은 까다로운 IT 회사의 숙련된 면접관이자 평가 전문가입니다.
+높은 수준의 답변만을 인정하며, 엄격한 기준으로 평가합니다.
+"""
+
+_RUBRIC_CRITERIA = """
+**평가 기준 (매우 엄격하게 적용):**
+1. 관련성: 답변이 질문의 핵심을 정확히 다루었는가? (애매한 답변은 낮음)
+2. 완전성: 답변에 필요한 모든 요소가 구체적으로 포함되었는가? (일반적인 답변은 낮음)
+3. 정확성: 정확한 사실과 논리에 기반한 내용인가? (추상적인 답변은 낮음)
+4. 명확성: 명료하고 논리적으로 구성되었는가? (어색한 표현은 낮음)
+5. 전문성: 면접에 적합한 전문적인 어조와 표현을 사용했는가? (반복이나 문법 오류는 낮음)
+
+**평가 등급 가이드:**
+- 높음: 탁월한 답변, 구체적이고 완벽한 내용
+- 보통: 기본적인 요구사항을 충족하는 평균적인 답변
+- 낮음: 부족하거나 개선이 필요한 답변
+
+**중요**: 대부분의 일반적인 답변은 '보통' 또는 '낮음'으로 평가하세요.
+'높음' 평가는 정말 우수한 답변에만 부여하세요.
+
+"""
+
+# Grading + recommended answer in one response (LlamaConfig.eager_recommended_answer)
+EVALUATION_RUBRIC = (
+    _RUBRIC_HEADER
+    + "아래 면접 질문과 지원자의 답변을 기반으로 다음 다섯 가지 기준에 따라 **엄격하게** 평가하고,추천 답변을 제공해주세요.\n"
+    + _RUBRIC_CRITERIA
+)
+
+# Grading only (default): recommended answers are generated separately on request
+GRADING_RUBRIC = (
+    _RUBRIC_HEADER
+    + "아래 면접 질문과 지원자의 답변을 기반으로 다음 다섯 가지 기준에 따라 **엄격하게** 평가해주세요.\n"
+    + _RUBRIC_CRITERIA
+)
+
+# Output format for one question/answer pair
+EVALUATION_OUTPUT_EXAMPLE = """출력 예시(모든 키는 영어, 평가는 한글로 작성):
+{
+  "evaluation": {
+    "relevance":      {"rating": "높음",   "comment": "..."},
+    "completeness":   {"rating": "보통",   "comment": "..."},
+    "correctness":    {"rating": "높음",   "comment": "..."},
+    "clarity":        {"rating": "낮음",   "comment": "..."},
+    "professionalism":{"rating": "높음",   "comment": "..."}
+  },
+  "recommended_answer": "..." 
+}
+"""
+
+GRADING_OUTPUT_EXAMPLE = """출력 예시(모든 키는 영어, 평가는 한글로 작성):
+{
+  "evaluation": {
+    "relevance":      {"rating": "높음",   "comment": "..."},
+    "completeness":   {"rating": "보통",   "comment": "..."},
+    "correctness":    {"rating": "높음",   "comment": "..."},
+    "clarity":        {"rating": "낮음",   "comment": "..."},
+    "professionalism":{"rating": "높음",   "comment": "..."}
+  }
+}
+"""
+
+# Static system prompts for single-question evaluation; only the question/answer changes per call
+EVALUATION_SYSTEM_PROMPT = EVALUATION_RUBRIC + EVALUATION_OUTPUT_EXAMPLE
+GRADING_SYSTEM_PROMPT = GRADING_RUBRIC + GRADING_OUTPUT_EXAMPLE
+
+# Multi-question mode: several numbered pairs in one prompt, one array entry per pair
+BATCH_EVALUATION_INSTRUCTION = """아래에 번호가 붙은 여러 개의 질문/답변 쌍이 있습니다.
+각 쌍을 서로 독립적으로 평가하고, 모든 쌍의 평가를 하나의 JSON으로 출력하세요.
+
+"""
+
+BATCH_EVALUATION_OUTPUT_EXAMPLE = """출력 예시(모든 키는 영어, 평가는 한글로 작성, 질문마다 evaluations 배열에 하나씩, index는 질문 번호):
+{
+  "evaluations": [
+    {
+      "index": 1,
+      "evaluation": {
+        "relevance":      {"rating": "높음",   "comment": "..."},
+        "completeness":   {"rating": "보통",   "comment": "..."},
+        "correctness":    {"rating": "높음",   "comment": "..."},
+        "clarity":        {"rating": "낮음",   "comment": "..."},
+        "professionalism":{"rating": "높음",   "comment": "..."}
+      },
+      "recommended_answer": "..."
+    }
+  ]
+}
+"""
+
+BATCH_GRADING_OUTPUT_EXAMPLE = """출력 예시(모든 키는 영어, 평가는 한글로 작성, 질문마다 evaluations 배열에 하나씩, index는 질문 번호):
+{
+  "evaluations": [
+    {
+      "index": 1,
+      "evaluation": {
+        "relevance":      {"rating": "높음",   "comment": "..."},
+        "completeness":   {"rating": "보통",   "comment": "..."},
+        "correctness":    {"rating": "높음",   "comment": "..."},
+        "clarity":        {"rating": "낮음",   "comment": "..."},
+        "professionalism":{"rating": "높음",   "comment": "..."}
+      }
+    }
+  ]
+}
+"""
+
+BATCH_EVALUATION_SYSTEM_PROMPT = EVALUATION_RUBRIC + BATCH_EVALUATION_INSTRUCTION + BATCH_EVALUATION_OUTPUT_EXAMPLE
+BATCH_GRADING_SYSTEM_PROMPT = GRADING_RUBRIC + BATCH_EVALUATION_INSTRUCTION + BATCH_GRADING_OUTPUT_EXAMPLE
+
+# Recommended answer generated on demand (plain text so it can be streamed as-is)
+RECOMMENDED_ANSWER_SYSTEM_PROMPT = """모든 출력은 *오직 한국어*로만 작성하십시오.
+당신은 IT 회사 면접을 준비하는 지원자를 돕는 면접 코치입니다.
+주어진 면접 질문에 대해 면접관에게 높은 평가를 받을 수 있는 모범 답변을 작성하세요.
+지원자의 답변이 주어지면 그 내용과 경험을 살리되, 부족한 부분을 구체적으로 보완하세요.
+답변은 실제 면접에서 말하듯 자연스러운 문장으로 5~8문장 이내로 작성하고,
+제목, 목록, 마크다운, JSON 없이 답변 본문만 출력하세요.
+"""
+
+# JSON schemas passed to Ollama's `format` to constrain evaluation output (see LLMClient.call_structured)
+EVALUATION_CRITERIA = ["relevance", "completeness", "correctness", "clarity", "professionalism"]
+
+_CRITERION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "rating": {"type": "string", "enum": ["높음", "보통", "낮음"]},
+        "comment": {"type": "string"},
+    },
+    "required": ["rating", "comment"],
+}
+
+_EVALUATION_OBJECT_SCHEMA = {
+    "type": "object",
+    "properties": {name: _CRITERION_SCHEMA for name in EVALUATION_CRITERIA},
+    "required": EVALUATION_CRITERIA,
+}
+
+EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluation": _EVALUATION_OBJECT_SCHEMA,
+        "recommended_answer": {"type": "string"},
+    },
+    "required": ["evaluation", "recommended_answer"],
+}
+
+BATCH_EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "evaluation": _EVALUATION_OBJECT_SCHEMA,
+                    "recommended_answer": {"type": "string"},
+                },
+                "required": ["index", "evaluation", "recommended_answer"],
+            },
+        },
+    },
+    "required": ["evaluations"],
+}
+
+GRADING_SCHEMA = {
+    "type": "object",
+    "properties": {"evaluation": _EVALUATION_OBJECT_SCHEMA},
+    "required": ["evaluation"],
+}
+
+BATCH_GRADING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "evaluations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "index": {"type": "integer"},
+                    "evaluation": _EVALUATION_OBJECT_SCHEMA,
+                },
+                "required": ["index", "evaluation"],
+            },
+        },
+    },
+    "required": ["evaluations"],
+}
@@ -26,7 +26,7 @@ class InterviewQuestionMaker:
         if llm_client is None:
             if config is None:
                 config = LlamaConfig()
-            llm_client = LLMClient(config)
+            llm_client = LLMClient(config, caller="InterviewQuestionMaker")
         self.llm_client = llm_client
 
     def generate_questions(
@@ -52,7 +52,7 @@ class InterviewQuestionMaker:
 
         # 3) Call LLM and parse JSON
         try:
-            raw_response = self.llm_client.call(prompt)
+            raw_response = self.llm_client.call(prompt, caller="InterviewQuestionMaker")
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             raise
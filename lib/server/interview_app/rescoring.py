@@ -0,0 +1,359 @@
+# rescoring.py
+# Columnar rating table + vectorized re-scoring of stored evaluations (rubric changes without LLM calls)
+
+import os
+import re
+import glob
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .evaluation import (
+    CRITERIA_WEIGHTS,
+    DEFAULT_RATING,
+    DEFAULT_RATING_SCORE,
+    FAILING_GRADE,
+    GRADE_LADDER,
+    LEGACY_RATING_SCORES,
+    MAX_RATING_SCORE,
+    RATING_SCORES,
+)
+from .triage import is_placeholder_answer
+
+logger = logging.getLogger(__name__)
+
+# 평가 항목 열 순서 (calculate_score_from_evaluation의 누적 순서와 같아야 합계가 일치)
+CRITERIA = tuple(CRITERIA_WEIGHTS)
+
+# rating 코드 (uint8): 0 = 항목 없음, 1 = rating 키 없음('낮음'으로 계산, 하위 호환 판정에는 미포함),
+# 2.. = RATING_NAMES 순서, OTHER_CODE = 알 수 없는 rating (DEFAULT_RATING_SCORE)
+MISSING_CODE = 0
+NO_RATING_CODE = 1
+RATING_NAMES = ("매우 높음", "높음", "보통", "낮음", "매우 낮음", "분석불가")
+RATING_CODES = {name: i + 2 for i, name in enumerate(RATING_NAMES)}
+OTHER_CODE = len(RATING_NAMES) + 2
+
+# 행 플래그
+FLAG_EXTRA_LEGACY = 1   # 평가 항목 외의 키에 기존 3단계 rating이 있음 (하위 호환 점수표 적용)
+FLAG_INVALID = 2        # dict가 아닌 값이 있어 단건 계산에서 0점이 되는 평가
+FLAG_PINNED = 4         # 빈 답변/음성 인식 실패: rating과 무관하게 0점
+
+# 저장된 평가 텍스트 파일 (evaluation._write_evaluation_file 형식)
+_QUESTION_RE = re.compile(r"^질문 (\d+):\s*$")
+_CRITERION_RE = re.compile(r"^  (\w+): (.*?)( - .*)?$")
+_SCORE_RE = re.compile(r"^총점: (-?\d+)점\s*$")
+# 파일 작성 시 rating 키가 없으면 '정보없음'으로 기록됨
+_MISSING_RATING_TEXT = "정보없음"
+
+
+def _encode_rating(criterion_data) -> int:
+    if not isinstance(criterion_data, dict):
+        return MISSING_CODE
+    if "rating" not in criterion_data:
+        return NO_RATING_CODE
+    rating = criterion_data["rating"]
+    return RATING_CODES.get(rating, OTHER_CODE) if isinstance(rating, str) else OTHER_CODE
+
+
+def _row_flags(evaluation_obj, answer: Optional[str]) -> int:
+    flags = 0
+    if answer is not None and (not answer.strip() or is_placeholder_answer(answer)):
+        flags |= FLAG_PINNED
+    if not isinstance(evaluation_obj, dict):
+        return flags | FLAG_INVALID
+    for key, value in evaluation_obj.items():
+        if not isinstance(value, dict):
+            flags |= FLAG_INVALID
+        elif key not in CRITERIA_WEIGHTS and value.get("rating", "") in LEGACY_RATING_SCORES:
+            flags |= FLAG_EXTRA_LEGACY
+    return flags
+
+
+@dataclass
+class RatingTable:
+    """
+    Stored evaluations as columns: one uint8 rating code per (row, criterion),
+    a uint8 flag per row, the score that was stored at evaluation time (-1 if unknown)
+    and a string id (source file + question number, or caller-provided).
+    """
+    ids: np.ndarray
+    codes: np.ndarray
+    flags: np.ndarray
+    stored_scores: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def empty(cls) -> "RatingTable":
+        return cls(
+            ids=np.array([], dtype=str),
+            codes=np.zeros((0, len(CRITERIA)), dtype=np.uint8),
+            flags=np.zeros(0, dtype=np.uint8),
+            stored_scores=np.zeros(0, dtype=np.int16),
+        )
+
+    @classmethod
+    def from_evaluations(cls, items: Iterable[dict], ids: Optional[Sequence[str]] = None) -> "RatingTable":
+        """
+        평가 결과 목록으로 테이블을 만듭니다.
+        item은 _evaluate_response 결과({"evaluation", "user_answer", "total_score", ...})이거나
+        평가 항목 dict 자체일 수 있습니다.
+        """
+        codes, flags, stored = [], [], []
+        for item in items:
+            if isinstance(item, dict) and "evaluation" in item:
+                evaluation_obj = item["evaluation"]
+                answer = item.get("user_answer")
+                score = item.get("total_score")
+            else:
+                evaluation_obj, answer, score = item, None, None
+            if isinstance(evaluation_obj, dict):
+                codes.append([_encode_rating(evaluation_obj.get(c)) for c in CRITERIA])
+            else:
+                codes.append([MISSING_CODE] * len(CRITERIA))
+            flags.append(_row_flags(evaluation_obj, answer))
+            stored.append(score if isinstance(score, int) else -1)
+        if ids is None:
+            ids = [str(i) for i in range(len(codes))]
+        elif len(ids) != len(codes):
+            raise ValueError(f"ids 길이({len(ids)})가 평가 수({len(codes)})와 다릅니다")
+        return cls(
+            ids=np.array(ids, dtype=str),
+            codes=np.array(codes, dtype=np.uint8).reshape(-1, len(CRITERIA)),
+            flags=np.array(flags, dtype=np.uint8),
+            stored_scores=np.array(stored, dtype=np.int16),
+        )
+
+    @classmethod
+    def from_text_files(cls, paths: Iterable[str]) -> "RatingTable":
+        """_write_evaluation_file로 저장된 평가 텍스트 파일들을 읽어 테이블을 만듭니다."""
+        ids, codes, flags, stored = [], [], [], []
+        for path in paths:
+            for number, row, row_flags, score in _parse_evaluation_file(path):
+                ids.append(f"{path}#{number}")
+                codes.append(row)
+                flags.append(row_flags)
+                stored.append(score)
+        return cls(
+            ids=np.array(ids, dtype=str),
+            codes=np.array(codes, dtype=np.uint8).reshape(-1, len(CRITERIA)),
+            flags=np.array(flags, dtype=np.uint8),
+            stored_scores=np.array(stored, dtype=np.int16),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RatingTable":
+        with np.load(path, allow_pickle=False) as data:
+            if tuple(data["criteria"]) != CRITERIA:
+                raise ValueError(f"{path}: 평가 항목 구성이 다릅니다 ({list(data['criteria'])})")
+            return cls(
+                ids=data["ids"],
+                codes=data["codes"],
+                flags=data["flags"],
+                stored_scores=data["stored_scores"],
+            )
+
+    def save(self, path: str) -> None:
+        """압축 .npz로 저장 (평가 항목 순서를 함께 기록)"""
+        np.savez_compressed(
+            path,
+            ids=self.ids,
+            codes=self.codes,
+            flags=self.flags,
+            stored_scores=self.stored_scores,
+            criteria=np.array(CRITERIA, dtype=str),
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence["RatingTable"]) -> "RatingTable":
+        tables = [t for t in tables if len(t)]
+        if not tables:
+            return cls.empty()
+        return cls(
+            ids=np.concatenate([t.ids for t in tables]),
+            codes=np.concatenate([t.codes for t in tables]),
+            flags=np.concatenate([t.flags for t in tables]),
+            stored_scores=np.concatenate([t.stored_scores for t in tables]),
+        )
+
+
+def _parse_evaluation_file(path: str):
+    """(질문 번호, rating 코드 목록, 행 플래그, 저장된 총점)을 질문마다 내보냅니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    record = None
+    section = None
+    for line in lines:
+        match = _QUESTION_RE.match(line)
+        if match:
+            if record is not None:
+                yield _finish_record(record)
+            record = {"number": int(match.group(1)), "ratings": {}, "answer": [], "score": -1, "flags": 0}
+            section = None
+            continue
+        if record is None:
+            continue
+        if line == "사용자 답변:":
+            section = "answer"
+        elif line == "평가 결과:":
+            section = "evaluation"
+        elif line.startswith("총점:"):
+            section = None
+            match = _SCORE_RE.match(line)
+            if match:
+                record["score"] = int(match.group(1))
+        elif section == "answer":
+            record["answer"].append(line)
+        elif section == "evaluation" and line.strip():
+            match = _CRITERION_RE.match(line)
+            if not match:
+                continue
+            key, rating, comment = match.group(1), match.group(2).strip(), match.group(3)
+            if comment is None:
+                # dict가 아닌 평가 값은 ' - 코멘트' 없이 기록됨
+                record["flags"] |= FLAG_INVALID
+            elif key in CRITERIA_WEIGHTS:
+                record["ratings"][key] = rating
+            elif rating in LEGACY_RATING_SCORES:
+                record["flags"] |= FLAG_EXTRA_LEGACY
+    if record is not None:
+        yield _finish_record(record)
+
+
+def _finish_record(record):
+    row = []
+    for criterion in CRITERIA:
+        rating = record["ratings"].get(criterion)
+        if rating is None:
+            row.append(MISSING_CODE)
+        elif rating == _MISSING_RATING_TEXT:
+            row.append(NO_RATING_CODE)
+        else:
+            row.append(RATING_CODES.get(rating, OTHER_CODE))
+    answer = "\n".join(record["answer"]).strip()
+    flags = record["flags"]
+    if not answer or is_placeholder_answer(answer):
+        flags |= FLAG_PINNED
+    return record["number"], row, flags, record["score"]
+
+
+def _score_lookup(rating_scores: Dict[str, float], default_score: float) -> np.ndarray:
+    """rating 코드 → 점수 조회 테이블"""
+    lookup = np.full(OTHER_CODE + 1, default_score, dtype=np.float64)
+    lookup[MISSING_CODE] = 0
+    lookup[NO_RATING_CODE] = rating_scores.get(DEFAULT_RATING, default_score)
+    for name, code in RATING_CODES.items():
+        lookup[code] = rating_scores.get(name, default_score)
+    return lookup
+
+
+def score_codes(
+    codes: np.ndarray,
+    flags: Optional[np.ndarray] = None,
+    rating_scores: Optional[Dict[str, float]] = None,
+    legacy_scores: Optional[Dict[str, float]] = None,
+    weights: Optional[Dict[str, float]] = None,
+    default_score: float = DEFAULT_RATING_SCORE,
+    max_rating_score: Optional[float] = None,
+    overrides: Optional[Dict[str, float]] = None,
+) -> np.ndarray:
+    """
+    calculate_score_from_evaluation과 같은 규칙으로 (N, 5) rating 코드의 총점을 한 번에 계산합니다.
+    기본 인자에서는 단건 계산과 점수가 정확히 같습니다 (같은 순서로 float64 누적 후 절사).
+
+    :param rating_scores: rating → 점수 (기본 RATING_SCORES)
+    :param legacy_scores: 기존 3단계 rating이 있는 행에 덮어쓸 점수 (기본 LEGACY_RATING_SCORES)
+    :param weights: 평가 항목 → 가중치 (기본 CRITERIA_WEIGHTS, 빠진 항목은 계산에서 제외)
+    :param max_rating_score: 100점 환산 기준 (기본: 새 rating_scores/overrides의 최댓값, 기본 점수표면 18)
+    :param overrides: rating → 점수, 기존 3단계 행을 포함해 모든 행에서 마지막에 적용 (루브릭 변경 실험용)
+    """
+    rating_scores = RATING_SCORES if rating_scores is None else rating_scores
+    legacy_scores = LEGACY_RATING_SCORES if legacy_scores is None else legacy_scores
+    weights = CRITERIA_WEIGHTS if weights is None else weights
+    overrides = overrides or {}
+    if max_rating_score is None:
+        if rating_scores is RATING_SCORES and not overrides:
+            max_rating_score = MAX_RATING_SCORE
+        else:
+            max_rating_score = max({**rating_scores, **overrides}.values())
+    unknown = set(weights) - set(CRITERIA)
+    if unknown:
+        raise ValueError(f"알 수 없는 평가 항목: {sorted(unknown)}")
+
+    codes = np.asarray(codes, dtype=np.uint8)
+    n = codes.shape[0]
+    flags = np.zeros(n, dtype=np.uint8) if flags is None else np.asarray(flags, dtype=np.uint8)
+
+    # overrides는 기존 3단계 점수보다 나중에 적용해야 높음/보통/낮음 행에도 반영됨
+    lookup = _score_lookup({**rating_scores, **overrides}, default_score)
+    legacy_lookup = _score_lookup({**rating_scores, **legacy_scores, **overrides}, default_score)
+    legacy_codes = [RATING_CODES[name] for name in legacy_scores if name in RATING_CODES]
+    legacy = np.isin(codes, legacy_codes).any(axis=1) | ((flags & FLAG_EXTRA_LEGACY) != 0)
+
+    total = np.zeros(n, dtype=np.float64)
+    present = np.zeros(n, dtype=bool)
+    for column, criterion in enumerate(CRITERIA):
+        if criterion not in weights:
+            continue
+        col = codes[:, column]
+        base = np.where(legacy, legacy_lookup[col], lookup[col])
+        has = col != MISSING_CODE
+        total += np.where(has, base * weights[criterion], 0.0)
+        present |= has
+
+    max_possible = sum(max_rating_score * weight for weight in weights.values())
+    scores = np.trunc(total / max_possible * 100) if max_possible else np.zeros(n)
+    scores = np.clip(scores, 0, 100).astype(np.int16)
+    scores[~present] = 0
+    scores[(flags & (FLAG_INVALID | FLAG_PINNED)) != 0] = 0
+    return scores
+
+
+def score_table(table: RatingTable, **kwargs) -> np.ndarray:
+    """테이블 전체의 총점 (score_codes 인자를 그대로 전달)"""
+    return score_codes(table.codes, table.flags, **kwargs)
+
+
+def grade_scores(scores: np.ndarray, ladder=GRADE_LADDER, failing_grade: str = FAILING_GRADE) -> np.ndarray:
+    """총점 배열을 등급 문자열 배열로 변환 (evaluation.grade_from_score와 같은 구간)"""
+    ascending = sorted(ladder)
+    thresholds = np.array([score for score, _ in ascending])
+    labels = np.array([failing_grade] + [grade for _, grade in ascending])
+    return labels[np.searchsorted(thresholds, np.asarray(scores), side="right")]
+
+
+def load_rating_tables(paths: Iterable[str]) -> RatingTable:
+    """
+    .txt(평가 파일), .json(평가 결과 목록), .npz(저장된 테이블) 경로와 디렉터리를 모아 하나의 테이블로 읽습니다.
+    디렉터리는 그 아래의 세 형식 파일을 모두 포함합니다.
+    """
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for ext in ("txt", "json", "npz"):
+                files.extend(sorted(glob.glob(os.path.join(path, "**", f"*.{ext}"), recursive=True)))
+        else:
+            files.append(path)
+
+    tables = []
+    text_files = [p for p in files if p.endswith(".txt")]
+    if text_files:
+        tables.append(RatingTable.from_text_files(text_files))
+    for path in files:
+        if path.endswith(".npz"):
+            tables.append(RatingTable.load(path))
+        elif path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+            if isinstance(items, dict):
+                items = [items]
+            ids = [f"{path}#{i}" for i in range(1, len(items) + 1)]
+            tables.append(RatingTable.from_evaluations(items, ids=ids))
+        elif not path.endswith(".txt"):
+            logger.warning(f"Unsupported rating source skipped: {path}")
+    return RatingTable.concat(tables)
@@ -26,7 +26,7 @@ class ResumeJsonParser:
         if llm_client is None:
             if config is None:
                 config = LlamaConfig()
-            llm_client = LLMClient(config)
+            llm_client = LLMClient(config, caller="ResumeJsonParser")
         self.llm_client = llm_client
 
     def parse(self, pdf_source: Union[str, IO]) -> dict:
@@ -46,7 +46,7 @@ class ResumeJsonParser:
         # 2) Build prompt and call LLM
         prompt = PARSER_PROMPT + "\n" + raw_text
         try:
-            raw_response = self.llm_client.call(prompt)
+            raw_response = self.llm_client.call(prompt, caller="ResumeJsonParser")
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             raise
@@ -4,19 +4,138 @@
 import os
 import time
 import wave
+import queue
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
-from faster_whisper import WhisperModel
+import numpy as np
+from faster_whisper import WhisperModel, decode_audio
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 from .config import STTConfig
+from .cache import DiskCache
+
+# 배치 파이프라인은 faster-whisper 1.1.0 이상에서만 제공
+try:
+    from faster_whisper import BatchedInferencePipeline
+    BATCHED_PIPELINE_AVAILABLE = True
+except ImportError:
+    BATCHED_PIPELINE_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Whisper 입력 샘플링 레이트와 한 번에 디코딩할 수 있는 최대 구간 길이
+SAMPLE_RATE = 16000
+MAX_CLIP_SEC = 30.0
+# 재디코딩 구간 앞뒤 여유 (단어 경계가 잘리지 않도록)
+REFINE_PAD_SEC = 0.2
+
+
+def _words_from_segments(segments, offset: float = 0.0) -> List[Dict]:
+    """
+    Flatten faster-whisper segments into word-level timestamps, shifted by offset seconds.
+    """
+    word_timestamps: List[Dict] = []
+    for segment in segments:
+        for w in segment.words or []:
+            word_timestamps.append({
+                "word": w.word,
+                "start": round(w.start - offset, 2),
+                "end": round(w.end - offset, 2),
+                "probability": round(w.probability, 3),
+            })
+    return word_timestamps
+
+
+def detect_speech_segments(audio: np.ndarray, min_silence_ms: int = 2000) -> List[Dict]:
+    """
+    Run the Silero voice-activity detector bundled with faster-whisper on 16 kHz audio.
+
+    :param audio: Mono float32 samples at SAMPLE_RATE
+    :param min_silence_ms: Pauses shorter than this stay inside one speech segment
+    :return: List of dicts with 'start' and 'end' in seconds
+    """
+    vad_options = VadOptions(min_silence_duration_ms=min_silence_ms)
+    return [
+        {"start": round(region["start"] / SAMPLE_RATE, 2), "end": round(region["end"] / SAMPLE_RATE, 2)}
+        for region in get_speech_timestamps(audio, vad_options)
+    ]
+
+
+def _compact_words(word_timestamps: List[Dict]) -> List[list]:
+    """Compact cache form: [[word, start, end, probability], ...]"""
+    return [[w["word"], w["start"], w["end"], w.get("probability")] for w in word_timestamps]
+
+
+def _expand_words(compact: List[list]) -> List[Dict]:
+    words = []
+    for entry in compact:
+        word = {"word": entry[0], "start": entry[1], "end": entry[2]}
+        # 이전 형식([word, start, end]) 캐시 항목에는 신뢰도가 없음
+        if len(entry) > 3 and entry[3] is not None:
+            word["probability"] = entry[3]
+        words.append(word)
+    return words
+
+
+def _speech_clips(audio: np.ndarray, offset: int) -> List[Dict[str, int]]:
+    """
+    Group VAD speech regions of one clip into windows of at most MAX_CLIP_SEC seconds.
+    Bounds are sample indices on a timeline that starts at offset samples, the unit
+    BatchedInferencePipeline expects for clip_timestamps.
+    """
+    max_samples = int(MAX_CLIP_SEC * SAMPLE_RATE)
+    clips: List[Dict[str, int]] = []
+    for region in get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=2000)):
+        start = region["start"]
+        end = region["end"]
+        # Whisper 입력 한도보다 긴 발화는 잘라서 나눔
+        while end - start > max_samples:
+            clips.append({"start": start, "end": start + max_samples})
+            start += max_samples
+        if clips and end - clips[-1]["start"] <= max_samples:
+            clips[-1]["end"] = end
+        else:
+            clips.append({"start": start, "end": end})
+    return [{"start": c["start"] + offset, "end": c["end"] + offset} for c in clips]
+
+
+def audio_fingerprint(audio_path: str) -> str:
+    """
+    SHA-256 of the PCM content of a WAV file (header-independent), or of the raw
+    file bytes for other formats.
+    """
+    digest = hashlib.sha256()
+    try:
+        with wave.open(audio_path, 'rb') as wf:
+            digest.update(f"{wf.getnchannels()}:{wf.getsampwidth()}:{wf.getframerate()}".encode())
+            while True:
+                frames = wf.readframes(65536)
+                if not frames:
+                    break
+                digest.update(frames)
+    except wave.Error:
+        digest = hashlib.sha256()
+        with open(audio_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
 class STTClient:
     """
     Wrapper around faster-whisper WhisperModel for speech-to-text processing.
     개선된 음성 인식 정확도와 오류 처리 기능 포함
 
+    With config.pool_workers > 0 the client loads no model itself and forwards
+    transcription to a shared STTWorkerPool (see stt_pool.py).
+
+    With config.cache_path set, word timestamps of every transcribed file are kept in a
+    persistent cache keyed by the audio content and the decoding settings, so the same
+    recording is never decoded twice (retries, re-evaluation, re-scoring).
+
     Usage:
         config = STTConfig()
         stt = STTClient(config)
@@ -25,16 +144,33 @@ class STTClient:
     def __init__(self, config: Optional[STTConfig] = None):
         # Load configuration (model name, device, compute type, beam size, language)
         self.config = config or STTConfig()
+        self._batched = None
+        self._refine_model = None
+        # 지연 로딩 모델(refine/배치 파이프라인)을 여러 스레드가 동시에 만들지 않도록 보호
+        self._lazy_lock = threading.Lock()
+        self.pool = None
+        self.cache = None
+        if self.config.cache_path:
+            self.cache = DiskCache(self.config.cache_path, max_bytes=self.config.cache_max_mb * 1024 * 1024)
         # Disable HF symlink warnings and allow duplicate OpenMP libs
         os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "true"
         os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
+
+        if self.config.pool_workers > 0:
+            # 얇은 클라이언트: 모델은 워커 프로세스에 상주
+            from .stt_pool import get_stt_pool
+            self.pool = get_stt_pool(self.config)
+            self.model = None
+            return
         
         try:
             # Initialize Whisper model with enhanced settings
             self.model = WhisperModel(
                 model_size_or_path=self.config.model_name,
                 device=self.config.device,
-                compute_type=self.config.compute_type
+                compute_type=self.config.compute_type,
+                cpu_threads=self.config.cpu_threads,
+                num_workers=self.config.num_workers
             )
             logger.info(f"Initialized WhisperModel({self.config.model_name}) on {self.config.device}")
         except Exception as e:
@@ -43,7 +179,9 @@ class STTClient:
             self.model = WhisperModel(
                 model_size_or_path="base",
                 device=self.config.device,
-                compute_type=self.config.compute_type
+                compute_type=self.config.compute_type,
+                cpu_threads=self.config.cpu_threads,
+                num_workers=self.config.num_workers
             )
             logger.info("Fallback to base model successful")
 
@@ -55,25 +193,183 @@ class STTClient:
         :param audio_path: Path to the audio file
         :return: List of dicts with word and timing
         """
+        cache_key = self._cache_key(audio_path)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Transcript cache hit for {audio_path}")
+                return _expand_words(cached)
+
+        if self.pool is not None:
+            try:
+                word_timestamps = self.pool.submit("transcribe", audio_path).result()
+            except BrokenProcessPool:
+                self._replace_broken_pool()
+                raise
+        else:
+            word_timestamps = self._transcribe(audio_path)
+        if cache_key:
+            self.cache.set(cache_key, _compact_words(word_timestamps))
+        return word_timestamps
+
+    def _cache_key(self, audio_path: str, batched: bool = False) -> Optional[str]:
+        """
+        Cache key: audio content hash plus every setting that changes the decoded words,
+        including the decoding path (transcribe_batch's batched pipeline segments the audio
+        differently from sequential decoding, and its output depends on batch_size).
+        """
+        if self.cache is None:
+            return None
+        try:
+            fingerprint = audio_fingerprint(audio_path)
+        except OSError as e:
+            logger.warning(f"Cannot fingerprint {audio_path}: {e}")
+            return None
+        c = self.config
+        settings = (
+            f"{c.model_name}|{c.compute_type}|{c.beam_size}|{c.language}|"
+            f"{c.vad_filter}:{c.vad_min_silence_ms}|"
+            f"{c.refine_model_name}:{c.refine_compute_type}:{c.refine_logprob_threshold}:{c.refine_no_speech_threshold}|"
+            f"{f'batched:{c.batch_size}' if batched else 'sequential'}"
+        )
+        return f"{fingerprint}|{hashlib.sha256(settings.encode()).hexdigest()[:16]}"
+
+    def transcribe_audio(self, audio: np.ndarray, initial_prompt: Optional[str] = None) -> List[Dict]:
+        """
+        Transcribe in-memory 16 kHz mono float32 samples (e.g. a chunk still being recorded).
+
+        :param audio: Samples at SAMPLE_RATE
+        :param initial_prompt: Preceding transcript, used as decoding context across chunks
+        :return: List of dicts with word and timing, relative to the start of the samples
+        """
+        if self.pool is not None:
+            try:
+                return self.pool.submit("transcribe_audio", audio, initial_prompt).result()
+            except BrokenProcessPool:
+                self._replace_broken_pool()
+                raise
+        return self._transcribe(audio, initial_prompt)
+
+    def _replace_broken_pool(self) -> None:
+        """
+        A worker process died (crash, OOM kill): the executor is unusable from now on,
+        so drop it from the shared pools and start a fresh one for later requests.
+        """
+        from .stt_pool import discard_stt_pool, get_stt_pool
+        logger.error("STT worker pool is broken (worker process died), starting a new pool")
+        discard_stt_pool(self.pool)
+        self.pool = get_stt_pool(self.config)
+
+    def _transcribe(self, source: Union[str, np.ndarray], initial_prompt: Optional[str] = None) -> List[Dict]:
         start_time = time.time()
         segments, info = self.model.transcribe(
-            audio_path,
+            source,
             beam_size=self.config.beam_size,
             word_timestamps=True,
-            language=self.config.language
+            language=self.config.language,
+            initial_prompt=initial_prompt,
+            **self._vad_kwargs()
         )
-        word_timestamps: List[Dict] = []
-        for segment in segments:
-            for w in segment.words:
-                word_timestamps.append({
-                    "word": w.word,
-                    "start": round(w.start, 2),
-                    "end": round(w.end, 2)
-                })
+        if self.config.refine_model_name:
+            segments = list(segments)
+            if any(self._needs_refine(seg) for seg in segments):
+                if isinstance(source, np.ndarray):
+                    audio = source
+                else:
+                    audio = decode_audio(source, sampling_rate=SAMPLE_RATE)
+                word_timestamps = self._refine_words(audio, segments)
+            else:
+                word_timestamps = _words_from_segments(segments)
+        else:
+            word_timestamps = _words_from_segments(segments)
         elapsed = time.time() - start_time
         logger.info(f"Transcription completed in {elapsed:.2f}s, {len(word_timestamps)} words detected")
         return word_timestamps
 
+    def _needs_refine(self, segment) -> bool:
+        """
+        Cascade mode: a draft segment is re-decoded when the small model was unsure of it.
+        """
+        return (
+            segment.avg_logprob < self.config.refine_logprob_threshold
+            or segment.no_speech_prob > self.config.refine_no_speech_threshold
+        )
+
+    def _get_refine_model(self) -> WhisperModel:
+        # 큰 모델은 실제로 재디코딩이 필요할 때 처음 로드
+        with self._lazy_lock:
+            if self._refine_model is None:
+                self._refine_model = WhisperModel(
+                    model_size_or_path=self.config.refine_model_name,
+                    device=self.config.device,
+                    compute_type=self.config.refine_compute_type,
+                    cpu_threads=self.config.cpu_threads,
+                    num_workers=self.config.num_workers
+                )
+                logger.info(f"Initialized refine WhisperModel({self.config.refine_model_name})")
+            return self._refine_model
+
+    def _refine_words(
+        self, audio: np.ndarray, segments, file_spans: Optional[List[Tuple[float, float]]] = None
+    ) -> List[Dict]:
+        """
+        Keep confident draft segments as-is and re-decode the others with the larger model,
+        stitching everything back into one word-timestamp list on the audio's timeline.
+
+        :param file_spans: (start, end) seconds of each file when audio is the concatenated
+                           batch timeline; padding never reaches into a neighbouring file
+        """
+        word_timestamps: List[Dict] = []
+        refined = 0
+        for segment in segments:
+            if not self._needs_refine(segment):
+                word_timestamps.extend(_words_from_segments([segment]))
+                continue
+            refined += 1
+            span_start, span_end = 0.0, len(audio) / SAMPLE_RATE
+            for file_start, file_end in file_spans or ():
+                if file_start <= segment.start < file_end:
+                    span_start, span_end = file_start, file_end
+                    break
+            clip_start = max(span_start, segment.start - REFINE_PAD_SEC)
+            clip_end = min(span_end, segment.end + REFINE_PAD_SEC)
+            clip = audio[int(clip_start * SAMPLE_RATE):int(clip_end * SAMPLE_RATE)]
+            try:
+                refine_segments, _ = self._get_refine_model().transcribe(
+                    clip,
+                    beam_size=self.config.beam_size,
+                    word_timestamps=True,
+                    language=self.config.language,
+                )
+                word_timestamps.extend(_words_from_segments(refine_segments, offset=-clip_start))
+            except Exception as e:
+                logger.warning(f"Refine decoding failed at {segment.start:.2f}s, keeping draft: {e}")
+                word_timestamps.extend(_words_from_segments([segment]))
+        logger.info(f"Cascade: re-decoded {refined}/{len(segments)} segments with {self.config.refine_model_name}")
+        return word_timestamps
+
+    def _vad_kwargs(self) -> Dict:
+        """
+        VAD-gated mode: let Whisper decode only the speech regions found by the VAD pass.
+        """
+        if not self.config.vad_filter:
+            return {}
+        return {
+            "vad_filter": True,
+            "vad_parameters": {"min_silence_duration_ms": self.config.vad_min_silence_ms},
+        }
+
+    def detect_speech(self, audio_path: str) -> List[Dict]:
+        """
+        Return the speech segments of an audio file as found by the VAD pass (no decoding).
+        Cheap compared to transcribe(); use it for silence/speaking-time metrics.
+
+        :param audio_path: Path to the audio file
+        :return: List of dicts with 'start' and 'end' in seconds
+        """
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+        return detect_speech_segments(audio, self.config.vad_min_silence_ms)
+
     def get_text(self, audio_path: str) -> str:
         """
         Convenience method: transcribe and concatenate words into a single text string.
@@ -81,6 +377,248 @@ class STTClient:
         timestamps = self.transcribe(audio_path)
         return " ".join(item["word"] for item in timestamps)
 
+    def transcribe_batch(self, audio_paths: List[str]) -> List[Optional[List[Dict]]]:
+        """
+        Transcribe several answer clips together through faster-whisper's batched pipeline.
+
+        The speech regions of every clip are laid out on one shared timeline, so windows
+        from different clips fill the same decoding batch (config.batch_size).
+        Word timestamps are mapped back to each clip's own timeline.
+
+        :param audio_paths: Audio files, e.g. every answer of one or more interviews
+        :return: One word-timestamp list per input path, in order; None if that file failed
+        """
+        if self.cache is not None:
+            # 캐시에 있는 파일은 제외하고 나머지만 디코딩
+            results: List[Optional[List[Dict]]] = [None] * len(audio_paths)
+            batched = self._uses_batched_pipeline()
+            keys = [self._cache_key(path, batched) for path in audio_paths]
+            missing = []
+            for i, key in enumerate(keys):
+                cached = self.cache.get(key) if key else None
+                if cached is None:
+                    missing.append(i)
+                else:
+                    results[i] = _expand_words(cached)
+            logger.info(f"Transcript cache: {len(audio_paths) - len(missing)}/{len(audio_paths)} hits")
+            if missing:
+                decoded = self._transcribe_batch_uncached([audio_paths[i] for i in missing])
+                for i, words in zip(missing, decoded):
+                    results[i] = words
+                    if words is not None and keys[i]:
+                        self.cache.set(keys[i], _compact_words(words))
+            return results
+        return self._transcribe_batch_uncached(audio_paths)
+
+    def _transcribe_batch_uncached(self, audio_paths: List[str]) -> List[Optional[List[Dict]]]:
+        if self.pool is not None:
+            # 파일을 워커 수만큼 나눠 각 워커에서 배치 처리
+            workers = self.pool.workers
+            shards = [audio_paths[i::workers] for i in range(workers)]
+            results: List[Optional[List[Dict]]] = [None] * len(audio_paths)
+            try:
+                futures = [self.pool.submit("transcribe_batch", shard) for shard in shards if shard]
+            except BrokenProcessPool:
+                self._replace_broken_pool()
+                return results
+            broken = False
+            for shard_idx, future in enumerate(futures):
+                try:
+                    shard_words = future.result()
+                except BrokenProcessPool:
+                    # 죽은 워커가 맡은 파일은 실패(None)로 남김
+                    logger.error(f"STT worker died, {len(shards[shard_idx])} files not transcribed")
+                    broken = True
+                    continue
+                for j, words in enumerate(shard_words):
+                    results[shard_idx + j * workers] = words
+            if broken:
+                self._replace_broken_pool()
+            return results
+
+        if not self._uses_batched_pipeline():
+            return [self._transcribe_or_none(path) for path in audio_paths]
+
+        start_time = time.time()
+        results: List[Optional[List[Dict]]] = [None] * len(audio_paths)
+        arrays: List[np.ndarray] = []
+        spans = []  # (index, offset, duration) in seconds
+        clips: List[Dict[str, int]] = []
+        offset = 0  # samples
+        for i, path in enumerate(audio_paths):
+            try:
+                audio = decode_audio(path, sampling_rate=SAMPLE_RATE)
+            except Exception as e:
+                logger.error(f"Failed to decode audio {path}: {e}")
+                continue
+            arrays.append(audio)
+            spans.append((i, offset / SAMPLE_RATE, len(audio) / SAMPLE_RATE))
+            clips.extend(_speech_clips(audio, offset))
+            results[i] = []
+            offset += len(audio)
+
+        if clips:
+            try:
+                with self._lazy_lock:
+                    if self._batched is None:
+                        self._batched = BatchedInferencePipeline(model=self.model)
+                timeline = np.concatenate(arrays)
+                segments, _ = self._batched.transcribe(
+                    timeline,
+                    language=self.config.language,
+                    beam_size=self.config.beam_size,
+                    word_timestamps=True,
+                    vad_filter=False,
+                    clip_timestamps=clips,
+                    batch_size=self.config.batch_size,
+                )
+                if self.config.refine_model_name:
+                    file_spans = [(file_offset, file_offset + duration) for _, file_offset, duration in spans]
+                    words = self._refine_words(timeline, list(segments), file_spans)
+                else:
+                    words = _words_from_segments(segments)
+            except (RuntimeError, MemoryError):
+                # 디코딩 실행 오류(메모리 부족 등)만 파일별 처리로 되돌림; 인자 오류는 그대로 전달
+                logger.exception("Batched transcription failed, falling back to per-file")
+                return [self._transcribe_or_none(path) for path in audio_paths]
+
+            # 공유 타임라인의 단어를 원래 파일로 되돌림 (구간은 파일 경계를 넘지 않음)
+            for word in words:
+                for i, file_offset, duration in spans:
+                    if file_offset <= word["start"] < file_offset + duration:
+                        results[i].append({
+                            **word,
+                            "start": round(word["start"] - file_offset, 2),
+                            "end": round(word["end"] - file_offset, 2),
+                        })
+                        break
+
+        elapsed = time.time() - start_time
+        logger.info(f"Batched transcription of {len(audio_paths)} files completed in {elapsed:.2f}s")
+        return results
+
+    def _uses_batched_pipeline(self) -> bool:
+        # 풀 모드에서는 워커가 같은 설정으로 같은 판단을 함
+        return BATCHED_PIPELINE_AVAILABLE and self.config.batch_size > 1
+
+    def get_texts(self, audio_paths: List[str]) -> List[Optional[str]]:
+        """
+        Batched counterpart of get_text: one text per path, None where transcription failed.
+        """
+        return [
+            None if words is None else " ".join(item["word"] for item in words)
+            for words in self.transcribe_batch(audio_paths)
+        ]
+
+    def iter_transcripts(
+        self, audio_paths: List[str], group_size: Optional[int] = None
+    ) -> Iterator[Tuple[int, Optional[List[Dict]]]]:
+        """
+        Like transcribe_batch, but yields (index, word timestamps) as soon as each group of
+        files is transcribed, so callers can start downstream work (e.g. LLM evaluation) on
+        earlier answers while later ones are still being decoded. In pool mode a group spans
+        every worker.
+
+        :param group_size: Files per transcribe_batch call (per worker, default
+                           config.pipeline_group_size, or config.batch_size when that is 0);
+                           larger groups batch better across files but delay the first result,
+                           and a group covering every file leaves nothing to overlap
+        """
+        group_size = group_size or self.config.pipeline_group_size or self.config.batch_size
+        step = max(1, group_size) * (self.pool.workers if self.pool is not None else 1)
+        for start in range(0, len(audio_paths), step):
+            for offset, words in enumerate(self.transcribe_batch(audio_paths[start:start + step])):
+                yield start + offset, words
+
+    def iter_texts(
+        self, audio_paths: List[str], group_size: Optional[int] = None
+    ) -> Iterator[Tuple[int, Optional[str]]]:
+        """
+        Text form of iter_transcripts: yields (index, text), None where transcription failed.
+        """
+        for i, words in self.iter_transcripts(audio_paths, group_size):
+            yield i, None if words is None else " ".join(item["word"] for item in words)
+
+    def _transcribe_or_none(self, audio_path: str) -> Optional[List[Dict]]:
+        try:
+            return self.transcribe(audio_path)
+        except Exception as e:
+            logger.error(f"Transcription failed for {audio_path}: {e}")
+            return None
+
+
+class StreamingTranscriber:
+    """
+    Background transcriber for speech chunks delivered while recording is still running.
+    Each chunk is decoded as soon as it arrives, so the transcript is nearly complete
+    when the candidate stops talking.
+
+    Usage:
+        transcriber = StreamingTranscriber(stt_client)
+        recorder = AudioRecorder(config, on_speech_chunk=transcriber.submit)
+        ...  # record_start() / record_stop()
+        word_timestamps = transcriber.finish()  # None if any chunk failed
+    """
+    def __init__(self, stt_client: STTClient):
+        self.stt_client = stt_client
+        self.word_timestamps: List[Dict] = []
+        self.failed = False
+        self._cancelled = False
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, pcm: bytes, offset: float, sample_rate: int) -> None:
+        """
+        Queue a chunk of 16-bit mono PCM that starts offset seconds into the recording.
+        """
+        self._queue.put((pcm, offset, sample_rate))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None or self._cancelled:
+                return
+            if self.failed:
+                continue
+            pcm, offset, sample_rate = item
+            try:
+                audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+                if sample_rate != SAMPLE_RATE:
+                    # Whisper 입력 레이트로 선형 리샘플링
+                    target_len = int(len(audio) * SAMPLE_RATE / sample_rate)
+                    audio = np.interp(
+                        np.linspace(0, len(audio), target_len, endpoint=False),
+                        np.arange(len(audio)),
+                        audio,
+                    ).astype(np.float32)
+                context = " ".join(w["word"] for w in self.word_timestamps[-50:]) or None
+                for w in self.stt_client.transcribe_audio(audio, initial_prompt=context):
+                    self.word_timestamps.append({
+                        **w,
+                        "start": round(w["start"] + offset, 2),
+                        "end": round(w["end"] + offset, 2),
+                    })
+            except Exception as e:
+                logger.error(f"Streaming transcription failed at {offset:.2f}s: {e}")
+                self.failed = True
+
+    def finish(self) -> Optional[List[Dict]]:
+        """
+        Wait for queued chunks to be decoded and return the stitched word timestamps,
+        or None if a chunk failed (callers then transcribe the saved file instead).
+        """
+        self._queue.put(None)
+        self._thread.join()
+        return None if self.failed else self.word_timestamps
+
+    def cancel(self) -> None:
+        """
+        Drop pending chunks without decoding them (e.g. interview aborted mid-answer).
+        """
+        self._cancelled = True
+        self._queue.put(None)
+
 
 def calculate_silence_duration(word_timestamps: List[Dict]) -> float:
     """
@@ -97,6 +635,28 @@ def calculate_silence_duration(word_timestamps: List[Dict]) -> float:
     return round(total_silence, 2)
 
 
+def calculate_speaking_duration(speech_segments: List[Dict]) -> float:
+    """
+    Total speaking time (in seconds) covered by VAD speech segments.
+
+    :param speech_segments: List of dicts with 'start' and 'end' times
+    :return: Speaking duration rounded to 2 decimal places
+    """
+    return round(sum(max(0.0, seg["end"] - seg["start"]) for seg in speech_segments), 2)
+
+
+def calculate_silence_from_speech(speech_segments: List[Dict], total_duration: float) -> float:
+    """
+    Silence duration (in seconds) derived from VAD speech segments, including leading
+    and trailing silence that word-gap based calculate_silence_duration cannot see.
+
+    :param speech_segments: List of dicts with 'start' and 'end' times
+    :param total_duration: Length of the whole audio clip in seconds
+    :return: Silence duration rounded to 2 decimal places
+    """
+    return round(max(0.0, total_duration - calculate_speaking_duration(speech_segments)), 2)
+
+
 def calculate_audio_duration(audio_path: str) -> float:
     """
     Return the duration of an audio file in seconds.
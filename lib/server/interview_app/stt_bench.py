@@ -0,0 +1,204 @@
+# stt_bench.py
+# Benchmark STTConfig choices on local fixture clips: speed (RTF, latency, RSS) vs accuracy (CER/WER)
+
+import os
+import re
+import json
+import glob
+import time
+import logging
+import itertools
+import multiprocessing
+from dataclasses import asdict, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rich.console import Console
+from rich.table import Table
+
+from .config import STTConfig
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+_PUNCT = re.compile(r"[^\w\s]")
+
+
+def load_fixtures(fixture_dir: str) -> List[Tuple[str, str]]:
+    """
+    Collect (wav_path, reference_text) pairs: every *.wav needs a *.txt with the same stem.
+    """
+    fixtures = []
+    for wav_path in sorted(glob.glob(os.path.join(fixture_dir, "*.wav"))):
+        ref_path = os.path.splitext(wav_path)[0] + ".txt"
+        if not os.path.exists(ref_path):
+            logger.warning(f"No reference transcript for {wav_path}, skipped")
+            continue
+        with open(ref_path, "r", encoding="utf-8") as f:
+            fixtures.append((wav_path, f.read().strip()))
+    return fixtures
+
+
+def _edit_distance(ref: Sequence, hyp: Sequence) -> int:
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        curr = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, start=1):
+            curr[j] = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = curr
+    return prev[-1]
+
+
+def error_counts(reference: str, hypothesis: str) -> Dict[str, int]:
+    """
+    Character and word edit counts after lower-casing and removing punctuation.
+    CER ignores spacing, since Korean word spacing in references is often inconsistent.
+    """
+    ref_words = _PUNCT.sub("", reference.lower()).split()
+    hyp_words = _PUNCT.sub("", hypothesis.lower()).split()
+    ref_chars, hyp_chars = "".join(ref_words), "".join(hyp_words)
+    return {
+        "char_errors": _edit_distance(ref_chars, hyp_chars),
+        "chars": len(ref_chars),
+        "word_errors": _edit_distance(ref_words, hyp_words),
+        "words": len(ref_words),
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024 if os.uname().sysname == "Darwin" else 1024), 1)
+
+
+def _run_config(config: STTConfig, fixtures: List[Tuple[str, str]], warmup: bool) -> Dict:
+    """
+    Runs in a fresh process per configuration so peak RSS belongs to that configuration only.
+    """
+    from .stt import STTClient, calculate_audio_duration
+
+    load_start = time.perf_counter()
+    client = STTClient(config)
+    load_sec = time.perf_counter() - load_start
+    paths = [path for path, _ in fixtures]
+    if warmup and paths:
+        client.transcribe(paths[0])
+
+    latencies: List[float] = []
+    hypotheses: List[str] = []
+    batched = config.batch_size > 1
+    if batched:
+        # 배치 모드는 한 번의 호출로 전체 클립을 처리하므로 파일별 지연시간은 측정할 수 없음
+        start = time.perf_counter()
+        results = client.transcribe_batch(paths)
+        batch_sec = time.perf_counter() - start
+        hypotheses = [" ".join(w["word"] for w in words or []) for words in results]
+    else:
+        for path in paths:
+            start = time.perf_counter()
+            words = client.transcribe(path)
+            latencies.append(time.perf_counter() - start)
+            hypotheses.append(" ".join(w["word"] for w in words))
+
+    totals = {"char_errors": 0, "chars": 0, "word_errors": 0, "words": 0}
+    for (_, reference), hypothesis in zip(fixtures, hypotheses):
+        for k, v in error_counts(reference, hypothesis).items():
+            totals[k] += v
+    audio_sec = sum(calculate_audio_duration(path) for path in paths)
+    processing_sec = batch_sec if batched else sum(latencies)
+    return {
+        "config": asdict(config),
+        "clips": len(paths),
+        "audio_sec": round(audio_sec, 2),
+        "load_sec": round(load_sec, 2),
+        "processing_sec": round(processing_sec, 2),
+        "rtf": round(processing_sec / audio_sec, 4) if audio_sec else None,
+        # 파일별 지연시간 분포 (배치 모드는 None), 클립당 평균 처리 시간은 두 모드 모두 보고
+        "latency_mode": "batch" if batched else "per_file",
+        "latency_p50_sec": None if batched else round(_percentile(latencies, 50), 3),
+        "latency_p95_sec": None if batched else round(_percentile(latencies, 95), 3),
+        "per_clip_sec": round(processing_sec / len(paths), 3) if paths else None,
+        "peak_rss_mb": _peak_rss_mb(),
+        "cer": round(totals["char_errors"] / totals["chars"], 4) if totals["chars"] else None,
+        "wer": round(totals["word_errors"] / totals["words"], 4) if totals["words"] else None,
+    }
+
+
+def build_configs(
+    base: STTConfig,
+    models: Sequence[str],
+    compute_types: Sequence[str],
+    beam_sizes: Sequence[int],
+    batch_sizes: Sequence[int],
+    vad_modes: Sequence[bool],
+) -> List[STTConfig]:
+    """
+    Cartesian product of the given options. Cache and worker pool are always disabled
+    so every configuration really decodes every clip in-process.
+    """
+    return [
+        replace(base, model_name=m, compute_type=c, beam_size=b, batch_size=n, vad_filter=v,
+                cache_path=None, pool_workers=0)
+        for m, c, b, n, v in itertools.product(models, compute_types, beam_sizes, batch_sizes, vad_modes)
+    ]
+
+
+def run_benchmark(
+    fixture_dir: str,
+    configs: List[STTConfig],
+    output_json: Optional[str] = None,
+    warmup: bool = True,
+) -> List[Dict]:
+    """
+    Benchmark each configuration over the fixture set, print a table and optionally save JSON.
+
+    :param fixture_dir: Directory of *.wav clips with same-stem *.txt reference transcripts
+    :param configs: STT configurations to compare
+    :param output_json: Where to write the raw results (None: table only)
+    :param warmup: Decode the first clip once before timing (excludes lazy initialisation)
+    :return: One result dict per configuration
+    """
+    fixtures = load_fixtures(fixture_dir)
+    if not fixtures:
+        raise ValueError(f"No fixture clips (*.wav + *.txt) found in {fixture_dir}")
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for config in configs:
+        label = f"{config.model_name}/{config.compute_type}/beam{config.beam_size}/batch{config.batch_size}/vad{'on' if config.vad_filter else 'off'}"
+        console.print(f"[bold blue]Benchmarking[/bold blue] {label} on {len(fixtures)} clips...")
+        with ctx.Pool(1) as pool:
+            result = pool.apply(_run_config, (config, fixtures, warmup))
+        result["label"] = label
+        results.append(result)
+
+    table = Table(title="STT benchmark")
+    for column in ("config", "RTF", "file p50 (s)", "file p95 (s)", "mean/clip (s)", "peak RSS (MB)", "CER", "WER", "load (s)"):
+        table.add_column(column)
+    for r in results:
+        # 배치 모드는 파일별 지연시간이 없음
+        p50 = "n/a (batch)" if r["latency_p50_sec"] is None else str(r["latency_p50_sec"])
+        p95 = "n/a (batch)" if r["latency_p95_sec"] is None else str(r["latency_p95_sec"])
+        table.add_row(
+            r["label"], str(r["rtf"]), p50, p95, str(r["per_clip_sec"]),
+            str(r["peak_rss_mb"]), str(r["cer"]), str(r["wer"]), str(r["load_sec"]),
+        )
+    console.print(table)
+
+    if output_json:
+        with open(output_json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=4)
+        console.print(f"[bold green]Benchmark results saved to {output_json}[/bold green]")
+    return results
@@ -0,0 +1,95 @@
+# stt_pool.py
+# Process pool of resident Whisper models with an explicit CPU thread budget per worker
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from typing import Dict
+
+from .config import STTConfig
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스마다 하나씩 상주하는 STTClient
+_worker_client = None
+
+
+def _init_worker(config: STTConfig, cpu_threads: int) -> None:
+    """
+    Worker initializer: load the model once with the worker's thread budget.
+    The budget is enforced through WhisperModel(cpu_threads=...), not OMP_NUM_THREADS:
+    by the time the initializer runs, unpickling it has already imported this package
+    (and CTranslate2) in the spawned process.
+    """
+    global _worker_client
+    from .stt import STTClient
+    # 캐시는 요청 측(얇은 클라이언트)에서만 사용
+    _worker_client = STTClient(replace(config, pool_workers=0, cpu_threads=cpu_threads, cache_path=None))
+
+
+def _run(method: str, *args):
+    return getattr(_worker_client, method)(*args)
+
+
+class STTWorkerPool:
+    """
+    N worker processes, each holding a resident WhisperModel with a fixed number of CPU threads.
+    Concurrent transcriptions queue for a free worker instead of oversubscribing the cores.
+
+    Usage:
+        pool = get_stt_pool(STTConfig(pool_workers=2))
+        words = pool.submit("transcribe", "answer.wav").result()
+    """
+    def __init__(self, config: STTConfig):
+        self.workers = config.pool_workers
+        # 스레드 예산: 명시값이 없으면 코어를 워커 수로 나눠서 배분
+        self.cpu_threads = config.cpu_threads or max(1, (os.cpu_count() or 1) // self.workers)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(config, self.cpu_threads),
+        )
+        logger.info(f"Started STT worker pool: {self.workers} workers x {self.cpu_threads} threads")
+
+    def submit(self, method: str, *args) -> Future:
+        """
+        Run an STTClient method (e.g. "transcribe", "transcribe_batch") in a worker process.
+        """
+        return self.executor.submit(_run, method, *args)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+
+_pools: Dict[str, STTWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_stt_pool(config: STTConfig) -> STTWorkerPool:
+    """
+    Return the process-wide pool for this configuration, starting it on first use,
+    so every STTClient with the same settings shares the same resident models.
+    """
+    key = repr(config)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = STTWorkerPool(config)
+            _pools[key] = pool
+        return pool
+
+
+def discard_stt_pool(pool: STTWorkerPool) -> None:
+    """
+    Forget a pool whose executor is broken (a worker process died), so the next
+    get_stt_pool call with the same configuration starts a new one.
+    """
+    with _pools_lock:
+        for key, cached in list(_pools.items()):
+            if cached is pool:
+                del _pools[key]
+    pool.executor.shutdown(wait=False)
@@ -0,0 +1,90 @@
+# triage.py
+# Classify answers before LLM evaluation so that non-answers get deterministic low scores
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .config import TriageConfig
+from .prompts import EVALUATION_CRITERIA
+
+# STT 실패/무음 시 답변 자리에 들어가는 문구 (unified_api, GUI와 공유)
+STT_FAILED_PLACEHOLDER = "음성 인식 실패"
+NO_SPEECH_PLACEHOLDER = "음성을 인식할 수 없습니다."
+STT_ERROR_PLACEHOLDER = "음성 인식 오류"
+PLACEHOLDER_ANSWERS = (STT_FAILED_PLACEHOLDER, NO_SPEECH_PLACEHOLDER, STT_ERROR_PLACEHOLDER)
+
+
+@dataclass
+class TriageResult:
+    """
+    Outcome of triage for one answer.
+    substantive=True means the answer should go to the LLM; otherwise reason/comment
+    describe why it was scored without the model, and score (if not None) overrides
+    the rating-based total score.
+    """
+    substantive: bool
+    reason: str = ""
+    comment: str = ""
+    score: Optional[int] = None
+
+    def evaluation(self) -> dict:
+        """'낮음' 평가 구조 (LLM 평가와 같은 형식)"""
+        return {name: {"rating": "낮음", "comment": self.comment} for name in EVALUATION_CRITERIA}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.replace(".", " ").split())
+
+
+def is_placeholder_answer(answer: str) -> bool:
+    normalized = _normalize(answer)
+    return any(normalized == _normalize(p) for p in PLACEHOLDER_ANSWERS)
+
+
+def triage_answer(
+    answer: str,
+    word_timestamps: Optional[List[Dict]] = None,
+    total_time: Optional[float] = None,
+    config: Optional[TriageConfig] = None,
+) -> TriageResult:
+    """
+    답변이 LLM 평가가 필요한 실질적인 답변인지 판단합니다.
+    텍스트만으로 판단하는 규칙(플레이스홀더, 단어 수, 무응답 표현)을 먼저 적용하고,
+    단어 타임스탬프가 주어지면 발화 비율(녹음 길이 대비 단어 구간 합)과 인식 신뢰도도 확인합니다.
+
+    :param answer: STT 결과 텍스트
+    :param word_timestamps: STT 단어 목록 ('probability'가 있으면 신뢰도 규칙 적용)
+    :param total_time: 녹음 길이 (초)
+    """
+    config = config or TriageConfig()
+
+    if is_placeholder_answer(answer):
+        return TriageResult(False, "placeholder", "음성이 인식되지 않아 답변을 평가할 수 없습니다.", score=0)
+
+    normalized = _normalize(answer)
+    if normalized in {_normalize(p) for p in config.non_answer_phrases}:
+        return TriageResult(False, "non_answer", "질문에 대한 답변을 제시하지 않았습니다.")
+
+    word_count = len(normalized.split())
+    if word_count < config.min_words:
+        return TriageResult(False, "too_short", f"답변이 너무 짧아({word_count}단어) 평가할 내용이 없습니다.")
+
+    if word_timestamps and total_time and total_time >= config.min_audio_sec:
+        spoken = sum(max(0.0, w["end"] - w["start"]) for w in word_timestamps)
+        speech_ratio = min(1.0, spoken / total_time)
+        if speech_ratio < config.min_speech_ratio:
+            return TriageResult(
+                False, "mostly_silence",
+                f"녹음 시간의 대부분이 침묵입니다(발화 비율 {speech_ratio:.0%}).",
+            )
+
+    probabilities = [w["probability"] for w in word_timestamps or [] if w.get("probability") is not None]
+    if probabilities:
+        confidence = sum(probabilities) / len(probabilities)
+        if confidence < config.min_word_confidence:
+            return TriageResult(
+                False, "low_confidence",
+                f"음성 인식 신뢰도가 낮아(평균 {confidence:.2f}) 답변 내용을 확인할 수 없습니다.",
+            )
+
+    return TriageResult(True)
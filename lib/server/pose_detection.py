@@ -3,6 +3,10 @@ import mediapipe as mp
 import numpy as np
 import sys
 import os
+import shutil
+import subprocess
+import queue
+import threading
 from collections import Counter
 
 # MediaPipe Pose 초기화
@@ -20,8 +24,7 @@ def log_mistakes_to_txt(mistakes, timestamp, log_file_path):
         for mistake in mistakes:
             file.write(f"{timestamp:.2f} sec: {mistake}\n")
 
-def check_body_stability(landmarks, threshold=0.05):
-    global previous_positions
+def _stability_positions(landmarks):
     required_landmarks = [
         mp_pose.PoseLandmark.LEFT_SHOULDER, mp_pose.PoseLandmark.RIGHT_SHOULDER,
         mp_pose.PoseLandmark.LEFT_HIP, mp_pose.PoseLandmark.RIGHT_HIP
@@ -33,23 +36,29 @@ def check_body_stability(landmarks, threshold=0.05):
     right_shoulder = landmarks[mp_pose.PoseLandmark.RIGHT_SHOULDER]
     left_hip = landmarks[mp_pose.PoseLandmark.LEFT_HIP]
     right_hip = landmarks[mp_pose.PoseLandmark.RIGHT_HIP]
-    current_positions = np.array([
+    return np.array([
         [left_shoulder.x, left_shoulder.y],
         [right_shoulder.x, right_shoulder.y],
         [left_hip.x, left_hip.y],
         [right_hip.x, right_hip.y]
     ])
-    movement_detected = False
-    if previous_positions is not None:
-        if current_positions.shape == previous_positions.shape:
-            movement = np.linalg.norm(current_positions - previous_positions, axis=1).mean()
-            if movement > threshold:
-                movement_detected = True
-    previous_positions = current_positions
-    if movement_detected:
-        return "몸을 흔들고 있습니다."
+
+def _movement_message(current_positions, last_positions, threshold):
+    if last_positions is not None and current_positions.shape == last_positions.shape:
+        movement = np.linalg.norm(current_positions - last_positions, axis=1).mean()
+        if movement > threshold:
+            return "몸을 흔들고 있습니다."
     return None
 
+def check_body_stability(landmarks, threshold=0.05):
+    global previous_positions
+    current_positions = _stability_positions(landmarks)
+    if current_positions is None:
+        return None
+    message = _movement_message(current_positions, previous_positions, threshold)
+    previous_positions = current_positions
+    return message
+
 def check_knee_position(landmarks):
     required_landmarks = [
         mp_pose.PoseLandmark.LEFT_KNEE, mp_pose.PoseLandmark.RIGHT_KNEE,
@@ -141,6 +150,229 @@ def estimate_gaze_direction(landmarks, image_width, image_height):
     else:
         return f"시선: {gaze_v_direction}-{gaze_h_direction}"
 
+class PoseFrameAnalyzer:
+    """
+    프레임 단위 포즈 분석기 (MediaPipe 모델, 직전 자세, 누적 통계를 인스턴스별로 보관)
+    분석마다 별도 인스턴스를 쓰므로 여러 영상을 동시에 분석해도 상태가 섞이지 않음
+    """
+    def __init__(self, fps: float):
+        self.fps = fps
+        self.pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        self.previous_positions = None
+        self.mistake_counts = Counter()
+        self.gaze_counts    = Counter()
+        self.valid_frames   = 0
+        self.frame_count    = 0
+
+    def check_body_stability(self, landmarks, threshold=0.05):
+        current_positions = _stability_positions(landmarks)
+        if current_positions is None:
+            return None
+        message = _movement_message(current_positions, self.previous_positions, threshold)
+        self.previous_positions = current_positions
+        return message
+
+    def process(self, frame):
+        """
+        BGR 프레임 하나를 분석하고 (MediaPipe 결과, 자세 문제 목록, 시선) 을 반환
+        랜드마크가 없으면 문제 목록은 비어 있고 시선은 None
+        """
+        self.frame_count += 1
+        frame_h, frame_w = frame.shape[:2]
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        res = self.pose.process(rgb)
+        if not res.pose_landmarks:
+            return res, [], None
+
+        self.valid_frames += 1
+        lm = res.pose_landmarks.landmark
+
+        # 자세 체크
+        mistakes = []
+        for fn in (self.check_body_stability, check_knee_position,
+                   check_back_straightness, check_head_tilt):
+            msg = fn(lm)
+            if msg:
+                mistakes.append(msg)
+                self.mistake_counts[msg] += 1
+
+        # 시선 체크
+        gaze = estimate_gaze_direction(lm, frame_w, frame_h)
+        self.gaze_counts[gaze] += 1
+        return res, mistakes, gaze
+
+    @property
+    def timestamp(self) -> float:
+        return self.frame_count / self.fps
+
+    def summary_text(self) -> str:
+        lines = ["\n\n--- 분석 결과 요약 ---", "[자세 문제점별 감지 프레임 수]"]
+        for msg, cnt in self.mistake_counts.items():
+            sec = cnt / self.fps
+            lines.append(f"- {msg}: {cnt}회 ({sec:.2f}초)")
+        lines.append("\n[시선 분석]")
+        if self.valid_frames:
+            for g, cnt in self.gaze_counts.items():
+                pct = cnt / self.valid_frames * 100
+                lines.append(f"- {g}: {cnt}프레임 ({pct:.1f}%)")
+        else:
+            lines.append("랜드마크가 감지된 프레임이 없습니다.")
+        lines.append(f"\n[총 영상 길이] {self.frame_count/self.fps:.2f}초")
+        return "\n".join(lines) + "\n"
+
+    def close(self):
+        self.pose.close()
+
+def _draw_overlay(frame, res, mistakes, gaze):
+    overlay_frame = frame.copy()
+    if res.pose_landmarks:
+        frame_h = frame.shape[0]
+        # 포즈 랜드마크 드로잉
+        mp_drawing.draw_landmarks(overlay_frame, res.pose_landmarks, mp_pose.POSE_CONNECTIONS)
+        # 문제 피드백 문구 오버레이
+        y = 30
+        for mistake in mistakes:
+            cv2.putText(overlay_frame, mistake, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
+            y += 30
+        if gaze:
+            cv2.putText(overlay_frame, gaze, (20, frame_h - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 100, 0), 2)
+    return overlay_frame
+
+def find_ffmpeg():
+    """PATH 또는 FFMPEG_BINARY 환경변수에서 ffmpeg 실행 파일을 찾음 (없으면 None)"""
+    return shutil.which(os.environ.get("FFMPEG_BINARY", "ffmpeg"))
+
+class FFmpegVideoWriter:
+    """
+    cv2.VideoWriter와 같은 write()/release() 인터페이스로, 원본 BGR 프레임을
+    ffmpeg 하위 프로세스에 파이프로 넘겨 인코딩하는 결과 영상 저장기
+
+    - .webm: VP9 (libvpx-vp9, realtime), 그 외: H.264 (libx264, veryfast, yuv420p, faststart)
+    - 인코딩은 별도 프로세스에서 수행되고, 파이프 쓰기도 전용 스레드가 맡아
+      분석 스레드는 프레임을 큐에 넣기만 함 (브라우저/Flutter에서 바로 재생 가능)
+    """
+    QUEUE_SIZE = 64
+
+    def __init__(self, output_path: str, fps: float, frame_size, ffmpeg_exe: str = None):
+        ffmpeg_exe = ffmpeg_exe or find_ffmpeg()
+        if not ffmpeg_exe:
+            raise RuntimeError("FFmpeg를 찾을 수 없습니다.")
+        frame_w, frame_h = frame_size
+        if output_path.lower().endswith(".webm"):
+            codec_args = ['-c:v', 'libvpx-vp9', '-deadline', 'realtime', '-cpu-used', '8',
+                          '-row-mt', '1', '-b:v', '0', '-crf', '36']
+        else:
+            codec_args = ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '26',
+                          '-movflags', '+faststart']
+        # yuv420p는 짝수 해상도가 필요
+        scale_args = ['-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2']
+        self.proc = subprocess.Popen(
+            [ffmpeg_exe, '-loglevel', 'error', '-y',
+             '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', f'{frame_w}x{frame_h}', '-r', str(fps),
+             '-i', 'pipe:0', '-an', *scale_args, *codec_args, '-pix_fmt', 'yuv420p', output_path],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        )
+        self.output_path = output_path
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._stderr = b""
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self._thread = threading.Thread(target=self._pump, daemon=True)
+        self._thread.start()
+
+    def _drain_stderr(self):
+        self._stderr = self.proc.stderr.read()
+
+    def _pump(self):
+        broken = False
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if broken:
+                continue
+            try:
+                self.proc.stdin.write(frame.tobytes())
+            except (BrokenPipeError, OSError):
+                # ffmpeg 종료 후에도 큐는 계속 비워서 write()가 막히지 않게 함
+                broken = True
+        try:
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    def write(self, frame) -> None:
+        self._queue.put(frame)
+
+    def release(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self._stderr_thread.join()
+        if self.proc.wait() != 0:
+            # 중간에 인코딩이 실패하면 잘린 파일이 남으므로 지우고 호출자에게 알림
+            # (프레임을 이미 흘려보냈으므로 다른 인코더로 다시 만들 수 없음)
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+            raise RuntimeError(f"결과 영상 인코딩 실패 ({self.output_path}): "
+                               f"{self._stderr.decode('utf-8', 'ignore')[:200]}")
+
+def open_video_writer(output_video: str, fps: float, frame_size):
+    """
+    FFmpeg 파이프 인코더를 우선 사용하고, FFmpeg가 없거나 시작에 실패하면 cv2.VideoWriter(mp4v)로 대체
+    (FFmpeg가 인코딩 도중 실패하면 release()에서 RuntimeError)
+    """
+    if find_ffmpeg():
+        try:
+            return FFmpegVideoWriter(output_video, fps, frame_size)
+        except Exception as e:
+            print(f"⚠️ FFmpeg 인코더 시작 실패, OpenCV 인코더 사용: {e}")
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(output_video, fourcc, fps, frame_size)
+
+def _analyze_frames(frames, fps: float, output_log_path: str, output_video: str = None) -> None:
+    """
+    프레임 이터레이터를 분석해 문제점 로그와 요약을 output_log_path에 기록
+    (파일 분석과 스트리밍 분석이 공통으로 사용)
+    """
+    if os.path.exists(output_log_path):
+        os.remove(output_log_path)
+
+    analyzer = PoseFrameAnalyzer(fps)
+    out = None
+    try:
+        for frame in frames:
+            res, mistakes, gaze = analyzer.process(frame)
+
+            # 프레임별 문제 로그
+            if mistakes:
+                log_mistakes_to_txt(mistakes, analyzer.timestamp, output_log_path)
+
+            # 분석 결과 동영상 저장 (첫 프레임에서 해상도 결정)
+            if output_video:
+                if out is None:
+                    frame_h, frame_w = frame.shape[:2]
+                    out = open_video_writer(output_video, fps, (frame_w, frame_h))
+                out.write(_draw_overlay(frame, res, mistakes, gaze))
+    finally:
+        analyzer.close()
+        if out:
+            try:
+                out.release()
+            except RuntimeError as e:
+                # 결과 영상은 부가 산출물: 인코딩이 실패해도(파일은 지워짐) 분석 중 예외를 가리지 않고 요약은 기록
+                print(f"⚠️ {e}")
+
+    # 요약 기록
+    with open(output_log_path, "a", encoding="utf-8") as f:
+        f.write(analyzer.summary_text())
+
+def _read_frames(cap):
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        yield frame
+
 def analyze_video(video_path: str, output_log_path: str, output_video: str = None) -> None:
     """
     1) video_path 영상을 열어서 MediaPipe 분석
@@ -148,91 +380,162 @@ def analyze_video(video_path: str, output_log_path: str, output_video: str = Non
     3) 마지막에 요약(횟수, 퍼센트 등)도 같은 파일에 덧붙임
     4) output_video 인자가 주어지면 분석 결과(포즈+문구)가 그려진 영상을 저장
     """
-    global previous_positions
-    previous_positions = None
-
-    if os.path.exists(output_log_path):
-        os.remove(output_log_path)
-
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         raise RuntimeError(f"영상을 열 수 없습니다: {video_path}")
 
     fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
-    frame_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-    frame_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-    frame_count = 0
+    try:
+        _analyze_frames(_read_frames(cap), fps, output_log_path, output_video)
+    finally:
+        cap.release()
 
-    # 분석 결과 동영상 저장 준비
-    out = None
-    if output_video:
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_video, fourcc, fps, (frame_w, frame_h))
+# === 업로드 스트리밍 분석 ===
 
-    mistake_counts = Counter()
-    gaze_counts    = Counter()
-    valid_frames   = 0
+# 스트림 디코딩 시 고정 프레임레이트 (컨테이너 메타데이터가 아직 없을 수 있음)
+STREAM_FPS = 30.0
+BMP_HEADER_SIZE = 14
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        frame_count += 1
-        timestamp = frame_count / fps
+class PoseStreamAnalyzer:
+    """
+    업로드가 진행되는 동안 바이트를 ffmpeg 파이프로 디코딩하면서 바로 포즈 분석을 수행
+    (WebM, fragmented MP4처럼 앞부분부터 디코딩 가능한 컨테이너 대상)
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res = pose.process(rgb)
-
-        overlay_frame = frame.copy()
-
-        if res.pose_landmarks:
-            valid_frames += 1
-            lm = res.pose_landmarks.landmark
-
-            # 자세 체크
-            mistakes = []
-            for fn in (check_body_stability, check_knee_position,
-                       check_back_straightness, check_head_tilt):
-                msg = fn(lm)
-                if msg:
-                    mistakes.append(msg)
-                    mistake_counts[msg] += 1
-
-            # 시선 체크
-            gaze = estimate_gaze_direction(lm, frame_w, frame_h)
-            gaze_counts[gaze] += 1
-
-            # 포즈 랜드마크 드로잉
-            mp_drawing.draw_landmarks(overlay_frame, res.pose_landmarks, mp_pose.POSE_CONNECTIONS)
-            # 문제 피드백 문구 오버레이
-            y = 30
-            for mistake in mistakes:
-                cv2.putText(overlay_frame, mistake, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 255), 2)
-                y += 30
-            if gaze:
-                cv2.putText(overlay_frame, gaze, (20, frame_h - 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 100, 0), 2)
+    Usage:
+        analyzer = PoseStreamAnalyzer("pose_log.txt")
+        for chunk in upload_chunks:
+            analyzer.feed(chunk)
+        analyzer.finish()  # 분석 스레드 종료 대기, 실패 시 예외 전파
+        # 업로드 도중 실패하면 analyzer.abort()로 ffmpeg 프로세스/스레드 정리
+    """
+    def __init__(self, output_log_path: str, output_video: str = None,
+                 fps: float = STREAM_FPS, ffmpeg_exe: str = None):
+        ffmpeg_exe = ffmpeg_exe or find_ffmpeg()
+        if not ffmpeg_exe:
+            raise RuntimeError("FFmpeg를 찾을 수 없어 스트리밍 분석을 할 수 없습니다.")
+        self.output_log_path = output_log_path
+        self.output_video = output_video
+        self.fps = fps
+        # 프레임마다 헤더에 크기가 들어있는 BMP로 내보내 해상도를 미리 몰라도 프레임을 나눌 수 있음
+        self.proc = subprocess.Popen(
+            [ffmpeg_exe, '-loglevel', 'error', '-i', 'pipe:0', '-an',
+             '-r', str(fps), '-f', 'image2pipe', '-vcodec', 'bmp', 'pipe:1'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        self._error = None
+        self._stderr = b""
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
-            # 프레임별 문제 로그
-            if mistakes:
-                log_mistakes_to_txt(mistakes, timestamp, output_log_path)
-        if out:
-            out.write(overlay_frame)
-    cap.release()
-    if out:
-        out.release()
+    def _drain_stderr(self):
+        self._stderr = self.proc.stderr.read()
 
-    # 요약 기록
-    with open(output_log_path, "a", encoding="utf-8") as f:
-        f.write("\n\n--- 분석 결과 요약 ---\n")
-        f.write("[자세 문제점별 감지 프레임 수]\n")
-        for msg, cnt in mistake_counts.items():
-            sec = cnt / fps
-            f.write(f"- {msg}: {cnt}회 ({sec:.2f}초)\n")
-        f.write("\n[시선 분석]\n")
-        if valid_frames:
-            for g, cnt in gaze_counts.items():
-                pct = cnt / valid_frames * 100
-                f.write(f"- {g}: {cnt}프레임 ({pct:.1f}%)\n")
-        else:
-            f.write("랜드마크가 감지된 프레임이 없습니다.\n")
-        f.write(f"\n[총 영상 길이] {frame_count/fps:.2f}초\n")
+    def _frames(self):
+        stdout = self.proc.stdout
+        while True:
+            header = stdout.read(BMP_HEADER_SIZE)
+            if len(header) < BMP_HEADER_SIZE:
+                return
+            size = int.from_bytes(header[2:6], "little")
+            body = stdout.read(size - BMP_HEADER_SIZE)
+            if len(body) < size - BMP_HEADER_SIZE:
+                return
+            frame = cv2.imdecode(np.frombuffer(header + body, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is None:
+                return
+            yield frame
+
+    def _run(self):
+        try:
+            _analyze_frames(self._frames(), self.fps, self.output_log_path, self.output_video)
+        except Exception as e:
+            self._error = e
+        finally:
+            # 분석이 중간에 실패해도 ffmpeg가 stdout 쓰기에서 막히지 않도록 비워줌
+            self.proc.stdout.read()
+
+    def feed(self, chunk: bytes) -> None:
+        """수신한 바이트 조각을 디코더로 전달"""
+        if not chunk:
+            return
+        try:
+            self.proc.stdin.write(chunk)
+        except (BrokenPipeError, OSError):
+            # ffmpeg가 먼저 종료된 경우: finish()에서 원인을 보고
+            pass
+
+    def finish(self) -> None:
+        """입력 종료를 알리고 분석이 끝날 때까지 대기"""
+        try:
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self._thread.join()
+        self._stderr_thread.join()
+        returncode = self.proc.wait()
+        if self._error:
+            raise self._error
+        if returncode != 0:
+            raise RuntimeError(f"영상 디코딩 실패: {self._stderr.decode('utf-8', 'ignore')[:200]}")
+
+    def abort(self) -> None:
+        """분석을 중단하고 디코더 프로세스와 스레드를 정리 (업로드/저장이 실패한 경우)"""
+        if self.proc.poll() is None:
+            self.proc.kill()
+        try:
+            self.proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self._thread.join()
+        self._stderr_thread.join()
+        self.proc.wait()
+
+# === 실시간(면접 중) 분석 ===
+
+class LivePoseSession:
+    """
+    면접 도중 클라이언트가 보내는 JPEG 프레임을 한 장씩 분석하는 상태 유지 세션
+    프레임마다 경고/시선과 누적 요약을 돌려주고, 면접이 끝나면 analyze_video와
+    같은 형식의 리포트를 즉시 만들어 줌
+
+    :param fps: 클라이언트 전송 프레임레이트 (타임스탬프/초 환산 기준)
+    """
+    def __init__(self, fps: float = 5.0):
+        self.analyzer = PoseFrameAnalyzer(fps)
+        self.log_lines = []
+
+    def process_jpeg(self, data: bytes) -> dict:
+        frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError("프레임 이미지를 디코딩할 수 없습니다.")
+        _, mistakes, gaze = self.analyzer.process(frame)
+        timestamp = self.analyzer.timestamp
+        for mistake in mistakes:
+            self.log_lines.append(f"{timestamp:.2f} sec: {mistake}\n")
+        return {
+            "timestamp": round(timestamp, 2),
+            "mistakes": mistakes,
+            "gaze": gaze,
+            "summary": self.running_summary(),
+        }
+
+    def running_summary(self) -> dict:
+        analyzer = self.analyzer
+        gaze = {}
+        if analyzer.valid_frames:
+            gaze = {g: round(cnt / analyzer.valid_frames * 100, 1) for g, cnt in analyzer.gaze_counts.items()}
+        return {
+            "frames": analyzer.frame_count,
+            "valid_frames": analyzer.valid_frames,
+            "mistakes": dict(analyzer.mistake_counts),
+            "gaze_percent": gaze,
+            "duration": round(analyzer.timestamp, 2),
+        }
+
+    def report_text(self) -> str:
+        return "".join(self.log_lines) + self.analyzer.summary_text()
+
+    def close(self):
+        self.analyzer.close()
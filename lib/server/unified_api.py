@@ -1,14 +1,16 @@
 # unified_api.py - 통합 면접 평가 API
 
 import os
+import json
 import uuid
-import shutil
+import threading
 import subprocess
 import wave
 from typing import List, Optional
 
-from fastapi import FastAPI, APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse, FileResponse
+from fastapi import FastAPI, APIRouter, UploadFile, File, Form, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 # === numpy import 처리 ===
@@ -30,13 +32,20 @@ except ImportError:
 
 # 면접 기능 모듈
 from interview_app import (
-    evaluate_and_save_responses,
+    InterviewEvaluator,
+    stream_evaluation,
+    generate_recommended_answer,
+    stream_recommended_answer,
     VideoRecorder,
     VideoConfig,
+    LLMClient,
+    LlamaConfig,
 )
+from interview_app.prompts import EVALUATION_SYSTEM_PROMPT
+from interview_app.triage import STT_FAILED_PLACEHOLDER, NO_SPEECH_PLACEHOLDER
 
 # 포즈 분석 기능
-from pose_detection import analyze_video
+from pose_detection import analyze_video, find_ffmpeg, PoseStreamAnalyzer, LivePoseSession
 
 # 디렉토리 생성
 TMP_DIR    = "./tmp"
@@ -46,8 +55,76 @@ os.makedirs(TMP_DIR,    exist_ok=True)
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(LOG_DIR,    exist_ok=True)
 
+# 업로드 파일을 디스크/분석 스트림으로 넘길 때의 읽기 단위
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# 실시간 포즈 WebSocket에서 허용하는 최대 전송 프레임레이트
+LIVE_POSE_MAX_FPS = 30.0
+
 # === 유틸리티 함수 ===
 
+def open_pose_stream(pose_log_path: str) -> Optional[PoseStreamAnalyzer]:
+    """FFmpeg가 있으면 업로드와 동시에 진행되는 포즈 분석 스트림을 열고, 없으면 None"""
+    if not find_ffmpeg():
+        return None
+    try:
+        return PoseStreamAnalyzer(pose_log_path)
+    except Exception as e:
+        print(f"⚠️ 스트리밍 포즈 분석 시작 실패, 저장 후 분석으로 대체: {e}")
+        return None
+
+def save_upload(upload: UploadFile, video_path: str, pose_stream: Optional[PoseStreamAnalyzer] = None) -> None:
+    """업로드 파일을 저장하면서, 포즈 분석 스트림이 있으면 같은 바이트를 바로 디코더로 전달합니다."""
+    with open(video_path, "wb") as f:
+        while True:
+            chunk = upload.file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            if pose_stream:
+                pose_stream.feed(chunk)
+
+def finish_pose_analysis(pose_stream: Optional[PoseStreamAnalyzer], video_path: str, pose_log_path: str) -> str:
+    """
+    스트리밍 분석이 있으면 마무리를 기다리고, 없으면 저장된 파일로 분석한 뒤 로그 내용을 반환합니다.
+    스트리밍 분석이 실패하면(예: moov atom이 끝에 있는 일반 MP4는 파이프로 디코딩 불가) 저장된 파일로 다시 분석합니다.
+    """
+    if pose_stream:
+        try:
+            pose_stream.finish()
+            with open(pose_log_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            print(f"⚠️ 스트리밍 포즈 분석 실패, 저장된 파일로 다시 분석: {e}")
+    analyze_video(video_path, pose_log_path)
+    with open(pose_log_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+def transcribe_and_evaluate(stt_client, questions_list: List[str], audio_paths: List[str], output_file: str) -> List[str]:
+    """
+    답변 오디오를 순서대로 음성 인식하면서, 인식이 끝난 답변은 바로 평가를 시작합니다.
+    (Whisper 인식과 Ollama 평가가 겹쳐 전체 시간이 두 작업의 합이 아닌 최댓값에 가까워짐)
+    평가 결과는 output_file에 저장되고, 인식된 답변 목록을 반환합니다.
+    """
+    answers = []
+    evaluator = InterviewEvaluator(stt_client=stt_client)
+    try:
+        print(f"🔍 오디오 {len(audio_paths)}개 STT 처리 중...")
+        for i, words in stt_client.iter_transcripts(audio_paths):
+            if words is None:
+                print(f"⚠️ {i+1}번째 STT 실패")
+                answers.append(STT_FAILED_PLACEHOLDER)
+            else:
+                text = " ".join(item["word"] for item in words)
+                answers.append(text if text.strip() else NO_SPEECH_PLACEHOLDER)
+                print(f"✅ {i+1}번째 STT 완료: {text[:50]}...")
+            if i < len(questions_list):
+                # 인식된 단어 목록을 함께 넘겨 사전 분류/침묵 계산에서 다시 인식하지 않음
+                evaluator.submit(questions_list[i], answers[-1], audio_paths[i], words)
+        evaluator.finish(output_file)
+    finally:
+        evaluator.close()
+    return answers
+
 def extract_audio_from_video(video_path: str, output_audio_path: str = None) -> str:
     """영상 파일에서 오디오를 추출합니다 (WebM/Chrome 녹화 파일 지원)."""
     try:
@@ -194,6 +271,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def warm_up_llm():
+    """서버 시작 시 평가 모델을 미리 로드하고 평가 시스템 프롬프트를 한 번 처리 (백그라운드)"""
+    client = LLMClient(LlamaConfig(), caller="warm_up")
+    threading.Thread(target=client.warm_up, kwargs={"system": EVALUATION_SYSTEM_PROMPT}, daemon=True).start()
+
 ia_router = APIRouter(prefix="", tags=["InterviewCore"])
 pose_router = APIRouter(prefix="/pose", tags=["PoseAnalysis"])
 
@@ -270,22 +353,29 @@ async def evaluate_interview(
             for i, video_file in enumerate(video_files):
                 print(f"📹 {i+1}번째 파일 처리: {video_file.filename}")
                 
-                # 파일 저장
-                video_path = os.path.join(TMP_DIR, f"{uuid.uuid4()}_{video_file.filename}")
-                with open(video_path, "wb") as f:
-                    shutil.copyfileobj(video_file.file, f)
-                video_paths.append(video_path)
-                
-                # 오디오 추출
-                audio_path = extract_audio_from_video(video_path)
-                audio_paths.append(audio_path)
-                
-                # 포즈 분석 (옵션)
+                # 포즈 분석 (옵션): 파일 저장과 동시에 디코딩/분석 시작
+                pose_stream = None
                 if include_pose_analysis:
                     pose_log_path = os.path.join(LOG_DIR, f"{uuid.uuid4()}_pose.txt")
-                    analyze_video(video_path, pose_log_path)
-                    with open(pose_log_path, "r", encoding="utf-8") as f:
-                        pose_results.append(f.read())
+                    pose_stream = open_pose_stream(pose_log_path)
+                
+                try:
+                    # 파일 저장
+                    video_path = os.path.join(TMP_DIR, f"{uuid.uuid4()}_{video_file.filename}")
+                    save_upload(video_file, video_path, pose_stream)
+                    video_paths.append(video_path)
+                    
+                    # 오디오 추출 (포즈 분석 스트림은 백그라운드에서 계속 진행)
+                    audio_path = extract_audio_from_video(video_path)
+                    audio_paths.append(audio_path)
+                    
+                    if include_pose_analysis:
+                        pose_results.append(finish_pose_analysis(pose_stream, video_path, pose_log_path))
+                        pose_stream = None
+                finally:
+                    # 저장/오디오 추출 실패 시 디코더 프로세스와 스레드가 남지 않도록 정리
+                    if pose_stream:
+                        pose_stream.abort()
                 
                 print(f"✅ {i+1}번째 파일 처리 완료")
         
@@ -340,26 +430,11 @@ async def evaluate_interview(
         from interview_app.config import STTConfig
         stt_client = STTClient(STTConfig())
         
-        # 각 오디오 파일에서 텍스트 추출
-        answers = []
-        for i, audio_path in enumerate(audio_paths):
-            try:
-                print(f"🔍 {i+1}번째 오디오 STT 처리 중...")
-                text = stt_client.get_text(audio_path)
-                answers.append(text if text.strip() else "음성을 인식할 수 없습니다.")
-                print(f"✅ STT 완료: {text[:50]}...")
-                    
-            except Exception as e:
-                print(f"⚠️ {i+1}번째 STT 실패: {e}")
-                answers.append("음성 인식 실패")
-        
-        # 5️⃣ AI 면접 평가 수행
-        print(f"\n🧠 AI 면접 평가 시작...")
+        # 5️⃣ STT와 AI 면접 평가를 파이프라인으로 수행 (답변 i 평가 중 답변 i+1 음성 인식)
+        print(f"\n🧠 음성 인식 + AI 면접 평가 시작...")
+        answers = transcribe_and_evaluate(stt_client, questions_list, audio_paths, output_file)
         print(f"  - 인식된 답변: {len(answers)}개")
         
-        # 평가 수행 (실제 STT 결과 사용)
-        evaluate_and_save_responses(questions_list, answers, audio_paths, output_file)
-        
         # 6️⃣ 결과 파일 읽기
         with open(output_file, "r", encoding="utf-8") as f:
             evaluation_result = f.read()
@@ -400,6 +475,45 @@ async def evaluate_interview(
         except Exception as cleanup_error:
             print(f"⚠️ 파일 정리 중 오류: {cleanup_error}")
 
+# === ⚡ 단일 답변 스트리밍 평가 API ===
+@ia_router.post("/evaluate_answer/stream")
+def evaluate_answer_stream(
+    question: str = Form(...),   # 면접 질문
+    answer: str = Form(...),     # 지원자 답변 (STT 결과)
+):
+    """
+    질문 하나를 평가하며 추천 답변을 생성되는 대로 NDJSON으로 전송합니다.
+
+    각 줄은 JSON 객체입니다:
+    - {"type": "token", "text": "..."}: 추천 답변 조각 (생성 순서대로 이어 붙이면 전체 추천 답변)
+    - {"type": "result", "evaluation": {...}, "recommended_answer": "...", "total_score": n}: 최종 결과
+    """
+    def event_lines():
+        for event in stream_evaluation(question, answer):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    # 동기 제너레이터는 Starlette가 스레드풀에서 순회하므로 이벤트 루프를 막지 않음
+    return StreamingResponse(event_lines(), media_type="application/x-ndjson")
+
+# === 💡 추천 답변 (요청 시 생성) API ===
+@ia_router.post("/recommended_answer")
+def recommended_answer(
+    question: str = Form(...),   # 면접 질문
+    answer: str = Form(""),      # 지원자 답변 (있으면 답변 내용을 살려 보완)
+):
+    """
+    평가와 별도로 추천 답변을 생성합니다. 같은 질문/답변은 캐시된 결과를 바로 반환합니다.
+    """
+    return {"question": question, "recommended_answer": generate_recommended_answer(question, answer)}
+
+@ia_router.post("/recommended_answer/stream")
+def recommended_answer_stream(
+    question: str = Form(...),
+    answer: str = Form(""),
+):
+    """추천 답변을 생성되는 대로 일반 텍스트로 스트리밍합니다."""
+    return StreamingResponse(stream_recommended_answer(question, answer), media_type="text/plain; charset=utf-8")
+
 # === 🌐 URL 기반 통합 분석 API (새로 추가) ===
 @ia_router.post("/analyze_complete_url")
 async def analyze_complete_url(
@@ -468,23 +582,10 @@ async def analyze_complete_url(
         from interview_app.config import STTConfig
         stt_client = STTClient(STTConfig())
         
-        # 각 오디오 파일에서 텍스트 추출
-        answers = []
-        for i, audio_path in enumerate(audio_paths):
-            try:
-                print(f"🔍 {i+1}번째 오디오 STT 처리 중...")
-                text = stt_client.get_text(audio_path)
-                answers.append(text if text.strip() else "음성을 인식할 수 없습니다.")
-                print(f"✅ STT 완료: {text[:50]}...")
-                    
-            except Exception as e:
-                print(f"⚠️ {i+1}번째 STT 실패: {e}")
-                answers.append("음성 인식 실패")
-
-        # AI 면접 평가 수행
-        print(f"🧠 AI 면접 평가 시작...")
+        # STT와 AI 면접 평가를 파이프라인으로 수행
+        print(f"🧠 음성 인식 + AI 면접 평가 시작...")
         output_file = f"url_interview_evaluation_{uuid.uuid4().hex}.txt"
-        evaluate_and_save_responses(questions_list, answers, audio_paths, output_file)
+        transcribe_and_evaluate(stt_client, questions_list, audio_paths, output_file)
         
         # 평가 결과 읽기
         with open(output_file, "r", encoding="utf-8") as f:
@@ -523,14 +624,109 @@ async def pose_analyze(file: UploadFile = File(...)):
     vid_id = uuid.uuid4().hex
     fname  = f"{vid_id}_{file.filename}"
     vpath  = os.path.join(UPLOAD_DIR, fname)
-    with open(vpath, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    logp = os.path.join(LOG_DIR, f"{vid_id}.txt")
+    pose_stream = open_pose_stream(logp)
+    try:
+        save_upload(file, vpath, pose_stream)
+        result = finish_pose_analysis(pose_stream, vpath, logp)
+        pose_stream = None
+    except Exception as e:
+        raise HTTPException(500, f"분석 오류: {e}")
+    finally:
+        # 저장 중 실패하면 디코더 프로세스/스레드 정리
+        if pose_stream:
+            pose_stream.abort()
+    return PlainTextResponse(result, media_type="text/plain; charset=utf-8")
+
+@pose_router.post("/analyze_stream")
+async def pose_analyze_stream(request: Request):
+    """
+    요청 본문으로 영상 바이트를 그대로 받아, 수신과 동시에 포즈 분석을 수행하는 API
+    (WebM, fragmented MP4 등 스트리밍 가능한 컨테이너)
+
+    multipart 업로드는 본문 전체를 받은 뒤에 핸들러가 호출되므로,
+    업로드 시간과 분석 시간을 겹치려면 이 엔드포인트로 본문을 스트리밍해서 보냅니다.
+    """
+    vid_id = uuid.uuid4().hex
     logp = os.path.join(LOG_DIR, f"{vid_id}.txt")
     try:
-        analyze_video(vpath, logp)
+        pose_stream = PoseStreamAnalyzer(logp)
     except Exception as e:
         raise HTTPException(500, f"분석 오류: {e}")
-    return PlainTextResponse(open(logp, "r", encoding="utf-8").read(), media_type="text/plain; charset=utf-8")
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(pose_stream.feed, chunk)
+        await run_in_threadpool(pose_stream.finish)
+        with open(logp, "r", encoding="utf-8") as f:
+            result = f.read()
+    except Exception as e:
+        # 연결이 끊겨도 디코더 프로세스는 정리
+        try:
+            await run_in_threadpool(pose_stream.finish)
+        except Exception:
+            pass
+        raise HTTPException(500, f"분석 오류: {e}")
+    return PlainTextResponse(result, media_type="text/plain; charset=utf-8")
+
+@pose_router.websocket("/live")
+async def pose_live(websocket: WebSocket, fps: float = 5.0):
+    """
+    면접 중 실시간 포즈 피드백 WebSocket
+
+    - 클라이언트: 축소한 JPEG 프레임을 바이너리 메시지로 초당 몇 장(fps 쿼리 파라미터)씩 전송
+    - 서버: 프레임마다 {"type": "frame", "mistakes", "gaze", "summary", ...} 응답
+    - 클라이언트가 텍스트 "end"를 보내면 최종 리포트({"type": "report"})를 보내고 종료
+    - 연결이 끊겨도 리포트는 저장되며 GET /pose/live/{session_id}로 조회 가능
+    """
+    await websocket.accept()
+    # fps는 타임스탬프/초 환산의 분모이므로 0 이하나 비정상적으로 큰 값은 세션 생성 전에 거절
+    if not 0 < fps <= LIVE_POSE_MAX_FPS:
+        await websocket.send_json({
+            "type": "error", "message": f"fps는 0보다 크고 {LIVE_POSE_MAX_FPS:g} 이하여야 합니다: {fps}",
+        })
+        await websocket.close(code=1008)
+        return
+    session_id = uuid.uuid4().hex
+    session = LivePoseSession(fps)
+    await websocket.send_json({"type": "session", "session_id": session_id})
+
+    def save_report() -> str:
+        report = session.report_text()
+        with open(os.path.join(LOG_DIR, f"{session_id}_live_pose.txt"), "w", encoding="utf-8") as f:
+            f.write(report)
+        return report
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                save_report()
+                break
+            if message.get("bytes") is not None:
+                try:
+                    feedback = await run_in_threadpool(session.process_jpeg, message["bytes"])
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "message": str(e)})
+                    continue
+                await websocket.send_json({"type": "frame", **feedback})
+            elif (message.get("text") or "").strip() == "end":
+                report = save_report()
+                await websocket.send_json({"type": "report", "session_id": session_id, "report": report})
+                await websocket.close()
+                break
+    except WebSocketDisconnect:
+        save_report()
+    finally:
+        session.close()
+
+@pose_router.get("/live/{session_id}")
+async def pose_live_report(session_id: str):
+    """실시간 포즈 세션의 최종 리포트 조회"""
+    logp = os.path.join(LOG_DIR, f"{os.path.basename(session_id)}_live_pose.txt")
+    if not os.path.exists(logp):
+        raise HTTPException(404, "해당 세션의 포즈 리포트가 없습니다.")
+    with open(logp, "r", encoding="utf-8") as f:
+        return PlainTextResponse(f.read(), media_type="text/plain; charset=utf-8")
 
 # === 라우터 등록 ===
 app.include_router(ia_router)